@@ -0,0 +1,280 @@
+"""
+Adaptive Batch Planner
+Sizes FullEnrich submissions (enrich_linkedin.py) and WhiteContext domain files
+(split_domains.py) from how long batches actually take, instead of a fixed count.
+
+Each workload has a latency history in T2/batch_latency.json: (items, seconds) per
+finished batch. A least-squares fit gives a fixed per-batch overhead plus a per-item
+cost; with too little history the workload defaults below are used.
+
+The plan then:
+1. sizes batches so one finishes in about target_seconds (clamped to min/max batch size)
+2. uses at least max_concurrency batches when there are enough items, so no worker idles
+3. rounds the batch count up to whole waves of max_concurrency, so the last wave is not
+   a single straggler
+4. splits items evenly (sizes differ by at most one)
+
+Usage:
+    python batch_planner.py plan whitecontext --items 12000
+    python batch_planner.py record whitecontext --items 1200 --seconds 5400
+    python batch_planner.py learn-whitecontext   # ingest analyzed_at spans from WhiteContext exports
+                                                 # (one sample per file, however often it runs)
+"""
+
+import argparse
+import math
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import json_backend
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_HISTORY_FILE = SCRIPT_DIR / "T2" / "batch_latency.json"
+WHITECONTEXT_DIR = SCRIPT_DIR / "whitecontext"
+
+HISTORY_SIZE = 50  # Most recent batches kept per workload
+
+FULLENRICH = "fullenrich"
+WHITECONTEXT = "whitecontext"
+
+
+@dataclass
+class WorkloadDefaults:
+    """Planner limits and prior latency for one kind of batch"""
+    target_seconds: float
+    max_concurrency: int
+    min_batch: int
+    max_batch: int
+    overhead_seconds: float
+    per_item_seconds: float
+
+
+WORKLOADS: Dict[str, WorkloadDefaults] = {
+    # Bulk endpoint takes up to 100 contacts; ~10 enrichments in flight at once
+    FULLENRICH: WorkloadDefaults(
+        target_seconds=5 * 60, max_concurrency=10, min_batch=10, max_batch=100,
+        overhead_seconds=30, per_item_seconds=2.0,
+    ),
+    # Domain files are uploaded to the WhiteContext web app, 10 running side by side
+    WHITECONTEXT: WorkloadDefaults(
+        target_seconds=60 * 60, max_concurrency=10, min_batch=20, max_batch=5000,
+        overhead_seconds=60, per_item_seconds=4.0,
+    ),
+}
+
+
+@dataclass
+class BatchPlan:
+    """How to split one workload"""
+    total_items: int
+    num_batches: int
+    batch_size: int  # Largest batch
+    est_batch_seconds: float
+    est_total_seconds: float
+    overhead_seconds: float
+    per_item_seconds: float
+    from_history: bool
+
+    def describe(self) -> str:
+        source = "observed latency" if self.from_history else "default latency"
+        return (f"{self.num_batches} batches of ≤{self.batch_size} items "
+                f"(~{self.est_batch_seconds / 60:.1f} min each, ~{self.est_total_seconds / 60:.1f} min total; "
+                f"{source}: {self.overhead_seconds:.1f}s + {self.per_item_seconds:.2f}s/item)")
+
+
+# ============================================================================
+# LATENCY HISTORY
+# ============================================================================
+
+class LatencyHistory:
+    """Per-workload (items, seconds) samples persisted as JSON"""
+
+    def __init__(self, path: Path = DEFAULT_HISTORY_FILE):
+        self.path = Path(path)
+        self.samples: Dict[str, List[Dict]] = {}
+        if self.path.exists():
+            self.samples = json_backend.load(self.path)
+
+    def record(self, workload: str, items: int, seconds: float, save: bool = True, source: Optional[str] = None):
+        """Add one finished batch; a sample from an already recorded source replaces the old one"""
+        if items <= 0 or seconds <= 0:
+            return
+        samples = self.samples.setdefault(workload, [])
+        sample = {"items": items, "seconds": round(seconds, 3), "at": datetime.now().isoformat(timespec="seconds")}
+        if source is not None:
+            samples[:] = [old for old in samples if old.get("source") != source]
+            sample["source"] = source
+        samples.append(sample)
+        del samples[:-HISTORY_SIZE]
+        if save:
+            self.save()
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        json_backend.dump(self.samples, tmp)
+        os.replace(tmp, self.path)
+
+    def estimate(self, workload: str) -> Optional[Tuple[float, float]]:
+        """(overhead seconds, seconds per item) fitted to history, or None without usable samples"""
+        samples = self.samples.get(workload, [])
+        if not samples:
+            return None
+        return fit_latency([(s["items"], s["seconds"]) for s in samples])
+
+
+def fit_latency(samples: Sequence[Tuple[int, float]]) -> Tuple[float, float]:
+    """
+    Least-squares fit of seconds = overhead + per_item * items.
+    With a single batch size the whole time is attributed to items (no overhead).
+    """
+    n = len(samples)
+    mean_items = sum(items for items, _ in samples) / n
+    mean_seconds = sum(seconds for _, seconds in samples) / n
+    var_items = sum((items - mean_items) ** 2 for items, _ in samples)
+
+    if var_items > 0:
+        per_item = sum((items - mean_items) * (seconds - mean_seconds) for items, seconds in samples) / var_items
+        overhead = mean_seconds - per_item * mean_items
+        if per_item > 0 and overhead >= 0:
+            return overhead, per_item
+
+    # Degenerate fit (one size, or noise gave a negative term): time per item, no overhead
+    return 0.0, sum(seconds for _, seconds in samples) / sum(items for items, _ in samples)
+
+
+# ============================================================================
+# PLANNING
+# ============================================================================
+
+def plan_batches(total_items: int, workload: str,
+                 history: Optional[LatencyHistory] = None,
+                 target_seconds: Optional[float] = None,
+                 max_concurrency: Optional[int] = None) -> BatchPlan:
+    """Choose a batch count for total_items of a workload (see module docstring)"""
+    defaults = WORKLOADS[workload]
+    target_seconds = target_seconds or defaults.target_seconds
+    max_concurrency = max(1, max_concurrency or defaults.max_concurrency)
+
+    fitted = history.estimate(workload) if history else None
+    overhead, per_item = fitted or (defaults.overhead_seconds, defaults.per_item_seconds)
+
+    if total_items <= 0:
+        return BatchPlan(0, 0, 0, 0.0, 0.0, overhead, per_item, fitted is not None)
+
+    # 1. Size for the target duration
+    size = int((target_seconds - overhead) / per_item) if target_seconds > overhead else defaults.min_batch
+    size = min(max(size, defaults.min_batch), defaults.max_batch)
+    num_batches = math.ceil(total_items / size)
+
+    # 2. Keep every worker busy when there is enough work
+    num_batches = max(num_batches, min(max_concurrency, total_items // defaults.min_batch or 1))
+
+    # 3. Whole waves only, as long as batches stay above the minimum size
+    if num_batches > max_concurrency:
+        whole_waves = math.ceil(num_batches / max_concurrency) * max_concurrency
+        if total_items // whole_waves >= defaults.min_batch:
+            num_batches = whole_waves
+
+    batch_size = math.ceil(total_items / num_batches)
+    est_batch = overhead + per_item * batch_size
+    waves = math.ceil(num_batches / max_concurrency)
+
+    return BatchPlan(
+        total_items=total_items,
+        num_batches=num_batches,
+        batch_size=batch_size,
+        est_batch_seconds=est_batch,
+        est_total_seconds=est_batch * waves,
+        overhead_seconds=overhead,
+        per_item_seconds=per_item,
+        from_history=fitted is not None,
+    )
+
+
+def split_evenly(items: Sequence, num_batches: int) -> List[List]:
+    """Split items into num_batches contiguous batches whose sizes differ by at most one"""
+    num_batches = max(1, min(num_batches, len(items)))
+    base, extra = divmod(len(items), num_batches)
+    batches = []
+    start = 0
+    for i in range(num_batches):
+        end = start + base + (1 if i < extra else 0)
+        batches.append(list(items[start:end]))
+        start = end
+    return batches
+
+
+# ============================================================================
+# WHITECONTEXT HISTORY
+# ============================================================================
+
+def whitecontext_batch_latency(wc_file: Path) -> Optional[Tuple[int, float]]:
+    """(results, seconds) for one WhiteContext export, from the spread of its analyzed_at times"""
+    results = json_backend.load(wc_file).get("results", [])
+
+    timestamps = []
+    for result in results:
+        try:
+            timestamps.append(datetime.fromisoformat(result["analyzed_at"]))
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    if len(timestamps) < 2:
+        return None
+    seconds = (max(timestamps) - min(timestamps)).total_seconds()
+    return (len(results), seconds) if seconds > 0 else None
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan batch sizes from observed latency")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY_FILE, help="Latency history (default: %(default)s)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    plan_parser = subparsers.add_parser("plan", help="Print the plan for a number of items")
+    plan_parser.add_argument("workload", choices=sorted(WORKLOADS))
+    plan_parser.add_argument("--items", type=int, required=True)
+    plan_parser.add_argument("--target-minutes", type=float, help="Target duration of one batch")
+    plan_parser.add_argument("--max-concurrency", type=int, help="Batches processed at the same time")
+
+    record_parser = subparsers.add_parser("record", help="Record one finished batch")
+    record_parser.add_argument("workload", choices=sorted(WORKLOADS))
+    record_parser.add_argument("--items", type=int, required=True)
+    record_parser.add_argument("--seconds", type=float, required=True)
+
+    learn_parser = subparsers.add_parser("learn-whitecontext", help="Record latency of WhiteContext export files")
+    learn_parser.add_argument("--dir", type=Path, default=WHITECONTEXT_DIR)
+
+    args = parser.parse_args()
+    history = LatencyHistory(args.history)
+
+    if args.command == "plan":
+        target = args.target_minutes * 60 if args.target_minutes else None
+        plan = plan_batches(args.items, args.workload, history, target, args.max_concurrency)
+        print(plan.describe())
+
+    elif args.command == "record":
+        history.record(args.workload, args.items, args.seconds)
+        print(f"Recorded {args.workload}: {args.items} items in {args.seconds:.0f}s")
+
+    elif args.command == "learn-whitecontext":
+        learned = 0
+        for wc_file in sorted(args.dir.glob("*.json")):
+            latency = whitecontext_batch_latency(wc_file)
+            if latency:
+                history.record(WHITECONTEXT, *latency, save=False, source=wc_file.name)
+                learned += 1
+                print(f"  {wc_file.name}: {latency[0]} domains in {latency[1] / 60:.1f} min")
+        history.save()
+        print(f"Recorded {learned} WhiteContext batches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Async FullEnrich Client Benchmark
+Runs AsyncFullEnrichClient against the in-process fake API (fake_fullenrich.py)
+and compares wall time with the slowest batch and with the old schedule
+(fixed delay between submissions, then fixed-interval poll rounds over every batch).
+
+Durations are scaled down so a run takes seconds; --submission-delay and
+--poll-interval describe the old schedule on the same scale.
+
+Usage:
+    python benchmarks/bench_enrich_client.py --batches 50 --contacts 2000
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import sys
+import time
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(DATA_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_fullenrich import FakeFullEnrich, start_fake_server
+from fullenrich_client import AsyncFullEnrichClient
+
+
+def make_batches(num_contacts: int, num_batches: int) -> list:
+    contacts = [
+        {"firstname": "Guest", "lastname": str(i), "linkedin_url": f"https://linkedin.com/in/guest{i}",
+         "custom": {"username": f"guest{i}"}, "enrich_fields": ["contact.emails"]}
+        for i in range(num_contacts)
+    ]
+    batch_size = (num_contacts + num_batches - 1) // num_batches
+    return [contacts[i:i + batch_size] for i in range(0, num_contacts, batch_size)]
+
+
+async def run(args) -> dict:
+    fake = FakeFullEnrich(args.min_duration, args.max_duration, args.rate_limit, args.http_429)
+    runner, base_url = await start_fake_server(fake)
+    batches = make_batches(args.contacts, args.batches)
+
+    try:
+        start = time.perf_counter()
+        finished = enriched = 0
+        async with AsyncFullEnrichClient("fake-key", base_url=base_url,
+                                         poll_interval=args.poll_interval / 4,
+                                         max_poll_interval=args.poll_interval) as client:
+            async for _, _, _, results in client.enrich_batches(batches, "benchmark"):
+                if results is not None:
+                    finished += 1
+                    enriched += len(results["datas"])
+        elapsed = time.perf_counter() - start
+    finally:
+        await runner.cleanup()
+
+    # Old schedule: sleep between every submission, then poll rounds until the slowest batch is done
+    slowest_duration = args.max_duration
+    old_schedule = (len(batches) - 1) * args.submission_delay + math.ceil(slowest_duration / args.poll_interval) * args.poll_interval
+
+    return {
+        "batches": len(batches),
+        "finished": finished,
+        "enriched": enriched,
+        "elapsed": elapsed,
+        "slowest_duration": slowest_duration,
+        "old_schedule": old_schedule,
+        **fake.counters,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the async FullEnrich client against a local fake API")
+    parser.add_argument("--batches", type=int, default=50)
+    parser.add_argument("--contacts", type=int, default=2000)
+    parser.add_argument("--min-duration", type=float, default=0.5, help="Fastest fake enrichment (seconds)")
+    parser.add_argument("--max-duration", type=float, default=3.0, help="Slowest fake enrichment (seconds)")
+    parser.add_argument("--rate-limit", type=float, default=0.05)
+    parser.add_argument("--http-429", type=float, default=0.05)
+    parser.add_argument("--submission-delay", type=float, default=0.5, help="Old fixed delay between submissions (scaled)")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Old fixed poll interval (scaled)")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    result = asyncio.run(run(args))
+
+    print(f"Batches: {result['batches']} ({args.contacts} contacts), fake durations {args.min_duration}-{args.max_duration}s")
+    print(f"  finished:           {result['finished']}/{result['batches']} ({result['enriched']} contacts)")
+    print(f"  async wall time:    {result['elapsed']:6.2f} s")
+    print(f"  slowest batch:     ≤{result['slowest_duration']:6.2f} s (+ submission and final poll)")
+    print(f"  old fixed schedule: {result['old_schedule']:6.2f} s (estimated)")
+    print(f"  requests: {result['submits']} submits, {result['polls']} polls "
+          f"({result['rate_limit_status']} RATE_LIMIT, {result['http_429']} HTTP 429)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Company Entity Resolution Benchmark
+Builds a CompanyResolver over synthetic WhiteContext companies and resolves
+perturbed FullEnrich companies against it, timing each lookup.
+
+Resolvable queries (should match their company):
+- same name on another suffix (acme.com -> acme.io) or subdomain (app.acme.com)
+- legal suffixes and punctuation added to the name ("Acme, Inc.")
+- renamed company on an unrelated domain that keeps its LinkedIn page
+
+Unresolvable queries (should not match anything):
+- an unrelated company whose domain shares a brand (delta.io "Zebra Robotics" vs delta.com)
+- a shared brand and no company name
+- a shared brand whose name only starts the same ("Linear Capital" vs linear.app "Linear")
+
+Exits with status 1 on any wrong match, or when a resolvable query is missed.
+
+Usage:
+    python benchmarks/bench_entity_resolver.py --companies 20000 --queries 5000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(DATA_DIR))
+
+from entity_resolver import CompanyResolver
+
+SYLLABLES = ["ka", "lo", "mi", "ra", "ven", "tor", "zen", "qua", "bri", "dex", "nor", "sul", "fa", "gri", "mo", "pex"]
+WORDS = ["Robotics", "Labs", "Analytics", "Health", "Systems", "Networks", "Capital", "Foods", "Energy", "Studio"]
+SUFFIXES = ["Inc.", ", Inc", "LLC", "Ltd", "GmbH", "Corp."]
+
+# (WhiteContext domain, company name, query domains, query name) pairs that must not match
+NEGATIVE_CASES = [
+    ("delta.com", "Delta Air Lines", ["delta.io"], "Zebra Robotics"),
+    ("delta.com", "Delta Air Lines", ["delta.io"], None),
+    ("linear.app", "Linear", ["linear.com"], "Linear Capital"),
+]
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def make_companies(count: int, rng: random.Random) -> dict:
+    """WhiteContext results by domain: unique brand, "<Brand> <Word>" names, a LinkedIn page"""
+    companies = {}
+    while len(companies) < count:
+        brand = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        domain = f"{brand}.com"
+        if domain not in companies:
+            companies[domain] = {
+                "company_name": f"{brand.title()} {rng.choice(WORDS)}",
+                "linkedin_url": f"https://www.linkedin.com/company/{brand}-{len(companies)}",
+            }
+    return companies
+
+
+def make_queries(companies: dict, count: int, rng: random.Random) -> list:
+    """(domains, linkedin keys, name, expected domain or None) lookups"""
+    domains = list(companies)
+    queries = []
+    for i in range(count):
+        domain = rng.choice(domains)
+        result = companies[domain]
+        brand = domain.split(".")[0]
+        name = result["company_name"]
+        style = i % 5
+        if style == 0:
+            queries.append(([f"{brand}.io"], set(), name, domain))
+        elif style == 1:
+            queries.append(([f"app.{domain}"], set(), name, domain))
+        elif style == 2:
+            queries.append(([f"{brand}.ai"], set(), f"{name} {rng.choice(SUFFIXES)}", domain))
+        elif style == 3:
+            slug = result["linkedin_url"].rsplit("/", 1)[1]
+            queries.append(([f"renamed{i}.io"], {slug}, f"Renamed {i}", domain))
+        else:
+            other = rng.choice(WORDS[:5]) if not name.endswith(tuple(WORDS[:5])) else rng.choice(WORDS[5:])
+            queries.append(([f"{brand}.io"], set(), f"Zzyx {other}", None))
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark and check company entity resolution")
+    parser.add_argument("--companies", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(13)
+    companies = make_companies(args.companies, rng)
+
+    start = time.perf_counter()
+    resolver = CompanyResolver(companies)
+    build_time = time.perf_counter() - start
+    print(f"Companies: {len(resolver):,}, index build {build_time:.2f}s")
+
+    queries = make_queries(companies, args.queries, rng)
+    samples, wrong, missed = [], 0, 0
+    for domains, linkedin_keys, name, expected in queries:
+        start = time.perf_counter()
+        match = resolver.resolve(domains, linkedin_keys, name)
+        samples.append(time.perf_counter() - start)
+        if match is not None and match.domain != expected:
+            wrong += 1
+        elif match is None and expected is not None:
+            missed += 1
+
+    for wc_domain, wc_name, domains, name in NEGATIVE_CASES:
+        match = CompanyResolver({wc_domain: {"company_name": wc_name}}).resolve(domains, set(), name)
+        if match is not None:
+            print(f"  ✗ {name!r} at {domains[0]} matched {wc_domain} ({match.method}, {match.confidence:.2f})")
+            wrong += 1
+
+    print(f"  {len(queries):,} lookups: p50 {percentile(samples, 50) * 1000:.3f} ms | "
+          f"p99 {percentile(samples, 99) * 1000:.3f} ms | mean {statistics.mean(samples) * 1000:.3f} ms")
+    print(f"  wrong matches: {wrong} {'✓' if wrong == 0 else '✗'}, missed matches: {missed} {'✓' if missed == 0 else '✗'}")
+    sys.exit(0 if wrong == 0 and missed == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
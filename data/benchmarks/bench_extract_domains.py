@@ -0,0 +1,112 @@
+"""
+Domain Extraction Benchmark
+Writes a synthetic enriched CSV (same columns as cerebralvalley_hackathon_enriched.csv)
+and compares the chunked, vectorized extract_domains.py against the previous
+row-by-row implementation: wall time, traced peak memory and identical output.
+
+Usage:
+    python benchmarks/bench_extract_domains.py --rows 1000000
+"""
+
+import argparse
+import csv
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+DATA_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(DATA_DIR))
+
+from domain_normalizer import clean_host
+from extract_domains import extract_unique_domains
+from synthetic_data import INDUSTRIES, company_domain
+
+
+def write_synthetic_csv(path: Path, rows: int, companies: int, seed: int = 42):
+    """Enriched-profile CSV with messy website/email values"""
+    rng = random.Random(seed)
+    website_forms = ["https://www.{d}/", "http://{d}?utm_source=linkedin", "{d}/about", "HTTPS://WWW.{d}", "www.{d}#team"]
+
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            "username", "email", "email_status", "domain", "full_name", "headline", "summary",
+            "company_name", "company_website", "company_domain", "company_industry"
+        ])
+        for i in range(rows):
+            domain = company_domain(rng.randrange(companies))
+            writer.writerow([
+                f"guest{i:07d}",
+                f"guest{i}@{domain.upper() if rng.random() < 0.1 else domain}" if rng.random() < 0.7 else "",
+                "DELIVERABLE",
+                domain if rng.random() < 0.6 else "",
+                f"Guest {i}",
+                "Founder building things",
+                "Lorem ipsum " * 10,
+                f"Company {i % companies}",
+                rng.choice(website_forms).format(d=domain) if rng.random() < 0.8 else "",
+                f" {domain} " if rng.random() < 0.5 else "",
+                rng.choice(INDUSTRIES)
+            ])
+
+
+def legacy_extract(csv_path: Path) -> list:
+    """Previous implementation: full read_csv, .apply for emails, Python loop for websites"""
+    def extract_domain_from_email(email):
+        if pd.isna(email) or not email:
+            return None
+        if '@' in email:
+            return email.split('@')[1].strip().lower()
+        return None
+
+    df = pd.read_csv(csv_path)
+    domains = set()
+    domains.update(df['company_domain'].dropna().str.strip().str.lower().tolist())
+    domains.update(df['domain'].dropna().str.strip().str.lower().tolist())
+    domains.update(df['email'].apply(extract_domain_from_email).dropna().tolist())
+    for url in df['company_website'].dropna():
+        if pd.notna(url) and isinstance(url, str):
+            domain = clean_host(url)
+            if domain:
+                domains.add(domain)
+    domains = {d for d in domains if d and '.' in d and len(d) > 3}
+    return sorted(domains)
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark extract_domains.py")
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--companies", type=int, default=50000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "enriched.csv"
+        write_synthetic_csv(csv_path, args.rows, args.companies)
+        print(f"Rows: {args.rows}, CSV size: {csv_path.stat().st_size / 1024 / 1024:.1f} MB")
+
+        legacy, legacy_time, legacy_peak = measure(legacy_extract, csv_path)
+        (current, _, _), current_time, current_peak = measure(extract_unique_domains, csv_path)
+
+        print(f"  row-by-row:  {legacy_time:7.2f} s, peak traced memory {legacy_peak:8.1f} MB")
+        print(f"  vectorized:  {current_time:7.2f} s, peak traced memory {current_peak:8.1f} MB")
+        print(f"  speedup: {legacy_time / current_time:.1f}x")
+        print(f"  identical output: {'✓ Yes' if legacy == current else '✗ No'} ({len(current)} domains)")
+
+
+if __name__ == "__main__":
+    main()
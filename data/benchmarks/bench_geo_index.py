@@ -0,0 +1,164 @@
+"""
+Geospatial Index Benchmark
+Geocodes synthetic LinkedIn-style locations ("City, Region, Country", "Greater City Area",
+bare countries) with the bundled gazetteer, indexes the attendees and a set of venues
+scattered around gazetteer cities, and times the two scheduler queries:
+
+- attendees within --radius km of a random attendee (usernames, nearest first)
+- the k venues nearest to the midpoint of two random attendees
+
+Every 100th query is checked against a brute-force scan, and a few tricky locations
+must geocode to their city: letters NFKD does not decompose (Wrocław, Łódź, København),
+US states named like countries (Atlanta, Georgia) and hyphenated names (Winston-Salem).
+Exits with status 1 on a mismatch or when a p99 is above --target-ms.
+
+Usage:
+    python benchmarks/bench_geo_index.py --guests 100000 --venues 50000 --queries 5000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(DATA_DIR))
+
+from geo_index import Gazetteer, attendee_index, haversine_km, midpoint, venue_index
+
+# LinkedIn location -> the gazetteer city it should resolve to
+GEOCODE_CASES = [
+    ("Wrocław, Dolnośląskie, Poland", "wroclaw"),
+    ("Łódź, Łódzkie, Poland", "lodz"),
+    ("Kraków Metropolitan Area", "krakow"),
+    ("København, Capital Region of Denmark, Denmark", "kobenhavn"),
+    ("Düsseldorf, North Rhine-Westphalia, Germany", "dusseldorf"),
+    ("Zürich, Switzerland", "zurich"),
+    ("Atlanta, Georgia", "atlanta"),  # US state named like a country
+    ("Tbilisi, Georgia", "tbilisi"),
+    ("Aix-en-Provence, France", "aix-en-provence"),  # Hyphenated names
+    ("Winston-Salem, North Carolina", "winston-salem"),
+]
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def make_locations(gazetteer: Gazetteer, count: int, rng: random.Random) -> list:
+    """Free-text locations in the shapes LinkedIn uses, plus some unknown ones"""
+    cities = [(name, points[0]) for name, points in gazetteer.places["city"].items()]
+    countries = {point.country_code: name for name, points in gazetteer.places["country"].items() for point in points}
+    locations = []
+    for _ in range(count):
+        name, point = rng.choice(cities)
+        style = rng.random()
+        if style < 0.6:
+            locations.append(f"{name.title()}, {countries.get(point.country_code, '').title()}")
+        elif style < 0.8:
+            locations.append(f"Greater {name.title()} Area")
+        elif style < 0.95:
+            locations.append(countries.get(point.country_code, "").title())
+        else:
+            locations.append("Remote")
+    return locations
+
+
+def make_venues(gazetteer: Gazetteer, count: int, rng: random.Random) -> list:
+    """Venues within ~20 km of random gazetteer cities"""
+    cities = [points[0] for points in gazetteer.places["city"].values()]
+    venues = []
+    for i in range(count):
+        city = rng.choice(cities)
+        venues.append({"name": f"Venue {i}", "lat": city.latitude + rng.uniform(-0.2, 0.2),
+                       "lng": city.longitude + rng.uniform(-0.2, 0.2)})
+    return venues
+
+
+def check_geocoding(gazetteer: Gazetteer) -> int:
+    """GEOCODE_CASES that do not resolve to their city"""
+    wrong = 0
+    for location, city in GEOCODE_CASES:
+        point = gazetteer.geocode(location)
+        expected = gazetteer.places["city"][city][0]
+        if point != expected:
+            print(f"  ✗ {location!r} geocoded to {point}, expected {city}")
+            wrong += 1
+    return wrong
+
+
+def report(label: str, samples: list, target_ms: float) -> bool:
+    p99 = percentile(samples, 99) * 1000
+    print(f"  {label:<24} p50 {percentile(samples, 50) * 1000:6.3f} ms | p99 {p99:6.3f} ms | "
+          f"mean {statistics.mean(samples) * 1000:6.3f} ms  {'✓' if p99 <= target_ms else '✗'}")
+    return p99 <= target_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline geocoding and proximity queries")
+    parser.add_argument("--guests", type=int, default=100000)
+    parser.add_argument("--venues", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--radius", type=float, default=25.0, help="Attendee search radius in km")
+    parser.add_argument("-k", type=int, default=5, help="Venues per midpoint query")
+    parser.add_argument("--target-ms", type=float, default=1.0, help="p99 latency target")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    gazetteer = Gazetteer()
+    wrong = check_geocoding(gazetteer)
+    locations = make_locations(gazetteer, args.guests, rng)
+
+    start = time.perf_counter()
+    geo = {}
+    for i, location in enumerate(locations):
+        point = gazetteer.geocode(location)
+        if point:
+            geo[f"guest{i}"] = [point.latitude, point.longitude, point.precision]
+    geocode_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    attendees = attendee_index(geo)
+    venues_list = make_venues(gazetteer, args.venues, rng)
+    venues = venue_index(venues_list)
+    build_time = time.perf_counter() - start
+
+    print(f"Guests: {args.guests:,} ({len(geo):,} geocoded in {geocode_time:.2f}s, "
+          f"{len(attendees.keys):,} distinct places), venues: {len(venues):,}, index build {build_time:.2f}s")
+
+    usernames = list(geo)
+    within_samples, nearest_samples, found = [], [], 0
+    for _ in range(args.queries):
+        a, b = rng.choice(usernames), rng.choice(usernames)
+
+        start = time.perf_counter()
+        nearby = attendees.within(*geo[a][:2], args.radius)
+        within_samples.append(time.perf_counter() - start)
+        found += len(nearby)
+
+        start = time.perf_counter()
+        center = midpoint(*geo[a][:2], *geo[b][:2])
+        nearest = venues.nearest(*center, args.k)
+        nearest_samples.append(time.perf_counter() - start)
+
+        # Brute-force checks on a sample of the queries
+        if len(within_samples) % 100 == 0:
+            expected = sum(
+                len(keys) for lat, lng, keys in zip(attendees.latitudes, attendees.longitudes, attendees.keys)
+                if haversine_km(*geo[a][:2], lat, lng) <= args.radius
+            )
+            distances = sorted(haversine_km(*center, venue["lat"], venue["lng"]) for venue in venues_list)[:args.k]
+            wrong += expected != len(nearby) or any(abs(d - e) > 1e-6 for (_, d), e in zip(nearest, distances))
+
+    print(f"  {args.queries:,} queries, {found / args.queries:,.0f} attendees within {args.radius:g} km on average, "
+          f"brute-force and geocoding mismatches: {wrong}")
+    ok = report(f"attendees within {args.radius:g} km", within_samples, args.target_ms)
+    ok = report(f"{args.k} venues near midpoint", nearest_samples, args.target_ms) and ok
+    sys.exit(0 if ok and not wrong else 1)
+
+
+if __name__ == "__main__":
+    main()
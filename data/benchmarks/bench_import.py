@@ -0,0 +1,82 @@
+"""
+Import Cost Benchmark
+Imports pipeline modules in fresh interpreters (as short-lived workers do) and reports
+the import time python -X importtime attributes to each, plus the heaviest
+dependencies they pull in. Also checks that importing unify_data has no side effects:
+no output, no unification.log, no logging handlers.
+
+Bytecode caches are written before timing, so the numbers match repeated worker starts.
+
+Usage:
+    python benchmarks/bench_import.py --runs 20
+    python benchmarks/bench_import.py --modules unify_data match_engine --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent.parent
+
+SIDE_EFFECT_CHECK = (
+    "import logging, unify_data; "
+    "assert not logging.getLogger().handlers, 'logging configured at import'"
+)
+
+
+def import_times(module: str, env: dict, cwd: Path) -> dict:
+    """Cumulative microseconds per imported module for one fresh `import module`"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        times.setdefault(name, int(cumulative))  # First (outermost) import of a name
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the import cost of pipeline modules")
+    parser.add_argument("--modules", nargs="+", default=["unify_data"])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10, help="Heaviest dependencies to list")
+    args = parser.parse_args()
+
+    env = {**os.environ, "PYTHONPATH": str(DATA_DIR), "PYTHONDONTWRITEBYTECODE": ""}
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = Path(tmp)  # Any unification.log written at import would land here
+
+        check = subprocess.run([sys.executable, "-c", SIDE_EFFECT_CHECK], cwd=cwd, env=env, capture_output=True, text=True)
+        clean = check.returncode == 0 and not check.stdout and not check.stderr and not any(cwd.iterdir())
+        print(f"Import side effects: {'none ✓' if clean else '✗'}")
+        if not clean:
+            print(check.stdout + check.stderr + "".join(f"  wrote {path.name}\n" for path in cwd.iterdir()))
+
+        for module in args.modules:
+            import_times(module, env, cwd)  # Write bytecode caches
+            runs = [import_times(module, env, cwd) for _ in range(args.runs)]
+            totals = [run[module] / 1000 for run in runs]
+            print(f"\n{module}: median {statistics.median(totals):.1f} ms, "
+                  f"min {min(totals):.1f} ms, max {max(totals):.1f} ms ({args.runs} runs)")
+
+            dependencies = {
+                name: statistics.median(run.get(name, 0) for run in runs) / 1000
+                for name in runs[0] if name != module and not name.startswith("_")
+            }
+            for name, ms in sorted(dependencies.items(), key=lambda item: -item[1])[:args.top]:
+                print(f"  {ms:6.1f} ms  {name}")
+
+    sys.exit(0 if clean else 1)
+
+
+if __name__ == "__main__":
+    main()
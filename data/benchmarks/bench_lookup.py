@@ -0,0 +1,77 @@
+"""
+Profile Lookup Latency Benchmark
+Unifies a synthetic dataset, then measures single-profile reads through the
+mmap'd index (profile_index.py) against a full json.load of unified_guests_all.json.
+
+Usage:
+    python benchmarks/bench_lookup.py --guests 100000 --lookups 20000
+"""
+
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(DATA_DIR))
+
+from synthetic_data import generate_dataset, use_dataset
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark indexed profile lookups")
+    parser.add_argument("--guests", type=int, default=50000)
+    parser.add_argument("--lookups", type=int, default=10000)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    import unify_data
+    from profile_index import ProfileIndex
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work = Path(tmp)
+        generate_dataset(work, args.guests)
+
+        use_dataset(unify_data, work)
+        unify_data.main(["--stream"])
+
+        rng = random.Random(7)
+        usernames = [f"guest{rng.randrange(args.guests):07d}" for _ in range(args.lookups)]
+
+        start = time.perf_counter()
+        with open(unify_data.OUTPUT_ALL, 'r') as f:
+            json.load(f)
+        full_load = time.perf_counter() - start
+
+        with ProfileIndex(unify_data.OUTPUT_ALL, unify_data.OUTPUT_INDEX) as index:
+            start = time.perf_counter()
+            opened = ProfileIndex(unify_data.OUTPUT_ALL, unify_data.OUTPUT_INDEX)
+            open_time = time.perf_counter() - start
+            opened.close()
+
+            samples = []
+            for username in usernames:
+                start = time.perf_counter()
+                index.get(username)
+                samples.append(time.perf_counter() - start)
+
+        print(f"Guests: {args.guests}, lookups: {args.lookups}")
+        print(f"  json.load of unified_guests_all.json: {full_load * 1000:.1f} ms")
+        print(f"  ProfileIndex open: {open_time * 1000:.3f} ms")
+        print(f"  get() p50: {percentile(samples, 50) * 1e6:.1f} µs")
+        print(f"  get() p99: {percentile(samples, 99) * 1e6:.1f} µs")
+        print(f"  get() mean: {statistics.mean(samples) * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
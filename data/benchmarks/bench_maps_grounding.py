@@ -0,0 +1,154 @@
+"""
+Maps Grounding Runner Benchmark
+Runs maps_grounding.MapsGroundingRunner against a stub Gemini client (fixed latency,
+a fraction of failing calls) on meeting spot requests for matched pairs around a few
+event locations, and compares it with the one-request-at-a-time loop of the maps
+snippets (every request sent, sequentially).
+
+Pairs share a handful of prompts and their coordinates jitter by a few meters around
+each event, so most requests collapse onto the same rounded key. The cold run starts
+with an empty cache, the warm run repeats the same requests.
+
+Also checks that every answer is the stub's answer for the rounded request, that no
+more than --concurrency calls were ever in flight, and that the warm run only calls
+for the keys that failed in the cold run (failures are not cached).
+
+Usage:
+    python benchmarks/bench_maps_grounding.py --pairs 5000 --latency-ms 200 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(DATA_DIR))
+
+from maps_grounding import MapsGroundingRunner, MapsRequest, normalize_request, request_prompt
+from summary_cache import SummaryCache
+
+EVENTS = [  # (latitude, longitude) of event venues
+    (37.7749, -122.4194), (40.7680797, -73.9818957), (34.050481, -118.248526), (51.5072, -0.1276), (52.5200, 13.4050),
+]
+PROMPTS = [
+    "Suggest a quiet cafe for a 30 minute founder meeting.",
+    "Where can two people grab lunch and talk business nearby?",
+    "Recommend a coworking space with meeting rooms bookable today.",
+    "Find a bar suitable for an informal evening chat.",
+]
+RADII = [500, 1000, None]
+
+
+class StubMapsClient:
+    """Answers after a fixed delay; fails a fraction of calls; records peak concurrency"""
+
+    def __init__(self, latency: float, failure_rate: float, seed: int = 42):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    @staticmethod
+    def answer(prompt: str, latitude: float, longitude: float) -> dict:
+        return {
+            "text": f"Try the place near {latitude}, {longitude}: {prompt}",
+            "sources": [{"title": f"Venue {latitude},{longitude}", "uri": f"https://maps.google.com/?q={latitude},{longitude}",
+                         "place_id": None}],
+        }
+
+    async def generate(self, model: str, prompt: str, latitude: float, longitude: float) -> dict:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.rng.random() < self.failure_rate:
+                raise RuntimeError("503 UNAVAILABLE")
+            return self.answer(prompt, latitude, longitude)
+        finally:
+            self.in_flight -= 1
+
+
+def make_requests(pairs: int, seed: int = 7) -> list:
+    """One meeting spot request per matched pair, at its event with a few meters of GPS jitter"""
+    rng = random.Random(seed)
+    requests = []
+    for _ in range(pairs):
+        latitude, longitude = rng.choice(EVENTS)
+        requests.append(MapsRequest(
+            rng.choice(PROMPTS),
+            latitude + rng.uniform(-0.0002, 0.0002),
+            longitude + rng.uniform(-0.0002, 0.0002),
+            rng.choice(RADII)
+        ))
+    return requests
+
+
+async def timed_run(runner: MapsGroundingRunner, requests: list) -> tuple:
+    start = time.perf_counter()
+    answers = await runner.run(requests)
+    return answers, time.perf_counter() - start
+
+
+def check_answers(requests: list, answers: list, precision: int) -> int:
+    """Answers that are neither None (failed) nor the stub's answer for the rounded request"""
+    wrong = 0
+    for request, answer in zip(requests, answers):
+        request = normalize_request(request, precision)
+        if answer is not None and answer != StubMapsClient.answer(request_prompt(request), request.latitude, request.longitude):
+            wrong += 1
+    return wrong
+
+
+async def run(args) -> bool:
+    requests = make_requests(args.pairs)
+    sequential_s = len(requests) * args.latency_ms / 1000
+
+    with tempfile.TemporaryDirectory() as tmp, SummaryCache(Path(tmp) / "cache.sqlite") as cache:
+        client = StubMapsClient(args.latency_ms / 1000, args.failure_rate)
+        runner = MapsGroundingRunner(client, cache, max_concurrency=args.concurrency, retry_delay=args.latency_ms / 1000)
+
+        cold, cold_s = await timed_run(runner, requests)
+        cold_stats, cold_calls = dict(runner.stats), client.calls
+        warm, warm_s = await timed_run(runner, requests)
+        warm_calls = client.calls - cold_calls
+
+    failed = sum(answer is None for answer in cold)
+    wrong = check_answers(requests, cold, runner.precision) + check_answers(requests, warm, runner.precision)
+    print(f"Requests: {len(requests):,} ({cold_stats['unique']:,} unique keys), stub latency {args.latency_ms:.0f} ms, "
+          f"{args.failure_rate:.0%} failing calls, concurrency {args.concurrency}")
+    print(f"  sequential, no cache (estimated): {sequential_s:8.1f}s  {len(requests):,} calls")
+    print(f"  runner, cold cache:               {cold_s:8.2f}s  {cold_calls:,} calls "
+          f"({cold_stats['retries']:,} retries, {failed:,} failed), peak in flight {client.peak_in_flight}")
+    warm_hits = runner.stats["cache_hits"] - cold_stats["cache_hits"]
+    print(f"  runner, warm cache:               {warm_s:8.3f}s  {warm_calls:,} calls, {warm_hits:,} cache hits")
+
+    only_failed_missed = cold_stats["unique"] - warm_hits == cold_stats["failures"]
+    ok = wrong == 0 and client.peak_in_flight <= args.concurrency and only_failed_missed
+    print(f"  answers match the rounded requests: {'✓' if wrong == 0 else f'✗ ({wrong} wrong)'}, "
+          f"concurrency bound: {'✓' if client.peak_in_flight <= args.concurrency else '✗'}, "
+          f"warm misses = cold failures ({cold_stats['failures']}): {'✓' if only_failed_missed else '✗'}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the bulk Maps grounding runner against a stub client")
+    parser.add_argument("--pairs", type=int, default=5000)
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="Stub response time")
+    parser.add_argument("--failure-rate", type=float, default=0.05, help="Fraction of stub calls that fail")
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    sys.exit(0 if asyncio.run(run(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Matching Engine Latency Benchmark
+Unifies a synthetic dataset with --features, loads match_engine.MatchEngine over it and
+measures top-k query latency, in process and through the local HTTP service
+(one keep-alive connection, so the numbers include request parsing and JSON encoding).
+
+Queries combine random titles, tags, challenge areas and industries from
+synthetic_data.py; --location-rate of them also filter by a city or country.
+
+Exits with status 1 when any p99 is above --target-ms.
+
+Usage:
+    python benchmarks/bench_match_engine.py --guests 100000 --queries 5000
+"""
+
+import argparse
+import http.client
+import json
+import logging
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+DATA_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(DATA_DIR))
+
+from synthetic_data import CHALLENGES, COUNTRIES, INDUSTRIES, TAGS, TITLES, generate_dataset, use_dataset
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def make_queries(count: int, location_rate: float, seed: int = 7) -> list:
+    """(query, location or None) pairs"""
+    rng = random.Random(seed)
+    vocabulary = TITLES + TAGS + CHALLENGES + INDUSTRIES
+    queries = []
+    for _ in range(count):
+        query = " ".join(rng.sample(vocabulary, rng.randint(1, 4)))
+        location = None
+        if rng.random() < location_rate:
+            city, _, country, _ = rng.choice(COUNTRIES)
+            location = rng.choice([city, country])
+        queries.append((query, location))
+    return queries
+
+
+def report(label: str, samples: list, target_ms: float) -> bool:
+    p99 = percentile(samples, 99) * 1000
+    ok = p99 <= target_ms
+    print(f"  {label:<10} p50 {percentile(samples, 50) * 1000:6.2f} ms | p95 {percentile(samples, 95) * 1000:6.2f} ms | "
+          f"p99 {p99:6.2f} ms | mean {statistics.mean(samples) * 1000:6.2f} ms  {'✓' if ok else '✗'}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark local top-k matching queries")
+    parser.add_argument("--guests", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=3, help="Matches per query (search-people-tool.ts default)")
+    parser.add_argument("--location-rate", type=float, default=0.3, help="Fraction of queries with a location filter")
+    parser.add_argument("--target-ms", type=float, default=10.0, help="p99 latency target")
+    parser.add_argument("--no-http", action="store_true", help="Only measure in-process queries")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    import unify_data
+    from match_engine import MatchEngine, MatchServer
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work = Path(tmp)
+        generate_dataset(work, args.guests)
+
+        use_dataset(unify_data, work)
+        unify_data.main(["--stream", "--features"])
+
+        start = time.perf_counter()
+        engine = MatchEngine.load(unify_data.OUTPUT_ALL, unify_data.OUTPUT_FEATURES)
+        load_time = time.perf_counter() - start
+
+        queries = make_queries(args.queries, args.location_rate)
+        for query, location in queries[:100]:  # Warm-up (location masks, bucket caches)
+            engine.search(query, location, args.limit)
+
+        samples, empty = [], 0
+        for query, location in queries:
+            start = time.perf_counter()
+            matches = engine.search(query, location, args.limit)
+            samples.append(time.perf_counter() - start)
+            empty += not matches
+
+        print(f"Guests: {len(engine):,}, queries: {len(queries):,} (limit {args.limit}, "
+              f"{args.location_rate:.0%} with a location filter, {empty} without matches)")
+        print(f"  Engine load: {load_time:.1f}s")
+        ok = report("in-process", samples, args.target_ms)
+
+        if not args.no_http:
+            server = MatchServer(("127.0.0.1", 0), engine)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            connection = http.client.HTTPConnection("127.0.0.1", server.server_port)
+            try:
+                samples = []
+                for query, location in queries:
+                    params = {"query": query, "limit": args.limit, **({"location": location} if location else {})}
+                    start = time.perf_counter()
+                    connection.request("GET", "/search?" + urlencode(params))
+                    body = json.loads(connection.getresponse().read())
+                    samples.append(time.perf_counter() - start)
+                    if not body["success"]:
+                        raise RuntimeError(body.get("error"))
+            finally:
+                connection.close()
+                server.shutdown()
+                server.server_close()
+            ok = report("HTTP", samples, args.target_ms) and ok
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
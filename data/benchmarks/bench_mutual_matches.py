@@ -0,0 +1,111 @@
+"""
+Mutual Match Precomputation Benchmark
+Unifies synthetic datasets and times mutual_matches.build_mutual_matches() on them:
+wall time, pairs scored per second and peak RSS (the N x N score matrix of 50k
+attendees alone would be 10 GB; blocked scoring stays at a few hundred MB), then
+times lookups in the written match file.
+
+Each size runs in a fresh process so peak RSS belongs to that size.
+
+Usage:
+    python benchmarks/bench_mutual_matches.py --guests 10000 50000 --workers 1 4
+"""
+
+import argparse
+import json
+import logging
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+DATA_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(DATA_DIR))
+
+from synthetic_data import generate_dataset, use_dataset
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run_size(guests: int, workers: int, top_n: int) -> dict:
+    """Worker process: unify `guests` synthetic guests, build and query the match file"""
+    logging.disable(logging.INFO)
+    import json_backend
+    import unify_data
+    from mutual_matches import MutualMatches, build_mutual_matches
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work = Path(tmp)
+        generate_dataset(work, guests)
+        use_dataset(unify_data, work)
+        unify_data.main(["--stream"])
+
+        profiles = json_backend.load(unify_data.OUTPUT_ALL)
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+        output = work / "unified_guests_matches.bin"
+        start = time.perf_counter()
+        pairs = build_mutual_matches(profiles, output, top_n, workers)
+        build_time = time.perf_counter() - start
+        rss_after = max(  # With --workers, the largest scoring process counts too
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        ) / 1024
+
+        rng = random.Random(7)
+        usernames = [profile["username"] for profile in rng.sample(profiles, min(5000, len(profiles)))]
+        samples = []
+        with MutualMatches(output) as matches:
+            for username in usernames:
+                start = time.perf_counter()
+                matches.get(username)
+                samples.append(time.perf_counter() - start)
+
+        return {
+            "guests": guests,
+            "workers": workers,
+            "pairs": pairs,
+            "build_s": build_time,
+            "scored_pairs_per_s": guests * guests / build_time,
+            "rss_before_mb": rss_before,
+            "rss_peak_mb": rss_after,
+            "file_mb": output.stat().st_size / 1e6,
+            "get_p50_us": percentile(samples, 50) * 1e6,
+            "get_p99_us": percentile(samples, 99) * 1e6,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark all-pairs mutual match precomputation")
+    parser.add_argument("--guests", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1])
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--worker", nargs=3, type=int, help=argparse.SUPPRESS)  # guests workers top
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_size(*args.worker)))
+        return
+
+    print(f"{'guests':>8} | {'workers':>7} | {'build s':>8} | {'pairs/s':>12} | {'RSS MB (profiles -> peak)':>26} | "
+          f"{'file MB':>7} | {'get p50/p99 µs':>15}")
+    for guests in args.guests:
+        for workers in args.workers:
+            output = subprocess.run(
+                [sys.executable, __file__, "--worker", str(guests), str(workers), str(args.top)],
+                check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{guests:>8,} | {workers:>7} | {result['build_s']:>8.1f} | {result['scored_pairs_per_s']:>12,.0f} | "
+                  f"{result['rss_before_mb']:>11,.0f} -> {result['rss_peak_mb']:>11,.0f} | {result['file_mb']:>7.1f} | "
+                  f"{result['get_p50_us']:>6.1f} / {result['get_p99_us']:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+Pipeline Benchmark Suite
+Generates synthetic datasets (synthetic_data.py) and times/memory-profiles every
+pipeline stage, each in a fresh process:
+
+- extract_domains.py -> clean_domains.py -> split_domains.py
+- unify_data.py, broken down into the steps of unify_all_data():
+  load_guest_profiles, load_fullenrich_data, load_whitecontext_data, build_match_index,
+  unify_guest loop, save_outputs, build_features (--features)
+
+For each stage: wall time, CPU time, items/sec and peak RSS (the process high-water
+mark when the stage finished, so later unify steps include earlier ones).
+
+Results can be saved as a baseline; later runs are compared against it and any stage
+whose throughput drops or peak RSS grows by more than --tolerance is flagged
+(exit status 1), so a regressing change shows up in review.
+
+Usage:
+    python benchmarks/bench_pipeline.py --guests 1000 10000 100000
+    python benchmarks/bench_pipeline.py --guests 1000 10000 --save-baseline
+    python benchmarks/bench_pipeline.py --guests 1000000 --fullenrich-rate 0.7 --whitecontext-rate 0.5
+"""
+
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+BENCH_DIR = Path(__file__).resolve().parent
+DATA_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(DATA_DIR))
+
+from synthetic_data import generate_dataset, use_dataset
+
+DEFAULT_BASELINE = BENCH_DIR / "pipeline_baseline.json"
+DEFAULT_TOLERANCE = 0.2  # Flag >20% slower throughput or >20% more peak RSS
+MIN_TIMED_SECONDS = 0.05  # Faster baseline stages are too noisy to compare throughput
+
+STAGES = ["extract_domains", "clean_domains", "split_domains", "unify_data"]
+
+
+# ============================================================================
+# STAGE WORKERS (run inside a fresh process)
+# ============================================================================
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1024 / 1024
+
+
+def measure(name: str, func: Callable, items: Callable = None) -> tuple:
+    """Run func and return (result, measurement); items(result) gives the item count"""
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = func()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return result, {
+        "stage": name,
+        "seconds": wall,
+        "cpu_seconds": cpu,
+        "items": items(result) if items else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def count_lines(path: Path) -> int:
+    with open(path, 'r') as f:
+        return sum(1 for line in f if line.strip())
+
+
+def run_extract_domains(work: Path) -> List[Dict]:
+    import extract_domains
+    extract_domains.INPUT_CSV = work / "T2" / "cerebralvalley_hackathon_enriched.csv"
+    extract_domains.OUTPUT_TXT = work / "T2" / "unique_domains.txt"
+    rows = count_lines(extract_domains.INPUT_CSV) - 1
+    _, m = measure("extract_domains", extract_domains.main, lambda _: rows)
+    return [m]
+
+
+def run_clean_domains(work: Path) -> List[Dict]:
+    import clean_domains
+    clean_domains.INPUT_TXT = work / "T2" / "unique_domains.txt"
+    clean_domains.OUTPUT_TXT = work / "T2" / "unique_domains_cleaned.txt"
+    domains = count_lines(clean_domains.INPUT_TXT)
+    _, m = measure("clean_domains", clean_domains.main, lambda _: domains)
+    return [m]
+
+
+def run_split_domains(work: Path) -> List[Dict]:
+    import split_domains
+    split_domains.INPUT_TXT = work / "T2" / "unique_domains.txt"
+    split_domains.OUTPUT_DIR = work / "T2" / "domain_batches"
+    split_domains.LATENCY_HISTORY = work / "T2" / "batch_latency.json"
+    domains = count_lines(split_domains.INPUT_TXT)
+    _, m = measure("split_domains", lambda: split_domains.main([]), lambda _: domains)
+    return [m]
+
+
+def run_unify_data(work: Path) -> List[Dict]:
+    """The steps of unify_all_data() + save_outputs(), measured one by one"""
+    import unify_data as ud
+    out = work / "unified"
+    out.mkdir(exist_ok=True)
+    use_dataset(ud, work, out)
+
+    measurements = []
+    guests, m = measure("unify.load_guest_profiles", ud.load_guest_profiles, len)
+    measurements.append(m)
+    fullenrich, m = measure("unify.load_fullenrich_data", ud.load_fullenrich_data, len)
+    measurements.append(m)
+    whitecontext, m = measure("unify.load_whitecontext_data", ud.load_whitecontext_data, len)
+    measurements.append(m)
+
+    resolver, m = measure("unify.build_match_index", lambda: ud.build_company_resolver(whitecontext), len)
+    measurements.append(m)
+
+    stats = ud.new_unification_stats(len(guests))
+    profiles, m = measure(
+        "unify.unify_guests",
+        lambda: [ud.unify_guest(guest, fullenrich, whitecontext, stats, resolver) for guest in guests],
+        len,
+    )
+    measurements.append(m)
+    _, m = measure("unify.save_outputs", lambda: ud.save_outputs(profiles, stats), lambda _: len(profiles))
+    measurements.append(m)
+    _, m = measure("unify.build_features", lambda: ud.save_features(profiles), lambda _: len(profiles))
+    measurements.append(m)
+    return measurements
+
+
+WORKERS = {
+    "extract_domains": run_extract_domains,
+    "clean_domains": run_clean_domains,
+    "split_domains": run_split_domains,
+    "unify_data": run_unify_data,
+}
+
+
+def worker_main(stage: str, work_dir: str):
+    import logging
+    logging.disable(logging.INFO)
+    print(json.dumps(WORKERS[stage](Path(work_dir))))
+
+
+# ============================================================================
+# DRIVER
+# ============================================================================
+
+def run_stage(stage: str, work_dir: Path) -> List[Dict]:
+    """Run one stage worker in a fresh process (cwd = work_dir, so log files land there)"""
+    proc = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--worker", stage, str(work_dir)],
+        cwd=work_dir, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{stage} failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def run_size(num_guests: int, args) -> List[Dict]:
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        start = time.perf_counter()
+        counts = generate_dataset(
+            work_dir, num_guests,
+            fullenrich_rate=args.fullenrich_rate,
+            whitecontext_rate=args.whitecontext_rate,
+            guests_per_company=args.guests_per_company,
+        )
+        print(f"\n{num_guests:,} guests: {counts['fullenrich_profiles']:,} FullEnrich records, "
+              f"{counts['whitecontext_companies']:,}/{counts['companies']:,} companies with WhiteContext "
+              f"(generated in {time.perf_counter() - start:.1f}s)")
+
+        measurements = []
+        for stage in STAGES:
+            measurements.extend(run_stage(stage, work_dir))
+        return measurements
+
+
+def throughput(m: Dict) -> float:
+    return m["items"] / m["seconds"] if m["items"] and m["seconds"] > 0 else 0.0
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Flags for every stage that regressed against the baseline"""
+    flags = []
+    for size, stages in current.items():
+        for stage, m in stages.items():
+            base = baseline.get(size, {}).get(stage)
+            if not base:
+                continue
+            timed = base["seconds"] >= MIN_TIMED_SECONDS
+            if timed and base["items_per_sec"] and m["items_per_sec"] < base["items_per_sec"] * (1 - tolerance):
+                flags.append(f"{size} guests / {stage}: throughput {m['items_per_sec']:,.0f}/s "
+                             f"vs baseline {base['items_per_sec']:,.0f}/s")
+            if m["peak_rss_mb"] > base["peak_rss_mb"] * (1 + tolerance):
+                flags.append(f"{size} guests / {stage}: peak RSS {m['peak_rss_mb']:.0f} MB "
+                             f"vs baseline {base['peak_rss_mb']:.0f} MB")
+    return flags
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every pipeline stage on synthetic data")
+    parser.add_argument("--worker", nargs=2, metavar=("STAGE", "WORK_DIR"), help=argparse.SUPPRESS)
+    parser.add_argument("--guests", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--fullenrich-rate", type=float, default=0.95, help="Fraction of guests with FullEnrich data")
+    parser.add_argument("--whitecontext-rate", type=float, default=0.8, help="Fraction of companies with WhiteContext data")
+    parser.add_argument("--guests-per-company", type=int, default=2)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline file (default: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative regression before flagging (default: %(default)s)")
+    args = parser.parse_args()
+
+    if args.worker:
+        worker_main(*args.worker)
+        return
+
+    results = {}
+    for num_guests in args.guests:
+        measurements = run_size(num_guests, args)
+        print(f"{'stage':<30} | {'seconds':>8} | {'cpu s':>8} | {'items':>9} | {'items/s':>10} | {'peak RSS MB':>11}")
+        print("-" * 92)
+        for m in measurements:
+            print(f"{m['stage']:<30} | {m['seconds']:8.2f} | {m['cpu_seconds']:8.2f} | {m['items'] or 0:9,} | "
+                  f"{throughput(m):10,.0f} | {m['peak_rss_mb']:11.1f}")
+        results[str(num_guests)] = {
+            m["stage"]: {
+                "seconds": round(m["seconds"], 4),
+                "cpu_seconds": round(m["cpu_seconds"], 4),
+                "items": m["items"],
+                "items_per_sec": round(throughput(m), 1),
+                "peak_rss_mb": round(m["peak_rss_mb"], 1),
+            }
+            for m in measurements
+        }
+
+    if args.baseline.exists() and not args.save_baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        flags = compare(results, baseline.get("results", {}), args.tolerance)
+        print(f"\nBaseline: {args.baseline} ({baseline.get('created')}, {baseline.get('python')})")
+        if flags:
+            print(f"✗ {len(flags)} regression(s) beyond {args.tolerance:.0%}:")
+            for flag in flags:
+                print(f"  - {flag}")
+            sys.exit(1)
+        print(f"✓ No regressions beyond {args.tolerance:.0%}")
+
+    if args.save_baseline:
+        baseline = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "settings": {
+                "fullenrich_rate": args.fullenrich_rate,
+                "whitecontext_rate": args.whitecontext_rate,
+                "guests_per_company": args.guests_per_company,
+            },
+            "results": results,
+        }
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2)
+        print(f"\n✓ Baseline saved: {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Streaming vs In-Memory Unification Benchmark
+Generates a synthetic dataset, runs unify_data.py in both modes in separate
+processes and reports wall time and peak RSS. Outputs of both modes are compared
+byte for byte.
+
+Streaming peak RSS still grows with the number of distinct usernames and companies
+(the join indexes), but no longer with the guest list or the unified output.
+
+Usage:
+    python benchmarks/bench_streaming.py --guests 10000 50000
+"""
+
+import argparse
+import os
+import filecmp
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic_data import generate_dataset
+
+BENCH_DIR = Path(__file__).resolve().parent
+DATA_DIR = BENCH_DIR.parent
+
+RUNNER = """
+import logging
+import sys
+from pathlib import Path
+logging.disable(logging.INFO)
+sys.path.insert(0, {data_dir!r})
+sys.path.insert(0, {bench_dir!r})
+import unify_data
+from synthetic_data import use_dataset
+
+use_dataset(unify_data, Path({work_dir!r}), Path({out_dir!r}))
+unify_data.main({argv!r})
+"""
+
+
+def run_mode(work_dir: Path, out_dir: Path, argv: list) -> dict:
+    """Run one unification in a fresh process and return its wall time and peak RSS"""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    script = RUNNER.format(data_dir=str(DATA_DIR), bench_dir=str(BENCH_DIR), work_dir=str(work_dir),
+                           out_dir=str(out_dir), argv=argv)
+
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-c", script], cwd=out_dir)
+    _, status, usage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+
+    if status != 0:
+        raise RuntimeError(f"unify_data.py {argv} failed with status {status}")
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return {"seconds": elapsed, "peak_rss_mb": usage.ru_maxrss * scale / 1024 / 1024}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming unification")
+    parser.add_argument("--guests", type=int, nargs="+", default=[5000, 20000, 80000])
+    args = parser.parse_args()
+
+    print(f"{'guests':>10} | {'mode':>9} | {'seconds':>8} | {'peak RSS MB':>11}")
+    print("-" * 50)
+
+    for num_guests in args.guests:
+        with tempfile.TemporaryDirectory() as tmp:
+            work_dir = Path(tmp) / "input"
+            generate_dataset(work_dir, num_guests)
+
+            results = {}
+            for mode, argv in (("in-memory", []), ("stream", ["--stream"])):
+                results[mode] = run_mode(work_dir, Path(tmp) / mode, argv)
+                print(f"{num_guests:>10} | {mode:>9} | {results[mode]['seconds']:>8.2f} | {results[mode]['peak_rss_mb']:>11.1f}")
+
+            for name in ("unified_guests_all.json", "unified_guests_whitecontext.json"):
+                same = filecmp.cmp(Path(tmp) / "in-memory" / name, Path(tmp) / "stream" / name, shallow=False)
+                if not same:
+                    print(f"  ✗ {name} differs between modes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Local Fake FullEnrich API
+Serves the endpoints enrich_linkedin.py uses so the async client can be exercised
+without credits or network access:
+
+- GET  /api/v1/account/credits
+- POST /api/v1/contact/enrich/bulk          -> {"enrichment_id": ...}
+- GET  /api/v1/contact/enrich/bulk/{id}     -> CREATED / IN_PROGRESS / RATE_LIMIT / FINISHED
+
+Each enrichment finishes after a random duration. A fraction of polls answer with
+the RATE_LIMIT status or HTTP 429 so backoff paths get exercised.
+
+Usage:
+    python benchmarks/fake_fullenrich.py --port 8765
+    python enrich_linkedin.py --api-base http://127.0.0.1:8765/api/v1
+"""
+
+import argparse
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Dict
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_data import make_fullenrich_item
+
+
+class FakeFullEnrich:
+    """In-memory FullEnrich state plus request counters"""
+
+    def __init__(self, min_duration: float = 1.0, max_duration: float = 5.0,
+                 rate_limit_status: float = 0.05, http_429: float = 0.05, seed: int = 42):
+        self.min_duration = min_duration
+        self.max_duration = max_duration
+        self.rate_limit_status = rate_limit_status
+        self.http_429 = http_429
+        self.rng = random.Random(seed)
+        self.enrichments: Dict[str, Dict] = {}
+        self.counters = {"submits": 0, "polls": 0, "rate_limit_status": 0, "http_429": 0}
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/api/v1/account/credits", self.credits)
+        app.router.add_post("/api/v1/contact/enrich/bulk", self.submit)
+        app.router.add_get("/api/v1/contact/enrich/bulk/{enrichment_id}", self.poll)
+        return app
+
+    async def credits(self, request: web.Request) -> web.Response:
+        return web.json_response({"balance": 1_000_000})
+
+    async def submit(self, request: web.Request) -> web.Response:
+        self.counters["submits"] += 1
+        if self.rng.random() < self.http_429:
+            self.counters["http_429"] += 1
+            return web.json_response({"error": "rate limited"}, status=429, headers={"Retry-After": "1"})
+
+        payload = await request.json()
+        enrichment_id = str(uuid.uuid4())
+        self.enrichments[enrichment_id] = {
+            "name": payload.get("name"),
+            "contacts": payload.get("datas", []),
+            "ready_at": time.monotonic() + self.rng.uniform(self.min_duration, self.max_duration),
+        }
+        return web.json_response({"enrichment_id": enrichment_id})
+
+    async def poll(self, request: web.Request) -> web.Response:
+        self.counters["polls"] += 1
+        enrichment = self.enrichments.get(request.match_info["enrichment_id"])
+        if enrichment is None:
+            return web.json_response({"error": "not found"}, status=404)
+
+        if self.rng.random() < self.http_429:
+            self.counters["http_429"] += 1
+            return web.json_response({"error": "rate limited"}, status=429)
+
+        if time.monotonic() < enrichment["ready_at"]:
+            if self.rng.random() < self.rate_limit_status:
+                self.counters["rate_limit_status"] += 1
+                return web.json_response({"status": "RATE_LIMIT"})
+            return web.json_response({"status": "IN_PROGRESS"})
+
+        datas = [
+            make_fullenrich_item(self.rng, contact["custom"]["username"], i)
+            for i, contact in enumerate(enrichment["contacts"])
+        ]
+        for item, contact in zip(datas, enrichment["contacts"]):
+            item["custom"] = contact["custom"]
+        return web.json_response({
+            "name": enrichment["name"],
+            "status": "FINISHED",
+            "datas": datas,
+            "cost": {"credits": sum(1 for item in datas if item["contact"].get("most_probable_email"))},
+        })
+
+
+async def start_fake_server(fake: FakeFullEnrich, host: str = "127.0.0.1", port: int = 0) -> tuple:
+    """Start the fake API in the running loop; returns (runner, base_url)"""
+    runner = web.AppRunner(fake.app())
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://{host}:{bound_port}/api/v1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local fake FullEnrich API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--min-duration", type=float, default=5.0, help="Fastest enrichment (seconds)")
+    parser.add_argument("--max-duration", type=float, default=30.0, help="Slowest enrichment (seconds)")
+    parser.add_argument("--rate-limit", type=float, default=0.05, help="Fraction of polls answered RATE_LIMIT")
+    parser.add_argument("--http-429", type=float, default=0.05, help="Fraction of requests answered HTTP 429")
+    args = parser.parse_args()
+
+    fake = FakeFullEnrich(args.min_duration, args.max_duration, args.rate_limit, args.http_429)
+    web.run_app(fake.app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
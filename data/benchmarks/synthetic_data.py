@@ -0,0 +1,280 @@
+"""
+Synthetic Pipeline Data Generator
+Writes guest profiles, FullEnrich batch results and WhiteContext results with the
+same shape as the real hackathon data, at any size.
+
+Layout (mirrors data/):
+- guest_profiles_enriched.json
+- T2/batch_N_results.json
+- T2/cerebralvalley_hackathon_enriched.csv (the enrichment script's combined CSV)
+- whitecontext/N.json
+
+use_dataset() points unify_data at a generated dataset and redirects all its outputs.
+"""
+
+import csv
+import json
+import random
+from pathlib import Path
+from typing import Dict, List, Optional
+
+INDUSTRIES = [
+    "Software Development", "IT Services and IT Consulting", "Financial Services",
+    "Research Services", "Venture Capital and Private Equity Principals",
+    "Technology, Information and Internet", "Hospitals and Health Care", "Education"
+]
+COUNTRIES = [
+    ("San Francisco", "California", "United States", "US"),
+    ("New York", "New York", "United States", "US"),
+    ("London", "England", "United Kingdom", "GB"),
+    ("Berlin", "Berlin", "Germany", "DE"),
+    ("Warsaw", "Masovian", "Poland", "PL"),
+    ("Toronto", "Ontario", "Canada", "CA"),
+]
+HEADCOUNT_RANGES = ["1-10", "11-50", "51-200", "201-500", "501-1000", "1001-5000"]
+TITLES = ["Founder", "CTO", "Software Engineer", "Product Manager", "ML Engineer", "Investor", "Designer"]
+TAGS = ["ai", "llm", "devtools", "fintech", "healthtech", "infra", "agents", "voice", "robotics", "security"]
+CHALLENGES = ["hiring", "go-to-market", "fundraising", "enterprise sales", "data quality", "latency", "compliance"]
+TLDS = [".com", ".io", ".ai", ".co", ".dev"]
+
+
+def company_domain(index: int) -> str:
+    """Deterministic company domain for a company index"""
+    return f"company{index}{TLDS[index % len(TLDS)]}"
+
+
+def make_guest(rng: random.Random, index: int) -> Dict:
+    """Guest profile in guest_profiles_enriched.json format"""
+    username = f"guest{index:07d}"
+    return {
+        "url": f"https://cerebralvalley.ai/u/{username}",
+        "name": "Unknown",
+        "avatar": None,
+        "metadata": {"field_2": f"Guest {index}"},
+        "username": username,
+        "linkedIn": f"https://www.linkedin.com/in/{username}" if rng.random() < 0.95 else None
+    }
+
+
+def make_fullenrich_item(rng: random.Random, username: str, company_index: int) -> Dict:
+    """FullEnrich `datas` entry for one contact"""
+    domain = company_domain(company_index)
+    city, region, country, country_code = rng.choice(COUNTRIES)
+    website_style = rng.random()
+    if website_style < 0.5:
+        website = f"https://www.{domain}/"
+    elif website_style < 0.8:
+        website = f"http://{domain}?utm_source=linkedin"
+    else:
+        website = f"{domain}/about"
+
+    return {
+        "custom": {"username": username},
+        "contact": {
+            "most_probable_email": f"{username}@{domain}" if rng.random() < 0.7 else None,
+            "most_probable_email_status": "DELIVERABLE",
+            "domain": domain,
+            "emails": [{"email": f"{username}@{domain}", "status": "DELIVERABLE"}],
+            "phones": [],
+            "social_medias": [{"url": f"https://www.linkedin.com/in/{username}", "type": "LINKEDIN"}],
+            "profile": {
+                "linkedin_id": str(rng.randrange(10**8, 10**9)),
+                "linkedin_url": f"https://www.linkedin.com/in/{username}",
+                "linkedin_handle": username,
+                "firstname": "Guest",
+                "lastname": username,
+                "location": f"{city}, {region}, {country}",
+                "headline": f"{rng.choice(TITLES)} at Company {company_index}",
+                "summary": " ".join(rng.choice(TAGS) for _ in range(30)),
+                "premium_account": rng.random() < 0.3,
+                "position": {
+                    "title": rng.choice(TITLES),
+                    "description": "Building " + " ".join(rng.choice(TAGS) for _ in range(10)),
+                    "start_at": "2023-01-01",
+                    "end_at": None,
+                    "company": {
+                        "name": f"Company {company_index}",
+                        "domain": domain if rng.random() < 0.6 else None,
+                        "website": website,
+                        "linkedin_url": f"https://www.linkedin.com/company/company{company_index}",
+                        "linkedin_id": str(100000 + company_index),
+                        "industry": rng.choice(INDUSTRIES),
+                        "description": f"Company {company_index} builds " + " ".join(rng.choice(TAGS) for _ in range(20)),
+                        "headcount": rng.randrange(1, 5000),
+                        "headcount_range": rng.choice(HEADCOUNT_RANGES),
+                        "year_founded": rng.randrange(1990, 2025),
+                        "headquarters": {
+                            "city": city,
+                            "region": region,
+                            "country": country,
+                            "country_code": country_code,
+                            "address_line_1": f"{rng.randrange(1, 999)} Market St"
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+
+ENRICHED_CSV_COLUMNS = [
+    "username", "email", "email_status", "domain", "full_name", "linkedin_url", "headline",
+    "position_title", "company_name", "company_website", "company_domain", "company_industry",
+    "hq_city", "hq_country"
+]
+
+
+def enriched_csv_row(item: Dict) -> List:
+    """Row of cerebralvalley_hackathon_enriched.csv for one FullEnrich `datas` entry"""
+    contact = item["contact"]
+    profile = contact["profile"]
+    position = profile["position"]
+    company = position["company"]
+    return [
+        item["custom"]["username"],
+        contact.get("most_probable_email"),
+        contact.get("most_probable_email_status"),
+        contact.get("domain"),
+        f"{profile['firstname']} {profile['lastname']}",
+        profile.get("linkedin_url"),
+        profile.get("headline"),
+        position.get("title"),
+        company.get("name"),
+        company.get("website"),
+        company.get("domain"),
+        company.get("industry"),
+        company["headquarters"].get("city"),
+        company["headquarters"].get("country"),
+    ]
+
+
+def make_whitecontext_result(rng: random.Random, company_index: int) -> Dict:
+    """WhiteContext `results` entry for one company"""
+    domain = company_domain(company_index)
+    return {
+        "url": f"https://{domain}",
+        "status": "completed",
+        "company_name": f"Company {company_index}",
+        "analyzed_at": "2025-10-18T12:00:00",
+        "gtm_intelligence": {
+            "tldr": f"Company {company_index} sells " + " ".join(rng.choice(TAGS) for _ in range(12)),
+            "context_tags": rng.sample(TAGS, 4),
+            "business_model": {"type": "B2B", "target_market": "Enterprise"},
+            "company_profile": {"stage": "Seed", "employees": rng.choice(HEADCOUNT_RANGES)},
+            "products_services": [
+                {"name": f"Product {company_index}-{p}", "description": " ".join(rng.choice(TAGS) for _ in range(15))}
+                for p in range(3)
+            ],
+            "technology_profile": {"stack": rng.sample(TAGS, 3)},
+            "market_evidence": {"customers": [f"Customer {rng.randrange(1000)}" for _ in range(5)]},
+            "contact_information": {"email": f"hello@{domain}"},
+            "company_intelligence": {
+                "growth_signals": ["hiring"],
+                "challenge_areas": rng.sample(CHALLENGES, 2),
+                "competitive_advantages": ["speed"]
+            },
+            "recognition_credibility": {"awards": []},
+            "intelligence_gaps": []
+        }
+    }
+
+
+def generate_dataset(
+    out_dir: Path,
+    num_guests: int,
+    fullenrich_rate: float = 0.95,
+    whitecontext_rate: float = 0.8,
+    guests_per_company: int = 2,
+    fullenrich_batch_size: int = 100,
+    whitecontext_file_size: int = 50,
+    seed: int = 42
+) -> Dict:
+    """
+    Generate a synthetic dataset in out_dir.
+    fullenrich_rate - fraction of guests with a FullEnrich record
+    whitecontext_rate - fraction of companies with a completed WhiteContext result
+    """
+    rng = random.Random(seed)
+    out_dir = Path(out_dir)
+    (out_dir / "T2").mkdir(parents=True, exist_ok=True)
+    (out_dir / "whitecontext").mkdir(parents=True, exist_ok=True)
+
+    num_companies = max(1, num_guests // max(1, guests_per_company))
+
+    # Guests are written one at a time so generation itself stays bounded
+    with open(out_dir / "guest_profiles_enriched.json", 'w') as f:
+        f.write('[')
+        for i in range(num_guests):
+            if i:
+                f.write(',')
+            f.write('\n')
+            json.dump(make_guest(rng, i), f)
+        f.write('\n]')
+
+    # FullEnrich batches, plus the combined CSV that extract_domains.py reads
+    num_enriched = 0
+    batch, batch_num = [], 0
+    csv_file = open(out_dir / "T2" / "cerebralvalley_hackathon_enriched.csv", 'w', newline='')
+    csv_writer = csv.writer(csv_file)
+    csv_writer.writerow(ENRICHED_CSV_COLUMNS)
+    for i in range(num_guests):
+        if rng.random() >= fullenrich_rate:
+            continue
+        item = make_fullenrich_item(rng, f"guest{i:07d}", rng.randrange(num_companies))
+        batch.append(item)
+        csv_writer.writerow(enriched_csv_row(item))
+        num_enriched += 1
+        if len(batch) == fullenrich_batch_size:
+            batch_num += 1
+            with open(out_dir / "T2" / f"batch_{batch_num}_results.json", 'w') as f:
+                json.dump({"status": "FINISHED", "datas": batch}, f)
+            batch = []
+    if batch:
+        batch_num += 1
+        with open(out_dir / "T2" / f"batch_{batch_num}_results.json", 'w') as f:
+            json.dump({"status": "FINISHED", "datas": batch}, f)
+    csv_file.close()
+
+    # WhiteContext results
+    num_companies_enriched = 0
+    results, file_num = [], 0
+    for company_index in range(num_companies):
+        if rng.random() >= whitecontext_rate:
+            continue
+        results.append(make_whitecontext_result(rng, company_index))
+        num_companies_enriched += 1
+        if len(results) == whitecontext_file_size:
+            file_num += 1
+            with open(out_dir / "whitecontext" / f"{file_num}.json", 'w') as f:
+                json.dump({"results": results}, f)
+            results = []
+    if results:
+        file_num += 1
+        with open(out_dir / "whitecontext" / f"{file_num}.json", 'w') as f:
+            json.dump({"results": results}, f)
+
+    return {
+        "guests": num_guests,
+        "fullenrich_profiles": num_enriched,
+        "fullenrich_batches": batch_num,
+        "companies": num_companies,
+        "whitecontext_companies": num_companies_enriched,
+        "whitecontext_files": file_num
+    }
+
+
+def use_dataset(unify_data, work_dir: Path, out_dir: Optional[Path] = None):
+    """
+    Make the unify_data module read the dataset in work_dir and write every output
+    (each OUTPUT_* path and LOG_FILE) under out_dir (default: work_dir), so a benchmark
+    never writes into data/.
+    """
+    work_dir = Path(work_dir)
+    out_dir = Path(out_dir or work_dir)
+    unify_data.GUEST_PROFILES_FILE = work_dir / "guest_profiles_enriched.json"
+    unify_data.FULLENRICH_DIR = work_dir / "T2"
+    unify_data.WHITECONTEXT_DIR = work_dir / "whitecontext"
+    for name, value in vars(unify_data).items():
+        if name.startswith("OUTPUT_") and isinstance(value, Path):
+            setattr(unify_data, name, out_dir / value.name)
+    unify_data.LOG_FILE = out_dir / "unification.log"
@@ -8,7 +8,8 @@ Clean and Deduplicate Domains
 
 from pathlib import Path
 import logging
-import re
+
+from domain_normalizer import clean_host as clean_domain, is_valid_domain
 
 # Setup logging
 logging.basicConfig(
@@ -23,74 +24,6 @@ SCRIPT_DIR = Path(__file__).parent
 INPUT_TXT = SCRIPT_DIR / "T2" / "unique_domains.txt"
 OUTPUT_TXT = SCRIPT_DIR / "T2" / "unique_domains_cleaned.txt"
 
-def clean_domain(domain: str) -> str:
-    """Clean a domain string"""
-    if not domain:
-        return None
-
-    # Remove whitespace
-    domain = domain.strip()
-
-    # Remove URL parameters (everything after ?)
-    if '?' in domain:
-        domain = domain.split('?')[0]
-
-    # Remove URL fragments (everything after #)
-    if '#' in domain:
-        domain = domain.split('#')[0]
-
-    # Remove trailing slashes
-    domain = domain.rstrip('/')
-
-    # Remove protocol if present
-    domain = domain.replace('https://', '').replace('http://', '')
-
-    # Remove www. prefix
-    domain = domain.replace('www.', '')
-
-    # Remove any path (everything after first /)
-    if '/' in domain:
-        domain = domain.split('/')[0]
-
-    # Convert to lowercase
-    domain = domain.lower().strip()
-
-    return domain if domain else None
-
-def is_valid_domain(domain: str) -> bool:
-    """Validate domain format"""
-    if not domain:
-        return False
-
-    # Must contain at least one dot
-    if '.' not in domain:
-        return False
-
-    # Must be at least 4 characters (e.g., a.co)
-    if len(domain) < 4:
-        return False
-
-    # Should not contain spaces
-    if ' ' in domain:
-        return False
-
-    # Should not contain special characters (except dots and hyphens)
-    if not re.match(r'^[a-z0-9.-]+$', domain):
-        return False
-
-    # Should not start or end with dot or hyphen
-    if domain.startswith('.') or domain.startswith('-'):
-        return False
-    if domain.endswith('.') or domain.endswith('-'):
-        return False
-
-    # Should have valid TLD (at least 2 chars after last dot)
-    parts = domain.split('.')
-    if len(parts[-1]) < 2:
-        return False
-
-    return True
-
 def main():
     logger.info("="*80)
     logger.info("CLEANING AND DEDUPLICATING DOMAINS")
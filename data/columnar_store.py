@@ -0,0 +1,448 @@
+"""
+Columnar Unified Guest Store
+Compact, schema'd alternative to unified_guests_all.json.
+
+File layout:
+- magic
+- row groups: one zlib-compressed block per column (presence bitmap, values, dictionary)
+- footer: JSON schema + block offsets for every row group
+- footer length (8 bytes, little-endian) + magic
+
+Every leaf of the build_unified_profile() schema is its own column. Repeated strings
+(industry, country, headcount_range, company fields, ...) and the nested whitecontext
+blobs are dictionary-encoded, so colleagues at the same company share one copy.
+Readers project just the columns they ask for and never decompress the rest.
+
+Usage:
+    python columnar_store.py unified_guests_all.ugc --fields username company.industry
+"""
+
+import argparse
+import json
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import json_backend
+
+MAGIC = b"UGCOL1\n"
+FOOTER_LENGTH = struct.Struct("<Q")
+FORMAT_VERSION = 1
+
+ROW_GROUP_SIZE = 10000  # Rows buffered before a row group is flushed
+COMPRESSION_LEVEL = 6
+
+PLAIN = "plain"  # JSON array of the present values
+DICT = "dict"  # JSON dictionary of distinct values + uint32 codes
+
+# Mirrors the structure produced by unify_data.build_unified_profile()
+UNIFIED_PROFILE_SCHEMA = {
+    "username": PLAIN,
+    "cerebralvalley": {
+        "url": PLAIN,
+        "name": PLAIN,
+        "avatar": PLAIN,
+        "metadata": PLAIN
+    },
+    "linkedin": {
+        "url": PLAIN,
+        "profile_id": PLAIN,
+        "profile_url": PLAIN,
+        "handle": PLAIN,
+        "firstname": PLAIN,
+        "lastname": PLAIN,
+        "location": DICT,
+        "headline": PLAIN,
+        "summary": PLAIN,
+        "premium_account": PLAIN
+    },
+    "contact": {
+        "email": PLAIN,
+        "email_status": DICT,
+        "domain": DICT,
+        "all_emails": PLAIN,
+        "phones": PLAIN,
+        "social_medias": PLAIN
+    },
+    "position": {
+        "title": DICT,
+        "description": PLAIN,
+        "start_date": DICT,
+        "end_date": DICT
+    },
+    "company": {
+        "name": DICT,
+        "domain": DICT,
+        "website": DICT,
+        "linkedin_url": DICT,
+        "linkedin_id": DICT,
+        "industry": DICT,
+        "description": DICT,
+        "headcount": DICT,
+        "headcount_range": DICT,
+        "year_founded": DICT,
+        "headquarters": {
+            "city": DICT,
+            "region": DICT,
+            "country": DICT,
+            "country_code": DICT,
+            "address": DICT
+        }
+    },
+    "whitecontext": {
+        "enriched": PLAIN,
+        "analyzed_at": DICT,
+        "source_url": DICT,
+        "company_name": DICT,
+        "tldr": DICT,
+        "context_tags": DICT,
+        "business_model": DICT,
+        "company_profile": DICT,
+        "products_services": DICT,
+        "technology_profile": DICT,
+        "market_evidence": DICT,
+        "contact_information": DICT,
+        "company_intelligence": DICT,
+        "recognition_credibility": DICT,
+        "intelligence_gaps": DICT,
+        "match": {
+            "domain": DICT,
+            "method": DICT,
+            "confidence": PLAIN
+        }
+    },
+    "data_completeness": {
+        "has_linkedin": PLAIN,
+        "has_fullenrich": PLAIN,
+        "has_whitecontext": PLAIN,
+        "has_email": PLAIN,
+        "has_company": PLAIN
+    }
+}
+
+
+def flatten_schema(schema: Dict, prefix: str = "") -> List[Dict]:
+    """Flatten a nested schema into ordered leaf columns"""
+    columns = []
+    for key, node in schema.items():
+        name = f"{prefix}{key}"
+        if isinstance(node, dict):
+            columns.extend(flatten_schema(node, f"{name}."))
+        else:
+            columns.append({"name": name, "encoding": node})
+    return columns
+
+
+def _dumps(value) -> bytes:
+    return json_backend.dumps(value)
+
+
+def _pack_codes(codes: array) -> bytes:
+    if sys.byteorder != "little":
+        codes = array("I", codes)
+        codes.byteswap()
+    return codes.tobytes()
+
+
+def _unpack_codes(data: bytes) -> array:
+    codes = array("I")
+    codes.frombytes(data)
+    if sys.byteorder != "little":
+        codes.byteswap()
+    return codes
+
+
+# ============================================================================
+# WRITER
+# ============================================================================
+
+class ColumnarWriter:
+    """Write unified profiles row by row into a columnar store"""
+
+    def __init__(self, path: Path, schema: Dict = UNIFIED_PROFILE_SCHEMA, row_group_size: int = ROW_GROUP_SIZE):
+        self.path = path
+        self.schema = schema
+        self.columns = flatten_schema(schema)
+        self.row_group_size = row_group_size
+        self.count = 0
+        self._file = None
+        self._row_groups = []
+        self._reset_buffers()
+
+    def _reset_buffers(self):
+        self._rows = 0
+        self._presence = {column["name"]: bytearray() for column in self.columns}
+        self._values = {column["name"]: [] for column in self.columns}
+
+    def __enter__(self) -> "ColumnarWriter":
+        self._file = open(self.path, 'wb')
+        self._file.write(MAGIC)
+        return self
+
+    def _collect(self, node: Dict, schema: Dict, prefix: str, present: Dict[str, object]):
+        for key, value in node.items():
+            child = schema.get(key)
+            name = f"{prefix}{key}"
+            if child is None:
+                raise ValueError(f"Field '{name}' is not part of the columnar schema")
+            if isinstance(child, dict):
+                if not isinstance(value, dict):
+                    raise ValueError(f"Field '{name}' must be an object")
+                self._collect(value, child, f"{name}.", present)
+            else:
+                present[name] = value
+
+    def write(self, profile: Dict):
+        present = {}
+        self._collect(profile, self.schema, "", present)
+
+        row = self._rows
+        byte, bit = divmod(row, 8)
+        for column in self.columns:
+            name = column["name"]
+            presence = self._presence[name]
+            if bit == 0:
+                presence.append(0)
+            if name in present:
+                presence[byte] |= 1 << bit
+                self._values[name].append(present[name])
+
+        self._rows += 1
+        self.count += 1
+        if self._rows >= self.row_group_size:
+            self._flush_row_group()
+
+    def _write_block(self, data: bytes) -> List[int]:
+        offset = self._file.tell()
+        block = zlib.compress(data, COMPRESSION_LEVEL)
+        self._file.write(block)
+        return [offset, len(block)]
+
+    def _flush_row_group(self):
+        if not self._rows:
+            return
+
+        blocks = {}
+        for column in self.columns:
+            name = column["name"]
+            values = self._values[name]
+            entry = {}
+
+            # Presence is implicit when every row has the field
+            if len(values) < self._rows:
+                entry["presence"] = self._write_block(bytes(self._presence[name]))
+
+            if column["encoding"] == DICT:
+                dictionary = []
+                code_by_key = {}
+                code_by_id = {}
+                codes = array("I")
+                for value in values:
+                    if isinstance(value, (dict, list)):
+                        # Profiles built in-process share blob objects per company; skip re-serializing them
+                        code = code_by_id.get(id(value))
+                        if code is not None:
+                            codes.append(code)
+                            continue
+                        key = _dumps(value)
+                    else:
+                        key = (type(value).__name__, value)
+                    code = code_by_key.get(key)
+                    if code is None:
+                        code = code_by_key[key] = len(dictionary)
+                        dictionary.append(value)
+                    if isinstance(value, (dict, list)):
+                        code_by_id[id(value)] = code
+                    codes.append(code)
+                entry["dictionary"] = self._write_block(_dumps(dictionary))
+                entry["values"] = self._write_block(_pack_codes(codes))
+            else:
+                entry["values"] = self._write_block(_dumps(values))
+
+            blocks[name] = entry
+
+        self._row_groups.append({"num_rows": self._rows, "columns": blocks})
+        self._reset_buffers()
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._flush_row_group()
+                footer = _dumps({
+                    "version": FORMAT_VERSION,
+                    "num_rows": self.count,
+                    "columns": self.columns,
+                    "row_groups": self._row_groups
+                })
+                self._file.write(footer)
+                self._file.write(FOOTER_LENGTH.pack(len(footer)))
+                self._file.write(MAGIC)
+        finally:
+            self._file.close()
+        return False
+
+
+def write_columnar(path: Path, profiles: Iterable[Dict]) -> int:
+    """Write profiles to a columnar store and return the row count"""
+    with ColumnarWriter(path) as writer:
+        for profile in profiles:
+            writer.write(profile)
+    return writer.count
+
+
+# ============================================================================
+# READER
+# ============================================================================
+
+class ColumnarReader:
+    """Read projected fields from a columnar store"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+
+        self._file.seek(0, 2)
+        size = self._file.tell()
+        tail = len(MAGIC) + FOOTER_LENGTH.size
+        self._file.seek(size - tail)
+        (footer_length,) = FOOTER_LENGTH.unpack(self._file.read(FOOTER_LENGTH.size))
+        if self._file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a columnar guest store: {self.path}")
+
+        self._file.seek(size - tail - footer_length)
+        footer = json_backend.loads(self._file.read(footer_length))
+        if footer.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported columnar store version: {footer.get('version')}")
+
+        self.num_rows = footer["num_rows"]
+        self.columns = footer["columns"]
+        self.row_groups = footer["row_groups"]
+        self._encoding = {column["name"]: column["encoding"] for column in self.columns}
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> "ColumnarReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def resolve_fields(self, fields: Optional[Iterable[str]] = None) -> List[str]:
+        """Expand field names or prefixes ('company', 'whitecontext.tldr') into column names"""
+        if fields is None:
+            return [column["name"] for column in self.columns]
+
+        names = []
+        for field in fields:
+            matched = [
+                column["name"] for column in self.columns
+                if column["name"] == field or column["name"].startswith(f"{field}.")
+            ]
+            if not matched:
+                raise KeyError(f"Unknown field: {field}")
+            names.extend(name for name in matched if name not in names)
+        return names
+
+    def _read_block(self, location: List[int]) -> bytes:
+        offset, length = location
+        self._file.seek(offset)
+        return zlib.decompress(self._file.read(length))
+
+    def _read_chunk(self, row_group: Dict, name: str) -> tuple[Optional[bytes], List]:
+        """Return (presence bitmap or None if all present, present values) for one column chunk"""
+        entry = row_group["columns"][name]
+        presence = self._read_block(entry["presence"]) if "presence" in entry else None
+
+        if self._encoding[name] == DICT:
+            dictionary = json_backend.loads(self._read_block(entry["dictionary"]))
+            values = [dictionary[code] for code in _unpack_codes(self._read_block(entry["values"]))]
+        else:
+            values = json_backend.loads(self._read_block(entry["values"]))
+
+        return presence, values
+
+    def read_column(self, name: str) -> List:
+        """Read a single column; rows without the field read as None"""
+        if name not in self._encoding:
+            raise KeyError(f"Unknown column: {name}")
+
+        result = []
+        for row_group in self.row_groups:
+            presence, values = self._read_chunk(row_group, name)
+            if presence is None:
+                result.extend(values)
+                continue
+            present = iter(values)
+            for row in range(row_group["num_rows"]):
+                result.append(next(present) if presence[row >> 3] & (1 << (row & 7)) else None)
+        return result
+
+    def iter_profiles(self, fields: Optional[Iterable[str]] = None) -> Iterator[Dict]:
+        """Yield nested profiles containing only the projected fields"""
+        names = self.resolve_fields(fields)
+        paths = {name: name.split('.') for name in names}
+
+        # Sections that always exist in a unified profile are recreated even when empty
+        sections = {path[0] for path in paths.values() if len(path) > 1}
+
+        for row_group in self.row_groups:
+            chunks = {name: self._read_chunk(row_group, name) for name in names}
+            cursors = {name: iter(values) for name, (_, values) in chunks.items()}
+
+            for row in range(row_group["num_rows"]):
+                profile = {}
+                for name in names:
+                    presence = chunks[name][0]
+                    if presence is not None and not presence[row >> 3] & (1 << (row & 7)):
+                        if paths[name][0] in sections and len(paths[name]) > 1:
+                            profile.setdefault(paths[name][0], {})
+                        continue
+
+                    node = profile
+                    path = paths[name]
+                    for key in path[:-1]:
+                        node = node.setdefault(key, {})
+                    node[path[-1]] = next(cursors[name])
+                yield profile
+
+    def read_profiles(self, fields: Optional[Iterable[str]] = None) -> List[Dict]:
+        """Read all profiles, projected to the given fields"""
+        return list(self.iter_profiles(fields))
+
+
+def read_columnar(path: Path, fields: Optional[Iterable[str]] = None) -> List[Dict]:
+    """Read profiles from a columnar store, projected to the given fields"""
+    with ColumnarReader(path) as reader:
+        return reader.read_profiles(fields)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or create a columnar unified guest store")
+    parser.add_argument("path", type=Path, help="Columnar store (.ugc)")
+    parser.add_argument("--from-json", type=Path, help="Convert this unified JSON file into the store first")
+    parser.add_argument("--fields", nargs="+", help="Fields to project (dotted paths or prefixes)")
+    args = parser.parse_args()
+
+    if args.from_json:
+        count = write_columnar(args.path, json_backend.load(args.from_json))
+        print(f"✓ Wrote {count} profiles to {args.path}", file=sys.stderr)
+
+    with ColumnarReader(args.path) as reader:
+        for profile in reader.iter_profiles(args.fields):
+            print(json.dumps(profile))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Normalized WhiteContext Company Table
+One copy of every WhiteContext company section, shared by all guests who work there.
+
+build_unified_profile() gives every guest the full whitecontext section of their
+company (tldr, business_model, products_services, ...). In the normalized layout
+(unify_data.py --format normalized) those sections are written once:
+
+- unified_companies.json: matched WhiteContext domain -> company section
+- unified_guests_normalized.json: guests whose whitecontext is only
+  {"enriched": true, "company": <domain>, "match": {...}}
+
+In memory, CompanyTable keeps one company section per domain and every guest refers
+to it, whether the profiles were built, loaded from the normalized files or interned
+from a full unified_guests_all.json. expand() turns a normalized guest back into the
+exact build_unified_profile() structure in O(1) (one dict lookup, one shallow dict).
+
+Profiles without a match record (never written by the current unify_data.py) keep
+their whitecontext section inline.
+
+Usage:
+    python company_table.py 258258258                 # full profile from the normalized files
+    python company_table.py --stats                   # companies, references and file sizes
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import json_backend
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_GUESTS_FILE = SCRIPT_DIR / "unified_guests_normalized.json"
+DEFAULT_COMPANIES_FILE = SCRIPT_DIR / "unified_companies.json"
+
+COMPANY_REF = "company"  # whitecontext key holding the company domain in normalized guests
+
+# Company section of the whitecontext field, in build_unified_profile() order
+COMPANY_FIELDS = (
+    "analyzed_at", "source_url", "company_name", "tldr", "context_tags", "business_model",
+    "company_profile", "products_services", "technology_profile", "market_evidence",
+    "contact_information", "company_intelligence", "recognition_credibility", "intelligence_gaps"
+)
+
+
+def whitecontext_view(whitecontext_data: Dict) -> Dict:
+    """Company section of a guest's whitecontext field, from one WhiteContext record"""
+    gtm = whitecontext_data.get("gtm_intelligence", {})
+    return {
+        "analyzed_at": whitecontext_data.get("analyzed_at"),
+        "source_url": whitecontext_data.get("url"),
+        "company_name": whitecontext_data.get("company_name"),
+        "tldr": gtm.get("tldr"),
+        "context_tags": gtm.get("context_tags", []),
+        "business_model": gtm.get("business_model", {}),
+        "company_profile": gtm.get("company_profile", {}),
+        "products_services": gtm.get("products_services", []),
+        "technology_profile": gtm.get("technology_profile", {}),
+        "market_evidence": gtm.get("market_evidence", {}),
+        "contact_information": gtm.get("contact_information", {}),
+        "company_intelligence": gtm.get("company_intelligence", {}),
+        "recognition_credibility": gtm.get("recognition_credibility", {}),
+        "intelligence_gaps": gtm.get("intelligence_gaps", [])
+    }
+
+
+def _company_domain(whitecontext: Dict) -> Optional[str]:
+    """Domain a guest's whitecontext section refers to (None when not enriched or unmatched)"""
+    if not whitecontext.get("enriched"):
+        return None
+    if COMPANY_REF in whitecontext:
+        return whitecontext[COMPANY_REF]
+    match = whitecontext.get("match")
+    return match.get("domain") if match else None
+
+
+class CompanyTable:
+    """
+    Matched WhiteContext domain -> shared company section.
+    Within one run a domain always maps to the same WhiteContext record, so the first
+    section seen for a domain is the one every guest at that company shares.
+    """
+
+    def __init__(self, companies: Optional[Dict[str, Dict]] = None):
+        self.companies: Dict[str, Dict] = dict(companies or {})
+
+    def __len__(self) -> int:
+        return len(self.companies)
+
+    def __contains__(self, domain: str) -> bool:
+        return domain in self.companies
+
+    def __getitem__(self, domain: str) -> Dict:
+        return self.companies[domain]
+
+    def add(self, domain: str, view: Dict) -> Dict:
+        """Register a company section and return the shared one for its domain"""
+        return self.companies.setdefault(sys.intern(domain), view)
+
+    def intern_profile(self, profile: Dict) -> Dict:
+        """Point a full profile's whitecontext section at the shared company section (in place)"""
+        whitecontext = profile["whitecontext"]
+        domain = _company_domain(whitecontext)
+        if domain is None or COMPANY_REF in whitecontext:
+            return profile
+
+        view = self.add(domain, {field: whitecontext[field] for field in COMPANY_FIELDS if field in whitecontext})
+        shared = {"enriched": True, **view}
+        shared.update(
+            (key, value) for key, value in whitecontext.items()
+            if key != "enriched" and key not in COMPANY_FIELDS
+        )
+        profile["whitecontext"] = shared
+        return profile
+
+    def normalize(self, profile: Dict) -> Dict:
+        """Copy of a full profile whose whitecontext only references its company"""
+        whitecontext = profile["whitecontext"]
+        domain = _company_domain(whitecontext)
+        if domain is None or COMPANY_REF in whitecontext:
+            return profile
+
+        self.add(domain, {field: whitecontext[field] for field in COMPANY_FIELDS if field in whitecontext})
+        reference = {"enriched": True, COMPANY_REF: domain}
+        reference.update(
+            (key, value) for key, value in whitecontext.items()
+            if key != "enriched" and key not in COMPANY_FIELDS
+        )
+        return {**profile, "whitecontext": reference}
+
+    def expand(self, profile: Dict) -> Dict:
+        """Full build_unified_profile() view of a normalized profile (O(1))"""
+        whitecontext = profile["whitecontext"]
+        domain = whitecontext.get(COMPANY_REF)
+        if domain is None:
+            return profile
+
+        expanded = {"enriched": True, **self.companies[domain]}
+        expanded.update((key, value) for key, value in whitecontext.items() if key not in ("enriched", COMPANY_REF))
+        return {**profile, "whitecontext": expanded}
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """Companies sorted by domain (stable output across runs)"""
+        return {domain: self.companies[domain] for domain in sorted(self.companies)}
+
+    def save(self, path: Path, pretty: bool = False):
+        json_backend.dump(self.to_dict(), path, pretty)
+
+    @classmethod
+    def load(cls, path: Path) -> "CompanyTable":
+        return cls(json_backend.load(path))
+
+
+def load_normalized(
+    guests_path: Path = DEFAULT_GUESTS_FILE,
+    companies_path: Path = DEFAULT_COMPANIES_FILE
+) -> tuple[List[Dict], CompanyTable]:
+    """Normalized guests and the company table they reference"""
+    companies = CompanyTable.load(companies_path)
+    return json_backend.load(guests_path), companies
+
+
+def intern_profiles(profiles: Iterable[Dict], companies: Optional[CompanyTable] = None) -> Iterator[Dict]:
+    """Full profiles whose company sections are shared per domain (e.g. from unified_guests_all.json)"""
+    companies = companies if companies is not None else CompanyTable()
+    for profile in profiles:
+        yield companies.intern_profile(profile)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Read guests from the normalized unified outputs")
+    parser.add_argument("usernames", nargs="*", help="Usernames to print with their full whitecontext section")
+    parser.add_argument("--guests", type=Path, default=DEFAULT_GUESTS_FILE, help="Normalized guests (default: %(default)s)")
+    parser.add_argument("--companies", type=Path, default=DEFAULT_COMPANIES_FILE, help="Company table (default: %(default)s)")
+    parser.add_argument("--stats", action="store_true", help="Print table size and how many guests share each company")
+    args = parser.parse_args()
+
+    guests, companies = load_normalized(args.guests, args.companies)
+    by_username = {guest["username"]: guest for guest in guests}
+
+    for username in args.usernames:
+        guest = by_username.get(username)
+        if guest is None:
+            print(f"Unknown username: {username}", file=sys.stderr)
+            continue
+        print(json.dumps(companies.expand(guest), indent=2))
+
+    if args.stats:
+        references = sum(1 for guest in guests if COMPANY_REF in guest["whitecontext"])
+        print(f"Guests: {len(guests):,} ({references:,} referencing a company)")
+        print(f"Companies: {len(companies):,} ({references / max(len(companies), 1):.1f} guests per company)")
+        for path in (args.guests, args.companies):
+            print(f"{path.name}: {path.stat().st_size / 1e6:,.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
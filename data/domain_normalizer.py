@@ -0,0 +1,138 @@
+"""
+Shared Domain Normalization
+One domain cleaner for extract_domains.py, clean_domains.py and unify_data.py so
+their join keys agree.
+
+- clean_host(): single compiled-regex pass: drops whitespace, http(s)://, a leading
+  www., and everything from the first /, ? or # on; lowercases
+- normalize_domain(): clean_host() + basic validation (the unify_data.py join key),
+  memoized in a bounded LRU cache
+- registrable_domain(): the name a company registers (acme.com for app.acme.com,
+  acme.co.uk for eng.acme.co.uk), from the bundled public suffix list (public_suffix.py)
+- normalize_domain_key(): normalize_domain() plus its registrable domain, as a DomainKey
+- DomainIndex: host -> value dict that also finds values by registrable domain
+- is_valid_domain(): strict format check used when cleaning domain lists (a bare
+  public suffix like co.uk is not a valid domain)
+- normalize_domains(): batch entry point for lists or pandas Series (vectorized .str)
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+import public_suffix
+
+NORMALIZE_CACHE_SIZE = 1 << 16  # Distinct raw domain strings memoized
+
+# Optional scheme, optional leading www., then the host up to the first path/query/fragment
+HOST_PATTERN = r'^\s*(?:https?://)?(?:www\.)?([^/?#]*)'
+_HOST_RE = re.compile(HOST_PATTERN, re.IGNORECASE)
+
+# At least 4 chars, [a-z0-9.-] only, no leading dot/hyphen, TLD of 2+ chars, no trailing hyphen
+_VALID_DOMAIN_RE = re.compile(r'^(?=.{4})(?![.-])[a-z0-9.-]*\.[a-z0-9-]{2,}(?<!-)$')
+
+
+class DomainKey(NamedTuple):
+    """Join keys of one normalized domain"""
+    host: str  # eng.acme.co.uk
+    registrable: Optional[str]  # acme.co.uk (None when the host is a bare public suffix)
+
+
+def clean_host(value: str) -> Optional[str]:
+    """Strip scheme, www., path, query, fragment and a trailing dot from a URL or domain"""
+    if not value or not isinstance(value, str):
+        return None
+
+    host = _HOST_RE.match(value).group(1).strip().lower().rstrip('.')
+    return host or None
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_cached(value: str) -> Optional[str]:
+    host = clean_host(value)
+
+    # Basic validation
+    if not host or '.' not in host or len(host) < 4:
+        return None
+
+    return host
+
+
+def normalize_domain(value: str) -> Optional[str]:
+    """Normalize a URL or domain into the join key used across the pipeline"""
+    if not value or not isinstance(value, str):
+        return None
+    return _normalize_cached(value)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def registrable_domain(host: str) -> Optional[str]:
+    """Registrable domain of a normalized host: its public suffix plus one label"""
+    return public_suffix.registrable_domain(host)
+
+
+def normalize_domain_key(value: str) -> Optional[DomainKey]:
+    """Normalize a URL or domain into its host and registrable domain"""
+    host = normalize_domain(value)
+    return DomainKey(host, registrable_domain(host)) if host else None
+
+
+def is_valid_domain(domain: str) -> bool:
+    """Validate domain format"""
+    if not domain:
+        return False
+    return _VALID_DOMAIN_RE.match(domain) is not None and registrable_domain(domain) is not None
+
+
+def normalize_domains(values: Iterable):
+    """
+    Normalize many domains at once.
+    A pandas Series is normalized with vectorized .str operations and returned as a
+    Series (invalid/missing -> NaN). Any other iterable returns a list (invalid -> None).
+    """
+    if hasattr(values, "str") and hasattr(values, "where"):
+        hosts = values.str.extract(HOST_PATTERN, flags=re.IGNORECASE, expand=False).str.strip().str.lower().str.rstrip('.')
+        valid = hosts.str.contains('.', regex=False, na=False) & (hosts.str.len() >= 4)
+        return hosts.where(valid)
+
+    return [normalize_domain(value) for value in values]
+
+
+
+class DomainIndex(dict):
+    """
+    Normalized host -> value, also searchable by registrable domain.
+    lookup() tries the host, then its registrable domain as a key (acme.com for
+    app.acme.com), then hosts under the same registrable domain (app.acme.com for
+    acme.com; the shortest host wins when there are several).
+    """
+
+    def __init__(self, items: Optional[Dict] = None):
+        super().__init__()
+        self.by_registrable: Dict[str, str] = {}
+        for host, value in (items or {}).items():
+            self[host] = value
+
+    def __setitem__(self, host: str, value):
+        super().__setitem__(host, value)
+        registrable = registrable_domain(host)
+        if registrable:
+            current = self.by_registrable.get(registrable)
+            if current is None or (len(host), host) < (len(current), current):
+                self.by_registrable[registrable] = host
+
+    def update(self, items: Dict):
+        for host, value in items.items():
+            self[host] = value
+
+    def lookup(self, host: Optional[str]) -> Optional[Tuple[str, str]]:
+        """(key, "domain" | "registrable_domain") of the entry for a host, if any"""
+        if not host:
+            return None
+        if host in self:
+            return host, "domain"
+        registrable = registrable_domain(host)
+        if registrable in self:
+            return registrable, "registrable_domain"
+        key = self.by_registrable.get(registrable)
+        return (key, "registrable_domain") if key else None
@@ -0,0 +1,484 @@
+"""
+LinkedIn Profile Enrichment Script
+Enriches 426 LinkedIn profiles from guest_profiles.json with work emails using FullEnrich API
+
+Strategy:
+1. Load all 426 profiles from guest_profiles.json
+2. Size batches from observed FullEnrich latency (see batch_planner.py)
+3. Submit batches concurrently over one pooled HTTP session, up to MAX_IN_FLIGHT at once
+4. Poll every batch concurrently with adaptive backoff (see fullenrich_client.py)
+5. Save each batch's results as soon as it finishes
+6. Combine all results into one final CSV
+
+Every accepted submission and finished batch is recorded in T2/enrichment_ledger.sqlite
+(see enrichment_ledger.py). Re-running after a crash resumes polling the outstanding
+enrichment ids, skips finished contacts and only submits the rest.
+
+Usage:
+    python enrich_linkedin.py
+    python enrich_linkedin.py --api-base http://127.0.0.1:8765/api/v1  # local fake server
+
+Expected cost: ~300 credits (70% success rate × 426 profiles)
+"""
+
+import os
+import json
+import asyncio
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+from datetime import datetime
+import pandas as pd
+from dotenv import load_dotenv
+
+import json_backend
+from batch_planner import FULLENRICH, WORKLOADS, LatencyHistory, plan_batches, split_evenly
+from enrichment_ledger import EnrichmentLedger, contact_key
+from fullenrich_client import (
+    AsyncFullEnrichClient,
+    FAILED_STATUSES,
+    FULLENRICH_API_BASE,
+    MAX_CONNECTIONS,
+    POLL_INTERVAL_MAX_SECONDS,
+    POLL_INTERVAL_SECONDS,
+)
+
+# ============================================================================
+# LOGGING CONFIGURATION
+# ============================================================================
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s | %(levelname)-8s | %(message)s',
+    datefmt='%H:%M:%S',
+    handlers=[
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler('enrich_linkedin.log', mode='w')
+    ]
+)
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Load environment variables
+load_dotenv()
+
+# FullEnrich API Configuration
+FULLENRICH_API_KEY = os.getenv("FULLENRICH_API_KEY", "YOUR_API_KEY_HERE")
+
+# File paths
+SCRIPT_DIR = Path(__file__).parent
+INPUT_JSON = SCRIPT_DIR / "guest_profiles_enriched.json"  # Use enriched file with LinkedIn URLs
+OUTPUT_DIR = SCRIPT_DIR / "T2"
+LEDGER_DB = OUTPUT_DIR / "enrichment_ledger.sqlite"
+
+LATENCY_HISTORY = OUTPUT_DIR / "batch_latency.json"
+
+# Batch configuration (planned from LATENCY_HISTORY unless --batches is given)
+NUM_BATCHES: Optional[int] = None
+TARGET_BATCH_SECONDS = WORKLOADS[FULLENRICH].target_seconds
+MAX_IN_FLIGHT = WORKLOADS[FULLENRICH].max_concurrency  # Enrichments running at once
+
+# Output configuration
+PRETTY_JSON = False  # Indent saved JSON by 2 spaces instead of writing it compact (--pretty)
+
+# Create output directory
+OUTPUT_DIR.mkdir(exist_ok=True)
+
+
+# ============================================================================
+# DATA PROCESSING
+# ============================================================================
+
+def load_guest_profiles(json_file: Path) -> List[Dict]:
+    """Load guest profiles from JSON"""
+    logger.info(f"Loading guest profiles from: {json_file}")
+
+    if not json_file.exists():
+        logger.error(f"File not found: {json_file}")
+        return []
+
+    profiles = json_backend.load(json_file)
+
+    logger.info(f"✓ Loaded {len(profiles)} profiles")
+    return profiles
+
+
+def prepare_contact_for_api(profile: Dict) -> Optional[Dict]:
+    """Prepare guest profile for FullEnrich API format"""
+    # Skip if no LinkedIn URL
+    linkedin_url = profile.get("linkedIn")
+    if not linkedin_url:
+        return None
+
+    # Try to extract name from metadata first, fallback to name field
+    metadata = profile.get("metadata", {})
+    name = None
+
+    # Check metadata fields for name
+    for value in metadata.values():
+        if value and isinstance(value, str) and len(value) > 2:
+            name = value
+            break
+
+    # Fallback to name field if not in metadata
+    if not name or name == "Unknown":
+        name = profile.get("name", "Unknown")
+
+    # Extract first and last name
+    name_parts = name.strip().split(maxsplit=1)
+    firstname = name_parts[0] if len(name_parts) > 0 else "Unknown"
+    lastname = name_parts[1] if len(name_parts) > 1 else ""
+
+    api_contact = {
+        "firstname": firstname,
+        "lastname": lastname,
+        "linkedin_url": linkedin_url,  # Use the actual LinkedIn URL
+        "custom": {
+            "username": profile.get("username"),
+            "cerebralvalley_url": profile.get("url"),
+            "original_name": name
+        },
+        # ONLY request work emails (1 credit per contact found)
+        "enrich_fields": ["contact.emails"]
+    }
+
+    return api_contact
+
+
+def split_into_batches(profiles: List[Dict], num_batches: int) -> List[List[Dict]]:
+    """Split profiles into equal batches (sizes differ by at most one)"""
+    batches = split_evenly(profiles, num_batches)
+
+    logger.info(f"Split {len(profiles)} profiles into {len(batches)} batches:")
+    for i, batch in enumerate(batches, 1):
+        logger.info(f"  Batch {i}: {len(batch)} profiles")
+
+    return batches
+
+
+def save_batch_results(batch_num: int, results: Dict, output_dir: Path) -> Path:
+    """Save individual batch results to JSON"""
+    output_file = output_dir / f"batch_{batch_num}_results.json"
+
+    json_backend.dump(results, output_file, pretty=PRETTY_JSON)
+
+    logger.info(f"  💾 Saved batch {batch_num} results: {output_file.name}")
+    return output_file
+
+
+def create_enriched_dataframe(all_results: List[Dict]) -> pd.DataFrame:
+    """Create enriched DataFrame from all batch results"""
+    enriched_data = []
+
+    for data in all_results:
+        custom = data.get("custom", {})
+        contact = data.get("contact", {})
+        profile = contact.get("profile", {})
+        position = profile.get("position", {})
+        company = position.get("company", {})
+        hq = company.get("headquarters", {})
+
+        enriched_row = {
+            # Original data
+            "username": custom.get("username"),
+            "original_url": custom.get("original_url"),
+
+            # Email enrichment
+            "email": contact.get("most_probable_email"),
+            "email_status": contact.get("most_probable_email_status"),
+            "emails_found": len(contact.get("emails", [])),
+            "all_emails": json.dumps(contact.get("emails", [])),
+            "domain": contact.get("domain"),
+
+            # LinkedIn Profile
+            "firstname": profile.get("firstname"),
+            "lastname": profile.get("lastname"),
+            "full_name": f"{profile.get('firstname', '')} {profile.get('lastname', '')}".strip(),
+            "linkedin_id": profile.get("linkedin_id"),
+            "linkedin_url": profile.get("linkedin_url"),
+            "location": profile.get("location"),
+            "headline": profile.get("headline"),
+            "summary": profile.get("summary"),
+
+            # Current Position
+            "position_title": position.get("title"),
+            "position_description": position.get("description"),
+
+            # Company Data
+            "company_name": company.get("name"),
+            "company_linkedin_url": company.get("linkedin_url"),
+            "company_website": company.get("website"),
+            "company_domain": company.get("domain"),
+            "company_industry": company.get("industry"),
+            "company_headcount": company.get("headcount"),
+            "company_headcount_range": company.get("headcount_range"),
+
+            # Headquarters
+            "hq_city": hq.get("city"),
+            "hq_region": hq.get("region"),
+            "hq_country": hq.get("country"),
+        }
+        enriched_data.append(enriched_row)
+
+    df = pd.DataFrame(enriched_data)
+    logger.info(f"✓ Created DataFrame with {len(df)} enriched profiles")
+    return df
+
+
+# ============================================================================
+# MAIN PROCESSING
+# ============================================================================
+
+async def run_enrichment(api_base: str, ledger: EnrichmentLedger):
+    """Main enrichment workflow"""
+    start_time = datetime.now()
+    logger.info(f"\nStarting enrichment at {start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+
+    if FULLENRICH_API_KEY == "YOUR_API_KEY_HERE":
+        logger.error("⚠️  FULLENRICH_API_KEY not set in .env file!")
+        logger.error("Please add: FULLENRICH_API_KEY=your_actual_key")
+        sys.exit(1)
+
+    # Initialize client (one pooled session for every request)
+    async with AsyncFullEnrichClient(FULLENRICH_API_KEY, base_url=api_base) as client:
+        # Check credit balance
+        logger.info("\n" + "="*100)
+        logger.info("CHECKING CREDIT BALANCE")
+        logger.info("="*100)
+
+        balance = await client.get_credit_balance()
+        if balance is None:
+            logger.error("Failed to check credit balance - aborting")
+            return
+
+        # Load profiles
+        logger.info("\n" + "="*100)
+        logger.info("LOADING GUEST PROFILES")
+        logger.info("="*100)
+
+        profiles = load_guest_profiles(INPUT_JSON)
+        if not profiles:
+            logger.error("No profiles loaded - aborting")
+            return
+
+        # Prepare contacts for API (filter out None for profiles without LinkedIn)
+        api_contacts = [prepare_contact_for_api(p) for p in profiles]
+        api_contacts = [c for c in api_contacts if c is not None]
+
+        logger.info(f"✓ Prepared {len(api_contacts)} contacts for enrichment")
+        logger.info(f"  Skipped {len(profiles) - len(api_contacts)} profiles without LinkedIn URLs")
+
+        # Resume: skip finished contacts, keep polling enrichments from earlier runs
+        logger.info("\n" + "="*100)
+        logger.info("CHECKING ENRICHMENT LEDGER")
+        logger.info("="*100)
+
+        completed = ledger.completed_contacts()
+        in_flight = ledger.in_flight_contacts()
+        outstanding = ledger.outstanding_enrichments()
+        pending_contacts = [c for c in api_contacts if contact_key(c) not in completed and contact_key(c) not in in_flight]
+
+        logger.info(f"  Already enriched: {len(completed)} contacts")
+        logger.info(f"  In flight from earlier runs: {len(in_flight)} contacts in {len(outstanding)} enrichments")
+        logger.info(f"  To submit now: {len(pending_contacts)} contacts")
+
+        # Estimate cost (only the delta is sent to the API)
+        estimated_cost = len(pending_contacts)  # 1 credit per contact max
+        estimated_actual = int(len(pending_contacts) * 0.7)  # 70% success rate
+
+        logger.info(f"\n📊 COST ESTIMATION:")
+        logger.info(f"  Contacts to submit: {len(pending_contacts)}")
+        logger.info(f"  Max credits (100% success): {estimated_cost}")
+        logger.info(f"  Estimated credits (70% success): {estimated_actual}")
+        logger.info(f"  Current balance: {balance}")
+        logger.info(f"  Balance after: ~{balance - estimated_actual}")
+
+        if balance < estimated_cost:
+            logger.warning(f"⚠️  Might be close on credits! Need ~{estimated_actual}, have {balance}")
+
+        # Plan and split into batches
+        logger.info("\n" + "="*100)
+        logger.info("PLANNING BATCHES")
+        logger.info("="*100)
+
+        history = LatencyHistory(LATENCY_HISTORY)
+        if NUM_BATCHES:
+            num_batches = NUM_BATCHES
+            logger.info(f"Using fixed batch count: {num_batches}")
+        else:
+            plan = plan_batches(len(pending_contacts), FULLENRICH, history, TARGET_BATCH_SECONDS, MAX_IN_FLIGHT)
+            num_batches = plan.num_batches
+            logger.info(f"Plan: {plan.describe()}")
+
+        batches = split_into_batches(pending_contacts, num_batches) if pending_contacts else []
+        total_jobs = len(batches) + len(outstanding)
+
+        # Submit and poll all batches concurrently; results arrive as batches finish
+        logger.info("\n" + "="*100)
+        logger.info("SUBMITTING AND POLLING BATCHES")
+        logger.info("="*100)
+
+        run_name = f"Cerebral Valley Hackathon - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+        finished_now = 0
+
+        async for batch_num, enrichment_id, status, results in client.enrich_batches(
+            batches, run_name,
+            enrichment_ids=outstanding,
+            first_batch_num=ledger.next_batch_num(),
+            on_submitted=ledger.record_submission,
+            max_in_flight=MAX_IN_FLIGHT,
+        ):
+            if status == "FINISHED":
+                finished_now += 1
+                result_file = save_batch_results(batch_num, results, OUTPUT_DIR)
+                ledger.record_finished(enrichment_id, result_file)
+
+                # Feed the planner: contacts and submit-to-finish time of this enrichment.
+                # Enrichments resumed from earlier runs are skipped: their time since
+                # submission includes the downtime between runs.
+                if batch_num not in outstanding:
+                    contacts, submitted_at = ledger.submission(enrichment_id)
+                    history.record(FULLENRICH, contacts, (datetime.now() - submitted_at).total_seconds())
+            elif status in FAILED_STATUSES:
+                ledger.record_failed(enrichment_id, status)
+            elif enrichment_id:
+                logger.warning(f"  ⚠ Batch {batch_num} ({enrichment_id}) still pending - it will be resumed next run")
+            logger.info(f"📊 Completed: {finished_now}/{total_jobs}")
+
+    # Check completion
+    if finished_now < total_jobs:
+        logger.error(f"\n⚠️  Only {finished_now}/{total_jobs} batches completed")
+    else:
+        logger.info(f"\n✓ All {total_jobs} batches completed!")
+
+    # Combine all results (this run and earlier runs recorded in the ledger)
+    logger.info("\n" + "="*100)
+    logger.info("COMBINING RESULTS")
+    logger.info("="*100)
+
+    all_enriched_data = []
+    total_credits = 0
+
+    for batch_num, result_file in ledger.finished_result_files():
+        results = json_backend.load(result_file)
+        batch_data = results.get("datas", [])
+        batch_credits = results.get("cost", {}).get("credits", 0)
+
+        all_enriched_data.extend(batch_data)
+        total_credits += batch_credits
+
+        logger.info(f"  Batch {batch_num}: {len(batch_data)} profiles, {batch_credits} credits")
+
+    logger.info(f"\n✓ Total: {len(all_enriched_data)} enriched profiles, {total_credits} credits used")
+
+    # Create final CSV
+    logger.info("\n" + "="*100)
+    logger.info("CREATING FINAL CSV")
+    logger.info("="*100)
+
+    df = create_enriched_dataframe(all_enriched_data)
+
+    # Calculate stats
+    emails_found = df["email"].notna().sum() if len(df) else 0
+    success_rate = (emails_found / len(df) * 100) if len(df) > 0 else 0
+
+    logger.info(f"\n📊 ENRICHMENT STATS:")
+    logger.info(f"  Total profiles: {len(df)}")
+    logger.info(f"  Emails found: {emails_found} ({success_rate:.1f}%)")
+    if len(df):
+        logger.info(f"  Deliverable: {(df['email_status'] == 'DELIVERABLE').sum()}")
+        logger.info(f"  High probability: {(df['email_status'] == 'HIGH_PROBABILITY').sum()}")
+    logger.info(f"  Credits used: {total_credits}")
+
+    # Save CSV
+    output_csv = OUTPUT_DIR / "cerebralvalley_hackathon_enriched.csv"
+    df.to_csv(output_csv, index=False)
+    logger.info(f"\n✓ Final CSV saved: {output_csv}")
+
+    # Save summary JSON
+    summary = {
+        "timestamp": start_time.isoformat(),
+        "total_profiles": len(df),
+        "emails_found": int(emails_found),
+        "success_rate": float(success_rate),
+        "credits_used": total_credits,
+        "batches_processed": len(ledger.finished_result_files()),
+        "duration_minutes": (datetime.now() - start_time).total_seconds() / 60
+    }
+
+    summary_file = OUTPUT_DIR / "enrichment_summary.json"
+    json_backend.dump(summary, summary_file, pretty=PRETTY_JSON)
+
+    logger.info(f"✓ Summary saved: {summary_file}")
+
+    # Final message
+    end_time = datetime.now()
+    elapsed = (end_time - start_time).total_seconds() / 60
+
+    logger.info("\n" + "="*100)
+    logger.info("ENRICHMENT COMPLETE")
+    logger.info("="*100)
+    logger.info(f"Total time: {elapsed:.1f} minutes")
+    logger.info(f"Results saved to: {OUTPUT_DIR}")
+    logger.info("="*100)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Enrich guest LinkedIn profiles with work emails via FullEnrich")
+    parser.add_argument("--api-base", default=FULLENRICH_API_BASE,
+                        help="FullEnrich API base URL, e.g. a local fake server (default: %(default)s)")
+    parser.add_argument("--ledger", type=Path, default=LEDGER_DB,
+                        help="SQLite job ledger used to resume interrupted runs (default: %(default)s)")
+    parser.add_argument("--batches", type=int, help="Fixed number of batches (default: planned from latency history)")
+    parser.add_argument("--target-minutes", type=float, default=TARGET_BATCH_SECONDS / 60,
+                        help="Target duration of one batch (default: %(default)s)")
+    parser.add_argument("--max-in-flight", type=int, default=MAX_IN_FLIGHT,
+                        help="Enrichments running at the same time (default: %(default)s)")
+    parser.add_argument("--pretty", action="store_true", help="Indent saved JSON by 2 spaces (default: compact)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    global NUM_BATCHES, TARGET_BATCH_SECONDS, MAX_IN_FLIGHT, PRETTY_JSON
+
+    args = parse_args(argv)
+    NUM_BATCHES = args.batches
+    TARGET_BATCH_SECONDS = args.target_minutes * 60
+    MAX_IN_FLIGHT = args.max_in_flight
+    PRETTY_JSON = args.pretty
+
+    logger.info("="*100)
+    logger.info("LINKEDIN PROFILE ENRICHMENT - CEREBRAL VALLEY HACKATHON")
+    logger.info("="*100)
+    logger.info(f"API Base URL: {args.api_base}")
+    logger.info(f"API Key configured: {'Yes' if FULLENRICH_API_KEY != 'YOUR_API_KEY_HERE' else 'No (PLEASE SET IN .env)'}")
+    logger.info(f"Input JSON: {INPUT_JSON}")
+    logger.info(f"Output directory: {OUTPUT_DIR}")
+    logger.info(f"Ledger: {args.ledger}")
+    logger.info(f"Latency history: {LATENCY_HISTORY}")
+    logger.info(f"HTTP connections: {MAX_CONNECTIONS}, poll interval: {POLL_INTERVAL_SECONDS}-{POLL_INTERVAL_MAX_SECONDS}s (adaptive)")
+    logger.info("="*100)
+
+    try:
+        with EnrichmentLedger(args.ledger) as ledger:
+            asyncio.run(run_enrichment(args.api_base, ledger))
+    except Exception as e:
+        logger.error(f"Enrichment failed: {str(e)}", exc_info=True)
+        raise
+
+
+if __name__ == "__main__":
+    logger.info("\n")
+    logger.info("╔════════════════════════════════════════════════════════════════════════════╗")
+    logger.info("║        CEREBRAL VALLEY HACKATHON - LINKEDIN ENRICHMENT                     ║")
+    logger.info("║                     426 Profiles → Work Emails                             ║")
+    logger.info("╚════════════════════════════════════════════════════════════════════════════╝")
+    logger.info("\n")
+
+    main()
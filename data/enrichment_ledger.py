@@ -0,0 +1,208 @@
+"""
+Durable FullEnrich Job Ledger
+SQLite record of every contact enrich_linkedin.py has sent to FullEnrich, so a
+crashed or interrupted run can resume without paying for contacts twice.
+
+Tables:
+- enrichments: enrichment_id -> batch number, name, status, result file
+- contacts:    contact key (guest username, else LinkedIn URL) -> batch, enrichment_id,
+               status, result file
+
+Contact / enrichment statuses:
+- SUBMITTED: accepted by the API, not finished yet (resume polling on restart)
+- FINISHED:  results saved to result_file (skip on restart)
+- FAILED:    the API canceled it or ran out of credits (contacts are sent again)
+
+Every write commits immediately, so an enrichment_id is on disk as soon as the
+API has accepted the submission.
+
+Usage:
+    python enrichment_ledger.py                 # status summary
+    python enrichment_ledger.py --db path.sqlite
+"""
+
+import argparse
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_LEDGER_DB = SCRIPT_DIR / "T2" / "enrichment_ledger.sqlite"
+
+SUBMITTED = "SUBMITTED"
+FINISHED = "FINISHED"
+FAILED = "FAILED"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS enrichments (
+    enrichment_id TEXT PRIMARY KEY,
+    batch_num INTEGER NOT NULL,
+    name TEXT,
+    status TEXT NOT NULL,
+    api_status TEXT,
+    contacts INTEGER NOT NULL,
+    result_file TEXT,
+    submitted_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS contacts (
+    contact_key TEXT PRIMARY KEY,
+    batch_num INTEGER NOT NULL,
+    enrichment_id TEXT NOT NULL REFERENCES enrichments(enrichment_id),
+    status TEXT NOT NULL,
+    result_file TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS contacts_by_enrichment ON contacts(enrichment_id);
+"""
+
+
+def contact_key(contact: Dict) -> Optional[str]:
+    """Stable identity of an API contact: the guest username, else the LinkedIn URL"""
+    custom = contact.get("custom") or {}
+    return custom.get("username") or contact.get("linkedin_url")
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class EnrichmentLedger:
+    """Persistent contact -> enrichment status table backed by SQLite"""
+
+    def __init__(self, path: Path = DEFAULT_LEDGER_DB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=FULL")
+        self._db.executescript(SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self) -> "EnrichmentLedger":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    # ------------------------------------------------------------------------
+    # READS
+    # ------------------------------------------------------------------------
+
+    def _contacts_with_status(self, status: str) -> Set[str]:
+        rows = self._db.execute("SELECT contact_key FROM contacts WHERE status = ?", (status,))
+        return {key for (key,) in rows}
+
+    def completed_contacts(self) -> Set[str]:
+        """Contacts whose results are already saved"""
+        return self._contacts_with_status(FINISHED)
+
+    def in_flight_contacts(self) -> Set[str]:
+        """Contacts submitted in an earlier run that have not finished yet"""
+        return self._contacts_with_status(SUBMITTED)
+
+    def outstanding_enrichments(self) -> Dict[int, str]:
+        """batch_num -> enrichment_id for every enrichment still worth polling"""
+        rows = self._db.execute(
+            "SELECT batch_num, enrichment_id FROM enrichments WHERE status = ? ORDER BY batch_num", (SUBMITTED,)
+        )
+        return dict(rows.fetchall())
+
+    def finished_result_files(self) -> List[Tuple[int, str]]:
+        """(batch_num, result file) of every finished enrichment"""
+        rows = self._db.execute(
+            "SELECT batch_num, result_file FROM enrichments WHERE status = ? ORDER BY batch_num", (FINISHED,)
+        )
+        return rows.fetchall()
+
+    def submission(self, enrichment_id: str) -> Optional[Tuple[int, datetime]]:
+        """(contacts, submitted_at) of a recorded enrichment"""
+        row = self._db.execute(
+            "SELECT contacts, submitted_at FROM enrichments WHERE enrichment_id = ?", (enrichment_id,)
+        ).fetchone()
+        return (row[0], datetime.fromisoformat(row[1])) if row else None
+
+    def next_batch_num(self) -> int:
+        """First batch number not used by any recorded enrichment"""
+        (last,) = self._db.execute("SELECT MAX(batch_num) FROM enrichments").fetchone()
+        return (last or 0) + 1
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Counts per status for enrichments and contacts"""
+        return {
+            table: dict(self._db.execute(f"SELECT status, COUNT(*) FROM {table} GROUP BY status").fetchall())
+            for table in ("enrichments", "contacts")
+        }
+
+    # ------------------------------------------------------------------------
+    # WRITES
+    # ------------------------------------------------------------------------
+
+    def record_submission(self, batch_num: int, enrichment_id: str, name: str, contacts: Iterable[Dict]):
+        """Record an accepted submission and mark its contacts SUBMITTED"""
+        now = _now()
+        keys = [key for key in map(contact_key, contacts) if key]
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO enrichments VALUES (?, ?, ?, ?, NULL, ?, NULL, ?, ?)",
+                (enrichment_id, batch_num, name, SUBMITTED, len(keys), now, now),
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO contacts VALUES (?, ?, ?, ?, NULL, ?)",
+                [(key, batch_num, enrichment_id, SUBMITTED, now) for key in keys],
+            )
+
+    def record_finished(self, enrichment_id: str, result_file: Path):
+        """Mark an enrichment and its contacts FINISHED with their saved result file"""
+        self._record_outcome(enrichment_id, FINISHED, FINISHED, str(result_file))
+
+    def record_failed(self, enrichment_id: str, api_status: str):
+        """Mark an enrichment FAILED so its contacts are sent again next run"""
+        self._record_outcome(enrichment_id, FAILED, api_status, None)
+
+    def _record_outcome(self, enrichment_id: str, status: str, api_status: str, result_file: Optional[str]):
+        now = _now()
+        with self._db:
+            self._db.execute(
+                "UPDATE enrichments SET status = ?, api_status = ?, result_file = ?, updated_at = ? WHERE enrichment_id = ?",
+                (status, api_status, result_file, now, enrichment_id),
+            )
+            self._db.execute(
+                "UPDATE contacts SET status = ?, result_file = ?, updated_at = ? WHERE enrichment_id = ?",
+                (status, result_file, now, enrichment_id),
+            )
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the FullEnrich job ledger")
+    parser.add_argument("--db", type=Path, default=DEFAULT_LEDGER_DB, help="Ledger database (default: %(default)s)")
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        print(f"No ledger at {args.db}")
+        return
+
+    with EnrichmentLedger(args.db) as ledger:
+        summary = ledger.summary()
+        for table, counts in summary.items():
+            total = sum(counts.values())
+            breakdown = ", ".join(f"{status}: {count}" for status, count in sorted(counts.items())) or "empty"
+            print(f"{table}: {total} ({breakdown})")
+
+        outstanding = ledger.outstanding_enrichments()
+        if outstanding:
+            print("Outstanding enrichments (polled on the next run):")
+            for batch_num, enrichment_id in outstanding.items():
+                print(f"  Batch {batch_num}: {enrichment_id}")
+
+
+if __name__ == "__main__":
+    main()
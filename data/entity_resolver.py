@@ -0,0 +1,329 @@
+"""
+Company Entity Resolution
+Matches a FullEnrich company to a WhiteContext company when the exact normalized
+domain join in unify_data.py misses (subsidiary hosts, .io vs .com, email domains
+that differ from the corporate site, renamed sites).
+
+Keys indexed per WhiteContext company:
+- LinkedIn company key: slug or numeric id from any linkedin.com/company/ URL
+- registrable domain: app.acme.com -> acme.com
+- brand: the registrable label without its suffix (acme.io and acme.com -> acme)
+- name: normalized company name (lowercased, punctuation and legal suffixes dropped)
+
+Candidate generation is a blocking index, so a lookup never scans every company:
+exact-key dictionaries for the first three keys and MinHash LSH buckets over
+character 3-grams of the name. Buckets holding more than MAX_BUCKET_SIZE companies
+are ignored (they only encode common n-grams).
+
+Each candidate is scored; the best one at or above the minimum confidence wins
+unless a different company scores within AMBIGUITY_MARGIN of it.
+
+Confidence:
+- domain              1.00  exact normalized domain (the unify_data.py join)
+- linkedin            0.98  same LinkedIn company page
+- registrable_domain  0.95  same registrable domain, different host
+- brand               0.60 + 0.34 x name similarity (a shared brand alone stays below
+                      the minimum confidence; the names must mostly agree too)
+- name                0.90 x name similarity (3-gram Jaccard; numbers must agree)
+"""
+
+import heapq
+import random
+import re
+import unicodedata
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+from domain_normalizer import normalize_domain, registrable_domain
+
+MIN_CONFIDENCE = 0.8
+AMBIGUITY_MARGIN = 0.02  # Reject when another company scores this close to the best
+MIN_BRAND_LENGTH = 4  # Shorter brands ("ai", "get") are too generic to match on
+MAX_BUCKET_SIZE = 50
+
+# MinHash LSH: NUM_BANDS bands of BAND_ROWS hashes (candidate threshold ~ Jaccard 0.5;
+# a name-only match needs ~0.89, found with probability > 0.999)
+NUM_BANDS = 8
+BAND_ROWS = 3
+MINHASH_SEED = 1
+SHINGLE_CACHE_SIZE = 1 << 16  # Distinct 3-grams whose MinHash values are memoized
+_MERSENNE_PRIME = (1 << 31) - 1
+
+LEGAL_SUFFIXES = {
+    "inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation", "co", "plc", "gmbh",
+    "ag", "sa", "sas", "srl", "spa", "bv", "nv", "pty", "oy", "ab", "kk", "the"
+}
+
+SCORE_LINKEDIN = 0.98
+SCORE_REGISTRABLE_DOMAIN = 0.95
+SCORE_BRAND = 0.60  # Below MIN_CONFIDENCE: brands collide across unrelated companies
+SCORE_BRAND_NAME_WEIGHT = 0.34  # Brand matches stay below registrable_domain
+SCORE_NAME_WEIGHT = 0.90
+
+_LINKEDIN_COMPANY_RE = re.compile(r'linkedin\.com/(?:company|school|showcase)/([^/?#\s]+)', re.IGNORECASE)
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+_rng = random.Random(MINHASH_SEED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_BANDS * BAND_ROWS)
+]
+
+
+@dataclass
+class CompanyMatch:
+    """A resolved WhiteContext company for one profile"""
+    domain: str  # WhiteContext join key
+    method: str
+    confidence: float
+
+    def to_dict(self) -> Dict:
+        return {"domain": self.domain, "method": self.method, "confidence": round(self.confidence, 3)}
+
+
+# ============================================================================
+# KEY NORMALIZATION
+# ============================================================================
+
+def normalize_company_name(name: str) -> Optional[str]:
+    """Lowercase, strip accents and punctuation, drop legal suffixes ("Acme, Inc." -> "acme")"""
+    if not name or not isinstance(name, str):
+        return None
+
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    tokens = _NON_ALNUM_RE.sub(" ", ascii_name.lower().replace("&", " and ")).split()
+    tokens = [token for token in tokens if token not in LEGAL_SUFFIXES] or tokens
+    return " ".join(tokens) or None
+
+
+def linkedin_company_key(value) -> Optional[str]:
+    """Slug or numeric id of a LinkedIn company URL (a bare id is returned as is)"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return value
+    match = _LINKEDIN_COMPANY_RE.search(value)
+    return match.group(1).lower() if match else None
+
+
+def domain_brand(registrable: Optional[str]) -> Optional[str]:
+    """First label of a registrable domain, if long enough to identify a company"""
+    if not registrable:
+        return None
+    brand = registrable.split('.', 1)[0]
+    return brand if len(brand) >= MIN_BRAND_LENGTH else None
+
+
+def find_linkedin_keys(value, keys: Optional[Set[str]] = None) -> Set[str]:
+    """LinkedIn company keys of every linkedin.com/company/ URL nested anywhere in value"""
+    keys = set() if keys is None else keys
+    if isinstance(value, str):
+        key = linkedin_company_key(value) if "linkedin.com" in value.lower() else None
+        if key:
+            keys.add(key)
+    elif isinstance(value, dict):
+        for item in value.values():
+            find_linkedin_keys(item, keys)
+    elif isinstance(value, list):
+        for item in value:
+            find_linkedin_keys(item, keys)
+    return keys
+
+
+def whitecontext_linkedin_keys(result: Dict) -> Set[str]:
+    """LinkedIn company keys of a WhiteContext result (top-level URL fields and contact_information)"""
+    keys = find_linkedin_keys([value for value in result.values() if isinstance(value, str)])
+    contact_information = (result.get("gtm_intelligence") or {}).get("contact_information")
+    return find_linkedin_keys(contact_information, keys)
+
+
+# ============================================================================
+# SIMILARITY
+# ============================================================================
+
+def name_shingles(name: str) -> Set[str]:
+    """Character 3-grams of a normalized name (padded, so short names still shingle)"""
+    padded = f" {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def name_numbers(name: str) -> frozenset:
+    """Tokens of a normalized name that contain digits"""
+    return frozenset(token for token in name.split() if not token.isalpha())
+
+
+def name_similarity(a: str, b: str) -> float:
+    """3-gram Jaccard of two normalized names; 0 when their numbers differ ("web2" vs "web3")"""
+    if a == b:
+        return 1.0
+    if name_numbers(a) != name_numbers(b):
+        return 0.0
+    a_shingles, b_shingles = name_shingles(a), name_shingles(b)
+    return len(a_shingles & b_shingles) / len(a_shingles | b_shingles)
+
+
+@lru_cache(maxsize=SHINGLE_CACHE_SIZE)
+def _shingle_hashes(shingle: str) -> Tuple[int, ...]:
+    h = zlib.crc32(shingle.encode("utf-8")) & _MERSENNE_PRIME
+    return tuple((a * h + b) % _MERSENNE_PRIME for a, b in _PERMUTATIONS)
+
+
+def minhash_bands(shingles: Set[str]) -> List[Tuple]:
+    """LSH band keys of a shingle set"""
+    # Column-wise min over the memoized per-shingle hashes runs in C
+    signature = list(map(min, zip(*map(_shingle_hashes, shingles))))
+    return [(band, *signature[band * BAND_ROWS:(band + 1) * BAND_ROWS]) for band in range(NUM_BANDS)]
+
+
+# ============================================================================
+# RESOLVER
+# ============================================================================
+
+class _CompanyKeys:
+    """Normalized keys of one company (WhiteContext record or FullEnrich query)"""
+
+    __slots__ = ("registrables", "brands", "linkedin", "name", "shingles", "numbers")
+
+    def __init__(self, domains: List[str], linkedin: Set[str], name: Optional[str]):
+        self.registrables = {r for r in map(registrable_domain, domains) if r}
+        self.brands = {b for b in map(domain_brand, self.registrables) if b}
+        self.linkedin = linkedin
+        self.name = normalize_company_name(name)
+        self.shingles = name_shingles(self.name) if self.name else None
+        self.numbers = name_numbers(self.name) if self.name else None
+
+    def name_similarity(self, other: "_CompanyKeys") -> float:
+        """name_similarity() on the precomputed shingles"""
+        if not (self.name and other.name) or self.numbers != other.numbers:
+            return 0.0
+        if self.name == other.name:
+            return 1.0
+        return len(self.shingles & other.shingles) / len(self.shingles | other.shingles)
+
+
+class CompanyResolver:
+    """Blocking index over WhiteContext companies (normalized domain -> result)"""
+
+    def __init__(self, whitecontext_by_domain: Dict[str, Dict], min_confidence: float = MIN_CONFIDENCE):
+        self.min_confidence = min_confidence
+        self.companies: Dict[str, _CompanyKeys] = {}
+        self.by_linkedin: Dict[str, List[str]] = defaultdict(list)
+        self.by_registrable: Dict[str, List[str]] = defaultdict(list)
+        self.by_brand: Dict[str, List[str]] = defaultdict(list)
+        self.by_band: Dict[Tuple, List[str]] = defaultdict(list)
+        self._cache: Dict[Tuple, Optional[CompanyMatch]] = {}
+
+        for domain, result in whitecontext_by_domain.items():
+            self.add(domain, result.get("company_name"), whitecontext_linkedin_keys(result))
+
+    def __len__(self) -> int:
+        return len(self.companies)
+
+    def add(self, domain: str, company_name: Optional[str], linkedin_keys: Set[str]):
+        """Index one WhiteContext company under its join key"""
+        keys = _CompanyKeys([domain], linkedin_keys, company_name)
+        self.companies[domain] = keys
+        for key in keys.linkedin:
+            self.by_linkedin[key].append(domain)
+        for key in keys.registrables:
+            self.by_registrable[key].append(domain)
+        for key in keys.brands:
+            self.by_brand[key].append(domain)
+        if keys.shingles:
+            for band in minhash_bands(keys.shingles):
+                self.by_band[band].append(domain)
+        self._cache.clear()
+
+    def _key_candidates(self, query: _CompanyKeys) -> Set[str]:
+        """Companies sharing a LinkedIn page, registrable domain or brand"""
+        candidates = set()
+        for key in query.linkedin:
+            candidates.update(self.by_linkedin.get(key, ()))
+        for key in query.registrables:
+            candidates.update(self.by_registrable.get(key, ()))
+        for key in query.brands:
+            candidates.update(self.by_brand.get(key, ()))
+        return candidates
+
+    def _name_candidates(self, query: _CompanyKeys) -> Set[str]:
+        """Companies colliding with the query name in at least one LSH band"""
+        candidates = set()
+        if query.shingles:
+            for band in minhash_bands(query.shingles):
+                bucket = self.by_band.get(band, ())
+                if len(bucket) <= MAX_BUCKET_SIZE:
+                    candidates.update(bucket)
+        return candidates
+
+    def _score(self, query: _CompanyKeys, company: _CompanyKeys) -> Tuple[float, str]:
+        similarity = query.name_similarity(company)
+        scores = [(SCORE_NAME_WEIGHT * similarity, "name")]
+        if query.linkedin & company.linkedin:
+            scores.append((SCORE_LINKEDIN, "linkedin"))
+        if query.registrables & company.registrables:
+            scores.append((SCORE_REGISTRABLE_DOMAIN, "registrable_domain"))
+        if query.brands & company.brands:
+            scores.append((SCORE_BRAND + SCORE_BRAND_NAME_WEIGHT * similarity, "brand"))
+        return max(scores)
+
+    def resolve(self, domains: List[str], linkedin_keys: Set[str], company_name: Optional[str]) -> Optional[CompanyMatch]:
+        """
+        Best WhiteContext company for a company known by these normalized domains,
+        LinkedIn keys and name; None below the minimum confidence or when ambiguous.
+        """
+        cache_key = (tuple(domains), frozenset(linkedin_keys), company_name)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
+        for domain in domains:
+            if domain in self.companies:
+                match = CompanyMatch(domain, "domain", 1.0)
+                break
+        else:
+            match = self._resolve_fuzzy(_CompanyKeys(domains, linkedin_keys, company_name))
+
+        self._cache[cache_key] = match
+        return match
+
+    def _resolve_fuzzy(self, query: _CompanyKeys) -> Optional[CompanyMatch]:
+        # Scores below this can neither win nor make the winner ambiguous
+        floor = self.min_confidence - AMBIGUITY_MARGIN
+
+        key_candidates = self._key_candidates(query)
+        scored = [self._score(query, self.companies[domain]) + (domain,) for domain in key_candidates]
+
+        # Name-only candidates score at most SCORE_NAME_WEIGHT, so they only matter when
+        # no key match clearly beats that; most of them differ in their numbers
+        decided = any(score > SCORE_NAME_WEIGHT + AMBIGUITY_MARGIN for score, _, _ in scored)
+        for domain in set() if decided else self._name_candidates(query) - key_candidates:
+            company = self.companies[domain]
+            if company.numbers == query.numbers:
+                score = SCORE_NAME_WEIGHT * query.name_similarity(company)
+                if score >= floor:
+                    scored.append((score, "name", domain))
+
+        best = heapq.nlargest(2, (entry for entry in scored if entry[0] >= floor))
+        if not best or best[0][0] < self.min_confidence:
+            return None
+        confidence, method, domain = best[0]
+        if len(best) > 1 and best[1][0] >= confidence - AMBIGUITY_MARGIN:
+            return None
+        return CompanyMatch(domain, method, confidence)
+
+    def resolve_fullenrich(self, fullenrich_data: Dict) -> Optional[CompanyMatch]:
+        """Resolve the company of a FullEnrich record (domain, website, email domain, LinkedIn, name)"""
+        contact = fullenrich_data.get("contact", {})
+        company = contact.get("profile", {}).get("position", {}).get("company", {})
+
+        domains = []
+        for value in (company.get("domain"), company.get("website"), contact.get("domain")):
+            normalized = normalize_domain(value)
+            if normalized and normalized not in domains:
+                domains.append(normalized)
+
+        linkedin_keys = {key for key in map(linkedin_company_key, (company.get("linkedin_url"), company.get("linkedin_id"))) if key}
+        return self.resolve(domains, linkedin_keys, company.get("name"))
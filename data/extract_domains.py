@@ -2,12 +2,19 @@
 Extract Unique Domains from Enriched CSV
 Extracts all unique company domains and email domains from the enriched profiles
 Saves to unique_domains.txt
+
+The CSV is read in chunks (domain columns only) and every source is extracted
+with vectorized pandas .str operations, so memory stays bounded by the number of
+unique domains rather than the number of rows.
 """
 
 import pandas as pd
 from pathlib import Path
+from typing import Dict, List, Tuple
 import logging
 
+from domain_normalizer import normalize_domains
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,16 +27,62 @@ logger = logging.getLogger(__name__)
 SCRIPT_DIR = Path(__file__).parent
 INPUT_CSV = SCRIPT_DIR / "T2" / "cerebralvalley_hackathon_enriched.csv"
 OUTPUT_TXT = SCRIPT_DIR / "T2" / "unique_domains.txt"
+CHUNK_SIZE = 100_000  # CSV rows parsed per chunk
+DOMAIN_COLUMNS = ['company_domain', 'domain', 'email', 'company_website']
+
+def extract_domains_from_emails(emails: pd.Series) -> pd.Series:
+    """Normalized domains of email addresses: the host after the last @ (vectorized)"""
+    emails = emails.dropna()
+    emails = emails[emails.str.contains('@', regex=False)]
+    return normalize_domains(emails.str.rsplit('@', n=1).str[-1]).dropna()
+
+def distinct(values: pd.Series) -> pd.Series:
+    """Drop missing and repeated values so string ops run once per distinct value"""
+    return pd.Series(values.dropna().unique(), dtype=values.dtype)
+
+def extract_chunk_domains(chunk: pd.DataFrame) -> Dict[str, pd.Series]:
+    """Extract candidate domains from one CSV chunk, keyed by source column"""
+    found = {}
+
+    # Every source goes through the normalizer unify_data.py joins on
+
+    # 1. Company domains (from enriched company data)
+    if 'company_domain' in chunk.columns:
+        found['company_domain'] = normalize_domains(distinct(chunk['company_domain'])).dropna()
+
+    # 2. Email domains (from enriched emails)
+    if 'domain' in chunk.columns:
+        found['domain'] = normalize_domains(distinct(chunk['domain'])).dropna()
+
+    # 3. Extract domains from email addresses directly
+    if 'email' in chunk.columns:
+        found['email'] = extract_domains_from_emails(distinct(chunk['email']))
+
+    # 4. Company website domains
+    if 'company_website' in chunk.columns:
+        found['company_website'] = normalize_domains(distinct(chunk['company_website'])).dropna()
+
+    return found
 
-def extract_domain_from_email(email: str) -> str:
-    """Extract domain from email address"""
-    if pd.isna(email) or not email:
-        return None
+def extract_unique_domains(csv_path: Path, chunk_size: int = CHUNK_SIZE) -> Tuple[List[str], Dict[str, int], int]:
+    """
+    Extract all unique domains from the enriched CSV, reading it in chunks.
+    Only the domain columns are parsed and only the unique domains stay resident.
+    Returns (sorted domains, unique domains per source column, rows read)
+    """
+    domains_by_source: Dict[str, set] = {}
+    total_rows = 0
 
-    if '@' in email:
-        return email.split('@')[1].strip().lower()
+    chunks = pd.read_csv(csv_path, usecols=lambda column: column in DOMAIN_COLUMNS, dtype=str, chunksize=chunk_size)
+    for chunk in chunks:
+        total_rows += len(chunk)
+        for source, found in extract_chunk_domains(chunk).items():
+            domains_by_source.setdefault(source, set()).update(found.unique())
 
-    return None
+    domains = set().union(*domains_by_source.values())
+
+    counts = {source: len(found) for source, found in domains_by_source.items()}
+    return sorted(domains), counts, total_rows
 
 def main():
     logger.info("="*80)
@@ -42,52 +95,19 @@ def main():
         logger.error("Please run enrich_linkedin.py first")
         return
 
-    # Load CSV
-    logger.info(f"Loading CSV: {INPUT_CSV}")
-    df = pd.read_csv(INPUT_CSV)
-    logger.info(f"✓ Loaded {len(df)} profiles")
-
-    # Extract domains from multiple sources
-    domains = set()
-
-    # 1. Company domains (from enriched company data)
-    if 'company_domain' in df.columns:
-        company_domains = df['company_domain'].dropna().str.strip().str.lower()
-        domains.update(company_domains.tolist())
-        logger.info(f"  Found {len(company_domains.unique())} unique company domains")
-
-    # 2. Email domains (from enriched emails)
-    if 'domain' in df.columns:
-        email_domains = df['domain'].dropna().str.strip().str.lower()
-        domains.update(email_domains.tolist())
-        logger.info(f"  Found {len(email_domains.unique())} unique email domains")
-
-    # 3. Extract domains from email addresses directly
-    if 'email' in df.columns:
-        extracted_domains = df['email'].apply(extract_domain_from_email).dropna()
-        domains.update(extracted_domains.tolist())
-        logger.info(f"  Extracted {len(extracted_domains.unique())} domains from email addresses")
-
-    # 4. Company website domains (extract domain from full URL)
-    if 'company_website' in df.columns:
-        website_domains = df['company_website'].dropna()
-        for url in website_domains:
-            if pd.notna(url) and isinstance(url, str):
-                # Remove protocol
-                domain = url.replace('https://', '').replace('http://', '')
-                # Remove www.
-                domain = domain.replace('www.', '')
-                # Remove path
-                domain = domain.split('/')[0].strip().lower()
-                if domain:
-                    domains.add(domain)
-        logger.info(f"  Extracted {len(website_domains.unique())} domains from company websites")
-
-    # Remove invalid domains
-    domains = {d for d in domains if d and '.' in d and len(d) > 3}
-
-    # Sort domains
-    sorted_domains = sorted(domains)
+    # Load CSV in chunks and extract domains from multiple sources
+    logger.info(f"Loading CSV: {INPUT_CSV} (chunks of {CHUNK_SIZE} rows)")
+    sorted_domains, counts, total_rows = extract_unique_domains(INPUT_CSV)
+    logger.info(f"✓ Loaded {total_rows} profiles")
+
+    if 'company_domain' in counts:
+        logger.info(f"  Found {counts['company_domain']} unique company domains")
+    if 'domain' in counts:
+        logger.info(f"  Found {counts['domain']} unique email domains")
+    if 'email' in counts:
+        logger.info(f"  Extracted {counts['email']} domains from email addresses")
+    if 'company_website' in counts:
+        logger.info(f"  Extracted {counts['company_website']} domains from company websites")
 
     logger.info(f"\n✓ Total unique domains: {len(sorted_domains)}")
 
@@ -0,0 +1,316 @@
+"""
+Async FullEnrich API Client
+One pooled aiohttp session shared by every request; all enrichments are submitted
+and polled concurrently, so a run takes as long as its slowest batch.
+
+Polling backs off per enrichment instead of sleeping on a fixed interval:
+- CREATED / IN_PROGRESS: the poll delay grows by POLL_BACKOFF_FACTOR up to POLL_INTERVAL_MAX_SECONDS
+- RATE_LIMIT (batch status) or HTTP 429: the delay grows by RATE_LIMIT_BACKOFF_FACTOR,
+  honoring Retry-After when the server sends it
+- FINISHED / CANCELED / CREDITS_INSUFFICIENT end polling for that enrichment
+
+Usage:
+    async with AsyncFullEnrichClient(api_key) as client:
+        async for batch_num, enrichment_id, status, results in client.enrich_batches(batches, "My run"):
+            ...
+
+base_url can point at a local fake server (see benchmarks/fake_fullenrich.py).
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+FULLENRICH_API_BASE = "https://app.fullenrich.com/api/v1"
+
+# Connection pool
+MAX_CONNECTIONS = 10  # Concurrent HTTP connections in the shared session
+REQUEST_TIMEOUT_SECONDS = 30
+
+# Adaptive polling
+POLL_INTERVAL_SECONDS = 10  # First delay after a submission / IN_PROGRESS
+POLL_INTERVAL_MAX_SECONDS = 60  # Upper bound for any single wait
+POLL_BACKOFF_FACTOR = 1.5  # Growth while a batch is still IN_PROGRESS
+RATE_LIMIT_BACKOFF_FACTOR = 2.0  # Growth on RATE_LIMIT / HTTP 429
+POLL_JITTER = 0.1  # +/- fraction applied to each wait so batches don't poll in lockstep
+MAX_POLL_SECONDS = 30 * 60  # Give up on an enrichment after 30 minutes
+MAX_SUBMIT_RETRIES = 5  # Rate-limited submissions retried this many times
+
+PENDING_STATUSES = {"CREATED", "IN_PROGRESS"}
+FAILED_STATUSES = {"CANCELED", "CREDITS_INSUFFICIENT", "UNKNOWN"}
+
+# Outcomes reported by the client itself (the enrichment may still be running server-side)
+TIMEOUT = "TIMEOUT"
+REQUEST_FAILED = "REQUEST_FAILED"
+SUBMIT_FAILED = "SUBMIT_FAILED"
+
+
+class RateLimited(Exception):
+    """HTTP 429 from the API"""
+
+    def __init__(self, retry_after: Optional[float] = None):
+        super().__init__("Rate limit exceeded - slow down requests")
+        self.retry_after = retry_after
+
+
+class AdaptiveDelay:
+    """Per-enrichment poll delay: grows while pending, grows faster when rate limited"""
+
+    def __init__(self, initial: float = POLL_INTERVAL_SECONDS, maximum: float = POLL_INTERVAL_MAX_SECONDS):
+        self.initial = initial
+        self.maximum = maximum
+        self.current = initial
+
+    def _jittered(self, value: float) -> float:
+        return value * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+
+    def pending(self) -> float:
+        """Delay before the next poll of a still-running enrichment"""
+        delay = self.current
+        self.current = min(self.current * POLL_BACKOFF_FACTOR, self.maximum)
+        return self._jittered(delay)
+
+    def rate_limited(self, retry_after: Optional[float] = None) -> float:
+        """Delay after the API asked us to slow down"""
+        self.current = min(max(self.current * RATE_LIMIT_BACKOFF_FACTOR, retry_after or 0), self.maximum)
+        return self._jittered(self.current)
+
+
+class AsyncFullEnrichClient:
+    """FullEnrich API client on a pooled aiohttp session"""
+
+    def __init__(self, api_key: str, base_url: str = FULLENRICH_API_BASE,
+                 max_connections: int = MAX_CONNECTIONS,
+                 poll_interval: float = POLL_INTERVAL_SECONDS,
+                 max_poll_interval: float = POLL_INTERVAL_MAX_SECONDS,
+                 max_poll_seconds: float = MAX_POLL_SECONDS):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        self.max_connections = max_connections
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_poll_seconds = max_poll_seconds
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncFullEnrichClient":
+        self._session = aiohttp.ClientSession(
+            headers=self.headers,
+            connector=aiohttp.TCPConnector(limit=self.max_connections),
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
+        )
+        logger.info(f"FullEnrich client initialized ({self.max_connections} pooled connections)")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._session.close()
+        self._session = None
+        return False
+
+    # ------------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------------
+
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Tuple[bool, Optional[Dict], Optional[str]]:
+        """Make HTTP request to FullEnrich API; raises RateLimited on 429"""
+        if self._session is None:
+            raise RuntimeError("AsyncFullEnrichClient must be used as 'async with'")
+
+        url = f"{self.base_url}{endpoint}"
+        logger.debug(f"API Request: {method} {endpoint}")
+
+        try:
+            async with self._session.request(method, url, json=data) as response:
+                logger.debug(f"Response status: {response.status}")
+
+                if response.status == 401:
+                    return False, None, "Authentication failed - check your API key"
+
+                if response.status == 429:
+                    retry_after = response.headers.get("Retry-After")
+                    raise RateLimited(float(retry_after) if retry_after and retry_after.isdigit() else None)
+
+                if response.status >= 400:
+                    return False, None, f"API error: {response.status} - {await response.text()}"
+
+                return True, await response.json(), None
+
+        except RateLimited:
+            raise
+        except Exception as e:
+            return False, None, f"Request error: {str(e)}"
+
+    # ------------------------------------------------------------------------
+    # ENDPOINTS
+    # ------------------------------------------------------------------------
+
+    async def get_credit_balance(self) -> Optional[int]:
+        """Get current credit balance"""
+        logger.info("Checking credit balance...")
+        try:
+            success, data, error = await self._make_request("GET", "/account/credits")
+        except RateLimited as e:
+            success, data, error = False, None, str(e)
+
+        if not success:
+            logger.error(f"Failed to get credit balance: {error}")
+            return None
+
+        balance = data.get("balance", 0)
+        logger.info(f"✓ Current credit balance: {balance:,}")
+        return balance
+
+    async def start_bulk_enrichment(self, contacts: List[Dict], enrichment_name: str) -> Optional[str]:
+        """Start bulk enrichment, backing off and retrying while rate limited"""
+        logger.info(f"Starting enrichment: '{enrichment_name}' ({len(contacts)} contacts)")
+
+        payload = {
+            "name": enrichment_name,
+            "datas": contacts
+        }
+
+        delay = AdaptiveDelay(1, self.max_poll_interval)
+        for attempt in range(MAX_SUBMIT_RETRIES + 1):
+            try:
+                success, data, error = await self._make_request("POST", "/contact/enrich/bulk", payload)
+                break
+            except RateLimited as e:
+                if attempt == MAX_SUBMIT_RETRIES:
+                    success, data, error = False, None, str(e)
+                    break
+                wait = delay.rate_limited(e.retry_after)
+                logger.warning(f"  ⚠ Rate limited submitting '{enrichment_name}' - retrying in {wait:.1f}s")
+                await asyncio.sleep(wait)
+
+        if not success:
+            logger.error(f"Failed to start enrichment: {error}")
+            return None
+
+        enrichment_id = data.get("enrichment_id")
+        logger.info(f"✓ Enrichment started: {enrichment_id}")
+        return enrichment_id
+
+    async def get_enrichment_results(self, enrichment_id: str) -> Optional[Dict]:
+        """Get enrichment results (raises RateLimited on HTTP 429)"""
+        success, data, error = await self._make_request("GET", f"/contact/enrich/bulk/{enrichment_id}")
+
+        if not success:
+            logger.error(f"Failed to get results: {error}")
+            return None
+
+        return data
+
+    # ------------------------------------------------------------------------
+    # POLLING
+    # ------------------------------------------------------------------------
+
+    async def poll_until_done(self, enrichment_id: str, batch_name: str) -> Tuple[str, Optional[Dict]]:
+        """
+        Poll one enrichment with adaptive backoff until it finishes, fails or times out.
+        Returns (status, results); results is only set for FINISHED. status is the API's
+        final status, or TIMEOUT / REQUEST_FAILED when we stopped polling a live enrichment.
+        """
+        delay = AdaptiveDelay(self.poll_interval, self.max_poll_interval)
+        deadline = time.monotonic() + self.max_poll_seconds
+        wait = delay.pending()
+
+        while True:
+            if time.monotonic() + wait > deadline:
+                logger.error(f"  ✗ {batch_name} polling timeout")
+                return TIMEOUT, None
+            await asyncio.sleep(wait)
+
+            try:
+                results = await self.get_enrichment_results(enrichment_id)
+            except RateLimited as e:
+                wait = delay.rate_limited(e.retry_after)
+                logger.info(f"  ⏳ {batch_name} rate limited - next poll in {wait:.1f}s")
+                continue
+
+            if results is None:
+                return REQUEST_FAILED, None
+
+            status = results.get("status", "UNKNOWN")
+
+            if status == "FINISHED":
+                logger.info(f"  ✓ {batch_name} completed!")
+                return status, results
+
+            if status in FAILED_STATUSES:
+                logger.error(f"  ✗ {batch_name} failed with status: {status}")
+                return status, None
+
+            if status == "RATE_LIMIT":
+                wait = delay.rate_limited()
+            else:
+                if status not in PENDING_STATUSES:
+                    logger.warning(f"  ⚠ {batch_name} unexpected status: {status}")
+                wait = delay.pending()
+            logger.debug(f"  {batch_name}: {status} - next poll in {wait:.1f}s")
+
+    async def _submit_and_poll(self, batch_num: int, contacts: List[Dict], enrichment_name: str,
+                               on_submitted: Optional[Callable], slots: asyncio.Semaphore
+                               ) -> Tuple[int, Optional[str], str, Optional[Dict]]:
+        async with slots:
+            enrichment_id = await self.start_bulk_enrichment(contacts, enrichment_name)
+            if enrichment_id is None:
+                logger.error(f"  ✗ Batch {batch_num} submission failed")
+                return batch_num, None, SUBMIT_FAILED, None
+            logger.info(f"  ✓ Batch {batch_num} submitted: {enrichment_id}")
+
+            if on_submitted is not None:
+                on_submitted(batch_num, enrichment_id, enrichment_name, contacts)
+
+            return (batch_num, enrichment_id) + await self.poll_until_done(enrichment_id, f"Batch {batch_num}")
+
+    async def _poll_only(self, batch_num: int, enrichment_id: str, slots: asyncio.Semaphore
+                         ) -> Tuple[int, Optional[str], str, Optional[Dict]]:
+        async with slots:
+            return (batch_num, enrichment_id) + await self.poll_until_done(enrichment_id, f"Batch {batch_num}")
+
+    async def enrich_batches(self, batches: List[List[Dict]], run_name: str,
+                             enrichment_ids: Optional[Dict[int, str]] = None,
+                             first_batch_num: int = 1,
+                             on_submitted: Optional[Callable] = None,
+                             max_in_flight: Optional[int] = None
+                             ) -> AsyncIterator[Tuple[int, Optional[str], str, Optional[Dict]]]:
+        """
+        Submit and poll every batch concurrently.
+        Yields (batch_num, enrichment_id, status, results) in completion order; results is
+        only set for FINISHED, and enrichment_id is None when submission itself failed.
+
+        enrichment_ids - batch_num -> already-submitted enrichment to resume polling
+        first_batch_num - number given to batches[0] (new batches are numbered consecutively)
+        on_submitted - called as on_submitted(batch_num, enrichment_id, name, contacts) as soon
+                       as a submission is accepted, before polling starts
+        max_in_flight - enrichments running server-side at once (default: all of them);
+                        the next batch is submitted as soon as one finishes
+        """
+        enrichment_ids = enrichment_ids or {}
+        slots = asyncio.Semaphore(max_in_flight or len(batches) + len(enrichment_ids) or 1)
+        last_batch_num = first_batch_num + len(batches) - 1
+        tasks = [
+            asyncio.create_task(self._poll_only(batch_num, enrichment_id, slots))
+            for batch_num, enrichment_id in sorted(enrichment_ids.items())
+        ] + [
+            asyncio.create_task(self._submit_and_poll(
+                batch_num, batch, f"{run_name} - Batch {batch_num}/{last_batch_num}", on_submitted, slots
+            ))
+            for batch_num, batch in enumerate(batches, first_batch_num)
+        ]
+
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,454 @@
+"""
+Offline Geocoding and Spatial Index
+Turns the free-text locations of unified guests (linkedin.location, else
+company.headquarters city/region/country) into coordinates with the bundled
+gazetteer.tsv, and indexes attendees and venues in a KD-tree so proximity
+questions need no geocoding service:
+
+- attendees within R km of a point or of another attendee
+- the k venues nearest to the midpoint of two attendees (the location handed to
+  maps_grounding.py for meeting spot suggestions)
+
+Geocoding is city level where the gazetteer knows the city, else region or country
+centroid (precision is recorded). Attendees at the same place share one tree point,
+so queries cost one distance per place, not per attendee.
+
+unify_data.py --geo writes unified_guests_geo.json ({username: [lat, lng, precision]});
+venues come from a JSON list of {name, lat, lng, ...} objects.
+
+Usage:
+    python geo_index.py --near "San Francisco" --radius 25
+    python geo_index.py --near-guest alice --radius 50
+    python geo_index.py --midpoint alice bob --venues venues.json -k 5
+"""
+
+import argparse
+import heapq
+import math
+import re
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import json_backend
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_GAZETTEER = SCRIPT_DIR / "gazetteer.tsv"
+DEFAULT_GEO_FILE = SCRIPT_DIR / "unified_guests_geo.json"
+DEFAULT_PROFILES_FILE = SCRIPT_DIR / "unified_guests_all.json"
+
+GEO_VERSION = 3  # Bump when geocoding results change (gazetteer.tsv edits included)
+LEAF_SIZE = 16  # Points per KD-tree leaf
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+# Metro-area wording around a place name ("Greater Boston", "Berlin Metropolitan Area")
+PREFIXES = ("greater ",)
+SUFFIXES = (" metropolitan area", " metropolitan region", " metro area", " area", " region", " metro", " district")
+
+
+# Letters NFKD does not decompose into a base letter and a combining mark
+TRANSLITERATIONS = str.maketrans({
+    "ł": "l", "Ł": "L", "ø": "o", "Ø": "O", "æ": "ae", "Æ": "AE", "ß": "ss", "đ": "d", "Đ": "D",
+    "œ": "oe", "Œ": "OE", "ı": "i", "þ": "th", "Þ": "TH",
+})
+
+
+PRECISION_RANK = {"city": 0, "region": 1, "country": 2}
+
+
+class GeoPoint(NamedTuple):
+    latitude: float
+    longitude: float
+    precision: str  # "city", "region" or "country"
+    country_code: str
+
+
+# ============================================================================
+# GEOCODING
+# ============================================================================
+
+def normalize_place(text: str) -> str:
+    """Lowercase, accents and dots dropped, other punctuation (but , and -) as spaces"""
+    text = unicodedata.normalize("NFKD", text.translate(TRANSLITERATIONS))
+    text = "".join(char for char in text if not unicodedata.combining(char)).lower().replace(".", "")
+    return " ".join(re.sub(r"[^a-z0-9,\-]+", " ", text).split())
+
+
+def _place_names(part: str) -> List[str]:
+    """A location part, then the part without metro-area wording"""
+    names = [part]
+    for prefix in PREFIXES:
+        if part.startswith(prefix):
+            part = part[len(prefix):]
+    for suffix in SUFFIXES:
+        if part.endswith(suffix):
+            part = part[:-len(suffix)]
+            break
+    if part != names[0]:
+        names.append(part)
+    return names
+
+
+class Gazetteer:
+    """Place name -> coordinates, from gazetteer.tsv"""
+
+    def __init__(self, path: Path = DEFAULT_GAZETTEER):
+        self.places: Dict[str, Dict[str, List[GeoPoint]]] = {"city": {}, "region": {}, "country": {}}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                kind, names, country_code, latitude, longitude = line.rstrip("\n").split("\t")
+                point = GeoPoint(float(latitude), float(longitude), kind, country_code)
+                for name in names.split("|"):
+                    self.places[kind].setdefault(normalize_place(name), []).append(point)
+        self.geocode = lru_cache(maxsize=65536)(self._geocode)
+
+    def _lookup(self, kind: str, part: str, country_code: Optional[str]) -> Optional[GeoPoint]:
+        for name in _place_names(part):
+            for point in self.places[kind].get(name, ()):
+                if country_code is None or point.country_code == country_code:
+                    return point
+        return None
+
+    def _geocode(self, text: str) -> Optional[GeoPoint]:
+        """Most specific place named in a free-text location, or None"""
+        normalized = normalize_place(text or "")
+        point = self._resolve([part.strip() for part in normalized.split(",") if part.strip()])
+        if point is None or point.precision != "city":
+            # Hyphens also separate parts ("Berlin - Germany"), but only where whole
+            # comma parts did not name a city ("Aix-en-Provence", "Winston-Salem")
+            split = self._resolve([part.strip() for part in re.split(r"[,\-]", normalized) if part.strip()])
+            if split is not None and (point is None or PRECISION_RANK[split.precision] < PRECISION_RANK[point.precision]):
+                point = split
+        return point
+
+    def _resolve(self, parts: List[str]) -> Optional[GeoPoint]:
+        if not parts:
+            return None
+
+        # Countries, then regions, named last first decide between same-named places.
+        # Every candidate code is tried for a city ("Atlanta, Georgia" is in the US state,
+        # not the country), then the first one for a region or country.
+        country_codes = []
+        for kind in ("country", "region"):
+            for part in reversed(parts):
+                point = self._lookup(kind, part, None)
+                if point and point.country_code not in country_codes:
+                    country_codes.append(point.country_code)
+        country_codes = country_codes or [None]
+
+        for country_code in country_codes:
+            for part in parts:
+                point = self._lookup("city", part, country_code)
+                if point:
+                    return point
+        for country_code in country_codes:
+            for kind in ("region", "country"):
+                for part in parts:
+                    point = self._lookup(kind, part, country_code)
+                    if point:
+                        return point
+        return None
+
+
+def profile_location(profile: Dict) -> Optional[str]:
+    """Free-text location of a unified profile: LinkedIn location, else company headquarters"""
+    location = (profile.get("linkedin") or {}).get("location")
+    if location:
+        return location
+    headquarters = (profile.get("company") or {}).get("headquarters") or {}
+    parts = [headquarters.get(key) for key in ("city", "region", "country")]
+    return ", ".join(part for part in parts if part) or None
+
+
+def geocode_profiles(profiles: Iterable[Dict], gazetteer: Gazetteer) -> Dict[str, list]:
+    """username -> [lat, lng, precision] of every profile whose location is known"""
+    geo = {}
+    for profile in profiles:
+        point = gazetteer.geocode(profile_location(profile) or "")
+        if point:
+            geo[profile["username"]] = [point.latitude, point.longitude, point.precision]
+    return geo
+
+
+def load_geo(geo_path: Path = DEFAULT_GEO_FILE, profiles_path: Path = DEFAULT_PROFILES_FILE,
+             gazetteer_path: Path = DEFAULT_GAZETTEER) -> Dict[str, list]:
+    """username -> [lat, lng, precision], from the unifier's geo file, else geocoded from the profiles"""
+    if Path(geo_path).exists():
+        geo = json_backend.load(geo_path)
+        if geo.get("version") == GEO_VERSION:
+            return geo["profiles"]
+    return geocode_profiles(json_backend.load(profiles_path), Gazetteer(gazetteer_path))
+
+
+# ============================================================================
+# DISTANCES
+# ============================================================================
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lng2 - lng1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def midpoint(lat1: float, lng1: float, lat2: float, lng2: float) -> Tuple[float, float]:
+    """Great-circle midpoint of two points"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    lam1, dlam = math.radians(lng1), math.radians(lng2 - lng1)
+    bx, by = math.cos(phi2) * math.cos(dlam), math.cos(phi2) * math.sin(dlam)
+    phi = math.atan2(math.sin(phi1) + math.sin(phi2), math.hypot(math.cos(phi1) + bx, by))
+    lam = lam1 + math.atan2(by, math.cos(phi1) + bx)
+    return math.degrees(phi), (math.degrees(lam) + 540) % 360 - 180
+
+
+# ============================================================================
+# SPATIAL INDEX
+# ============================================================================
+
+def _unit_vector(latitude: float, longitude: float) -> Tuple[float, float, float]:
+    phi, lam = math.radians(latitude), math.radians(longitude)
+    return math.cos(phi) * math.cos(lam), math.cos(phi) * math.sin(lam), math.sin(phi)
+
+
+def _chord_to_km(chord_squared: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(chord_squared) / 2))
+
+
+def _km_to_chord(km: float) -> float:
+    return 2 * math.sin(min(km / (2 * EARTH_RADIUS_KM), math.pi / 2))
+
+
+class GeoIndex:
+    """
+    KD-tree of keys at lat/lng points. Points are unit vectors, where straight-line
+    (chord) distance orders like great-circle distance, so there are no seams at the
+    antimeridian or the poles. Keys at the same coordinates share a point; the tree
+    is (re)built on the first query after an add().
+    """
+
+    def __init__(self, leaf_size: int = LEAF_SIZE):
+        self.leaf_size = leaf_size
+        self.latitudes: List[float] = []
+        self.longitudes: List[float] = []
+        self.keys: List[list] = []  # Keys at each point
+        self._points: Dict[Tuple[float, float], int] = {}
+        self._xyz: List[Tuple[float, float, float]] = []
+        self._count = 0
+        self._built = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, key, latitude: float, longitude: float):
+        point = self._points.get((latitude, longitude))
+        if point is None:
+            point = self._points[(latitude, longitude)] = len(self.keys)
+            self.latitudes.append(latitude)
+            self.longitudes.append(longitude)
+            self.keys.append([])
+            self._xyz.append(_unit_vector(latitude, longitude))
+            self._built = False
+        self.keys[point].append(key)
+        self._count += 1
+
+    def _build(self):
+        """Median splits on the widest axis; leaves are contiguous runs of self._order"""
+        self._order = list(range(len(self._xyz)))
+        self._axis: List[int] = []  # -1 for leaves
+        self._children: List[Tuple[int, int]] = []  # (left, right) nodes, or (start, end) of a leaf
+        self._bounds: List[Tuple[float, ...]] = []  # Bounding box of each node's points: min x, y, z, max x, y, z
+        if self._order:
+            self._build_node(0, len(self._order))
+        self._leaf_xyz = [self._xyz[point] for point in self._order]
+        self._built = True
+
+    def _build_node(self, start: int, end: int) -> int:
+        node = len(self._axis)
+        points = self._order[start:end]
+        low = [min(self._xyz[p][axis] for p in points) for axis in range(3)]
+        high = [max(self._xyz[p][axis] for p in points) for axis in range(3)]
+        self._axis.append(-1)
+        self._children.append((start, end))
+        self._bounds.append((*low, *high))
+        if end - start <= self.leaf_size:
+            return node
+
+        spreads = [high[axis] - low[axis] for axis in range(3)]
+        axis = spreads.index(max(spreads))
+        if spreads[axis] == 0:
+            return node  # Identical coordinates cannot be split
+        points.sort(key=lambda p: self._xyz[p][axis])
+        self._order[start:end] = points
+        middle = (start + end) // 2
+
+        self._axis[node] = axis
+        self._children[node] = (self._build_node(start, middle), self._build_node(middle, end))
+        return node
+
+    def within_points(self, latitude: float, longitude: float, radius_km: float) -> List[Tuple[float, int]]:
+        """(distance km, point) of every point within radius_km, nearest first"""
+        if not self._built:
+            self._build()
+        if not self._order:
+            return []
+        qx, qy, qz = _unit_vector(latitude, longitude)
+        limit = _km_to_chord(radius_km) ** 2 + 1e-12
+        axes, children, bounds, order, leaf_xyz = self._axis, self._children, self._bounds, self._order, self._leaf_xyz
+
+        found = []
+        stack = [0]  # Nodes whose bounding box reaches into the radius
+        while stack:
+            node = stack.pop()
+            axis = axes[node]
+            if axis < 0:
+                start, end = children[node]
+                for i in range(start, end):
+                    x, y, z = leaf_xyz[i]
+                    distance = (x - qx) ** 2 + (y - qy) ** 2 + (z - qz) ** 2
+                    if distance <= limit:
+                        found.append((distance, order[i]))
+                continue
+            for child in children[node]:
+                lx, ly, lz, hx, hy, hz = bounds[child]
+                dx = lx - qx if qx < lx else qx - hx if qx > hx else 0.0
+                dy = ly - qy if qy < ly else qy - hy if qy > hy else 0.0
+                dz = lz - qz if qz < lz else qz - hz if qz > hz else 0.0
+                if dx * dx + dy * dy + dz * dz <= limit:
+                    stack.append(child)
+
+        found.sort()
+        return [(_chord_to_km(distance), point) for distance, point in found]
+
+    def nearest_points(self, latitude: float, longitude: float, k: int) -> List[Tuple[float, int]]:
+        """(distance km, point) of the k nearest points, nearest first"""
+        if not self._built:
+            self._build()
+        if not self._order or k <= 0:
+            return []
+        qx, qy, qz = _unit_vector(latitude, longitude)
+        axes, children, bounds, order, leaf_xyz = self._axis, self._children, self._bounds, self._order, self._leaf_xyz
+
+        def box_distance(node: int) -> float:
+            """Squared distance from the query to a node's bounding box"""
+            lx, ly, lz, hx, hy, hz = bounds[node]
+            dx = lx - qx if qx < lx else qx - hx if qx > hx else 0.0
+            dy = ly - qy if qy < ly else qy - hy if qy > hy else 0.0
+            dz = lz - qz if qz < lz else qz - hz if qz > hz else 0.0
+            return dx * dx + dy * dy + dz * dz
+
+        # Best-first: nodes are opened nearest box first until no box can beat the k-th point
+        best: List[Tuple[float, int]] = []  # (-squared chord, point) of the best k so far
+        nodes = [(box_distance(0), 0)]
+        while nodes:
+            bound, node = heapq.heappop(nodes)
+            if len(best) == k and bound >= -best[0][0]:
+                break
+            if axes[node] >= 0:
+                for child in children[node]:
+                    heapq.heappush(nodes, (box_distance(child), child))
+                continue
+            start, end = children[node]
+            for i in range(start, end):
+                x, y, z = leaf_xyz[i]
+                distance = (x - qx) ** 2 + (y - qy) ** 2 + (z - qz) ** 2
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, order[i]))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, order[i]))
+        return [(_chord_to_km(-distance), point) for distance, point in sorted(best, reverse=True)]
+
+    def within(self, latitude: float, longitude: float, radius_km: float) -> List:
+        """Keys within radius_km, nearest first"""
+        keys: List = []
+        for _, point in self.within_points(latitude, longitude, radius_km):
+            keys.extend(self.keys[point])
+        return keys
+
+    def nearest(self, latitude: float, longitude: float, k: int) -> List[Tuple[object, float]]:
+        """The k keys nearest to a point as (key, distance km), nearest first"""
+        nearest: List[Tuple[object, float]] = []
+        for distance, point in self.nearest_points(latitude, longitude, k):  # Every point has a key
+            for key in self.keys[point]:
+                nearest.append((key, distance))
+                if len(nearest) == k:
+                    return nearest
+        return nearest
+
+
+def attendee_index(geo: Dict[str, list]) -> GeoIndex:
+    """GeoIndex of usernames"""
+    index = GeoIndex()
+    for username, (latitude, longitude, _) in geo.items():
+        index.add(username, latitude, longitude)
+    return index
+
+
+def venue_index(venues: List[Dict]) -> GeoIndex:
+    """GeoIndex of venue dicts ({name, lat, lng, ...}); venues without coordinates are skipped"""
+    index = GeoIndex()
+    for venue in venues:
+        if venue.get("lat") is not None and venue.get("lng") is not None:
+            index.add(venue, float(venue["lat"]), float(venue["lng"]))
+    return index
+
+
+def nearest_venues_between(geo: Dict[str, list], venues: GeoIndex, username_a: str, username_b: str,
+                           k: int = 5) -> Tuple[Optional[Tuple[float, float]], List[Tuple[Dict, float]]]:
+    """(midpoint, k nearest venues) of two attendees; (None, []) unless both are geocoded"""
+    if username_a not in geo or username_b not in geo:
+        return None, []
+    center = midpoint(*geo[username_a][:2], *geo[username_b][:2])
+    return center, venues.nearest(*center, k)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline geocoding and proximity queries over unified guests")
+    parser.add_argument("--geo", type=Path, default=DEFAULT_GEO_FILE, help="unify_data.py --geo output (default: %(default)s)")
+    parser.add_argument("--profiles", type=Path, default=DEFAULT_PROFILES_FILE, help="Unified guests, when there is no geo file")
+    parser.add_argument("--gazetteer", type=Path, default=DEFAULT_GAZETTEER)
+    parser.add_argument("--near", help="Place name to search around")
+    parser.add_argument("--near-guest", help="Username to search around")
+    parser.add_argument("--radius", type=float, default=25.0, help="Search radius in km (default: %(default)s)")
+    parser.add_argument("--midpoint", nargs=2, metavar="USERNAME", help="Two guests to find meeting venues between")
+    parser.add_argument("--venues", type=Path, help="JSON list of {name, lat, lng, ...} venues")
+    parser.add_argument("-k", type=int, default=5, help="Venues to list (default: %(default)s)")
+    args = parser.parse_args()
+
+    geo = load_geo(args.geo, args.profiles, args.gazetteer)
+    print(f"{len(geo):,} geocoded guests")
+
+    if args.near or args.near_guest:
+        if args.near:
+            point = Gazetteer(args.gazetteer).geocode(args.near)
+            center = (point.latitude, point.longitude) if point else None
+        else:
+            center = tuple(geo[args.near_guest][:2]) if args.near_guest in geo else None
+        if center is None:
+            parser.error(f"Unknown location: {args.near or args.near_guest}")
+        usernames = attendee_index(geo).within(*center, args.radius)
+        print(f"{len(usernames):,} guests within {args.radius:g} km of {center[0]:.4f}, {center[1]:.4f}")
+        for username in usernames[:20]:
+            print(f"  {username}")
+
+    if args.midpoint:
+        if not args.venues:
+            parser.error("--midpoint needs --venues")
+        venues = venue_index(json_backend.load(args.venues))
+        center, nearest = nearest_venues_between(geo, venues, *args.midpoint, k=args.k)
+        if center is None:
+            parser.error("Both guests need a known location")
+        print(f"Midpoint {center[0]:.4f}, {center[1]:.4f}")
+        for venue, distance in nearest:
+            print(f"  {distance:7.2f} km  {venue.get('name')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+JSON Backend
+One place for every pipeline JSON read and write: orjson when it is installed
+(pip install orjson, several times faster on the large batch and output files),
+the standard library otherwise. Both backends produce the same documents.
+
+- loads() / load(): parse bytes, str or a file
+- dumps() / dump(): UTF-8 bytes, compact by default; pretty=True indents by 2
+- Non-ASCII text is written as UTF-8 by both backends (no \\uXXXX escapes), so
+  outputs are byte-identical whichever backend wrote them, except for the
+  spelling of some floats (1e+16 vs 1e16)
+- Values orjson cannot encode (integers beyond 64 bits, non-string keys) fall
+  back to the standard library
+
+Usage:
+    python json_backend.py T2/batch_1_results.json --benchmark   # both backends, same file
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def use_backend(name: str):
+    """Switch backends ("orjson" or "json"), e.g. to compare them"""
+    global BACKEND
+    if name not in ("orjson", "json"):
+        raise ValueError(f"Unknown JSON backend: {name}")
+    if name == "orjson" and orjson is None:
+        raise ImportError("orjson is not installed")
+    BACKEND = name
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document (raises json.JSONDecodeError on malformed input)"""
+    if BACKEND == "orjson":
+        return orjson.loads(data)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return json.loads(data)
+
+
+def load(path: Path) -> Any:
+    """Parse a JSON file"""
+    return loads(Path(path).read_bytes())
+
+
+def dumps(obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON: compact, or indented by 2 with pretty"""
+    if BACKEND == "orjson":
+        option = (orjson.OPT_INDENT_2 if pretty else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass  # Out-of-range integers, non-string keys, ...
+
+    if pretty:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), ensure_ascii=False, sort_keys=sort_keys)
+    return text.encode('utf-8')
+
+
+def dump(obj: Any, path: Path, pretty: bool = False) -> int:
+    """Write obj to a JSON file and return the bytes written"""
+    data = dumps(obj, pretty)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time the JSON backends on a file")
+    parser.add_argument("path", type=Path, help="JSON file to parse and re-serialize")
+    parser.add_argument("--benchmark", action="store_true", help="Time parse/serialize with every available backend")
+    args = parser.parse_args()
+
+    print(f"Backend: {BACKEND}")
+    data = args.path.read_bytes()
+    backends = ["json"] + (["orjson"] if orjson is not None else [])
+
+    # Every backend must read every backend's output back to the same document
+    documents = {}
+    for name in backends:
+        use_backend(name)
+        documents[name] = loads(data)
+        for pretty in (False, True):
+            written = dumps(documents[name], pretty)
+            for reader in backends:
+                use_backend(reader)
+                if loads(written) != documents[name]:
+                    print(f"✗ {name} (pretty={pretty}) output reads back differently with {reader}")
+                    sys.exit(1)
+                use_backend(name)
+    if len({json.dumps(document, sort_keys=True) for document in documents.values()}) != 1:
+        print("✗ Backends parse the file differently")
+        sys.exit(1)
+    print(f"✓ {', '.join(backends)}: identical documents, compact and pretty round trips")
+
+    if args.benchmark:
+        print(f"{'backend':<8} | {'parse MB/s':>10} | {'compact MB/s':>12} | {'pretty MB/s':>11}")
+        for name in backends:
+            use_backend(name)
+            timings = []
+            for func in (lambda: loads(data), lambda: dumps(documents[name]), lambda: dumps(documents[name], True)):
+                best = min(_elapsed(func) for _ in range(3))
+                timings.append(len(data) / best / 1e6)
+            print(f"{name:<8} | {timings[0]:>10,.0f} | {timings[1]:>12,.0f} | {timings[2]:>11,.0f}")
+
+
+def _elapsed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+Bulk Google Maps Grounding Runner
+Runs many Gemini requests grounded with the google_maps tool (see
+a_context/Meeting_Scheduling_Agent/maps/) concurrently, e.g. meeting spot
+suggestions for thousands of matched pairs.
+
+- Requests are keyed on (model, prompt, lat/lng rounded to COORD_PRECISION decimals,
+  radius). The rounded coordinates are the ones sent, so every request with the same
+  key gets the same answer: identical requests in a run are sent once, and repeated
+  lookups around the same event location are cache hits.
+- Answers ({text, sources}) are stored in an SQLite cache (summary_cache.SummaryCache,
+  size-bounded with LRU eviction) under kind "maps_grounding". Failed requests are
+  retried with backoff and never cached.
+- At most max_concurrency requests are in flight (client.aio, no threads); requests
+  waiting to retry give up their slot while they back off.
+
+The client is anything with `async generate(model, prompt, latitude, longitude) -> answer`;
+GeminiMapsClient wraps google-genai (>= 1.43, `pip install .[maps]`), and
+benchmarks/bench_maps_grounding.py runs against a stub.
+
+Usage:
+    python maps_grounding.py requests.jsonl -o answers.jsonl --concurrency 16
+    (one {"prompt", "lat", "lng", "radius_m"} object per line; other fields are copied to the output)
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import json_backend
+from summary_cache import DEFAULT_MAX_BYTES, SummaryCache
+
+try:
+    from google import genai
+    from google.genai import types
+except ImportError:
+    genai = None
+
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_CACHE_DB = SCRIPT_DIR / "maps_grounding_cache.sqlite"
+
+DEFAULT_MODEL = "gemini-2.5-flash-lite"
+CACHE_KIND = "maps_grounding"
+CACHE_VERSION = "maps-grounding-v1"  # Bump when the answer format or request_prompt() changes
+
+COORD_PRECISION = 3  # Decimals kept of lat/lng (~110 m), so nearby requests share a key
+MAX_CONCURRENCY = 8  # Requests in flight at once
+MAX_RETRIES = 3  # Retries of a failed request before it is reported as None
+RETRY_DELAY_SECONDS = 1.0  # First retry delay, doubled per attempt (+/- 10% jitter)
+CACHE_FLUSH_SIZE = 100  # New answers buffered before they are written to the cache
+
+
+class MapsRequest(NamedTuple):
+    prompt: str
+    latitude: float
+    longitude: float
+    radius_m: Optional[int] = None  # Search radius mentioned in the prompt (see request_prompt)
+
+
+# ============================================================================
+# REQUEST KEYS
+# ============================================================================
+
+def normalize_request(request: MapsRequest, precision: int = COORD_PRECISION) -> MapsRequest:
+    """Collapse whitespace in the prompt and round the coordinates"""
+    return MapsRequest(
+        " ".join(request.prompt.split()),
+        round(float(request.latitude), precision),
+        round(float(request.longitude), precision),
+        int(request.radius_m) if request.radius_m else None
+    )
+
+
+def request_key(model: str, request: MapsRequest) -> str:
+    """Cache key of a normalized request"""
+    canonical = json_backend.dumps([model, *request])
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def request_prompt(request: MapsRequest) -> str:
+    """Prompt text sent for a request"""
+    if request.radius_m:
+        return f"{request.prompt} Only suggest places within {request.radius_m} m of this location."
+    return request.prompt
+
+
+# ============================================================================
+# GEMINI CLIENT
+# ============================================================================
+
+def extract_answer(response) -> Dict:
+    """{text, sources: [{title, uri, place_id}]} of a response; sources are the grounding
+    chunks the answer cites, as generate_sources() in maps_snippet.py lists them"""
+    sources = []
+    candidates = response.candidates or []
+    grounding = candidates[0].grounding_metadata if candidates else None
+    if grounding and grounding.grounding_chunks:
+        supported = sorted({i for support in grounding.grounding_supports or [] for i in support.grounding_chunk_indices or []})
+        seen = set()
+        for i in supported:
+            ref = grounding.grounding_chunks[i].maps
+            if ref is None or ref.uri in seen:
+                continue
+            seen.add(ref.uri)
+            sources.append({"title": ref.title, "uri": ref.uri, "place_id": getattr(ref, "place_id", None)})
+    return {"text": response.text or "", "sources": sources}
+
+
+def format_sources(answer: Dict) -> str:
+    """Markdown source list of an answer"""
+    if not answer["sources"]:
+        return ""
+    return "\n".join(["### Sources from Google Maps"] + [f"- [{source['title']}]({source['uri']})" for source in answer["sources"]])
+
+
+class GeminiMapsClient:
+    """google-genai async client with the google_maps tool enabled"""
+
+    def __init__(self, api_key: Optional[str] = None):
+        if genai is None:
+            raise ImportError("Maps grounding needs google-genai>=1.43 (pip install '.[maps]')")
+        self._client = genai.Client(api_key=api_key)
+
+    async def generate(self, model: str, prompt: str, latitude: float, longitude: float) -> Dict:
+        response = await self._client.aio.models.generate_content(
+            model=model,
+            contents=prompt,
+            config=types.GenerateContentConfig(
+                tools=[types.Tool(google_maps=types.GoogleMaps())],
+                tool_config=types.ToolConfig(
+                    retrieval_config=types.RetrievalConfig(
+                        lat_lng=types.LatLng(latitude=latitude, longitude=longitude)
+                    )
+                ),
+            ),
+        )
+        return extract_answer(response)
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+class MapsGroundingRunner:
+    """Deduplicating, cached, bounded-concurrency runner of Maps grounding requests"""
+
+    def __init__(self, client, cache: Optional[SummaryCache] = None, model: str = DEFAULT_MODEL,
+                 max_concurrency: int = MAX_CONCURRENCY, precision: int = COORD_PRECISION,
+                 max_retries: int = MAX_RETRIES, retry_delay: float = RETRY_DELAY_SECONDS):
+        self.client = client
+        self.cache = cache
+        self.model = model
+        self.precision = precision
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._unflushed: Dict[str, Dict] = {}  # New answers not yet in the cache
+        self.stats = {"requests": 0, "unique": 0, "cache_hits": 0, "calls": 0, "retries": 0, "failures": 0}
+
+    async def run(self, requests: Iterable[MapsRequest]) -> List[Optional[Dict]]:
+        """Answer of every request, in order (None where it kept failing)"""
+        keyed: List[Tuple[str, MapsRequest]] = []
+        for request in requests:
+            request = normalize_request(request, self.precision)
+            keyed.append((request_key(self.model, request), request))
+        unique = dict(keyed)
+        self.stats["requests"] += len(keyed)
+        self.stats["unique"] += len(unique)
+
+        answers = {key: self._unflushed[key] for key in unique if key in self._unflushed}
+        if self.cache is not None:
+            cached = self.cache.get_many((key for key in unique if key not in answers), CACHE_VERSION, CACHE_KIND)
+            answers.update((key, json.loads(value)) for key, value in cached.items())
+        self.stats["cache_hits"] += len(answers)
+
+        misses = [(key, request) for key, request in unique.items() if key not in answers]
+        try:
+            fetched = await asyncio.gather(*(self._fetch(key, request) for key, request in misses))
+        finally:
+            self.flush()
+        answers.update((key, answer) for (key, _), answer in zip(misses, fetched))
+
+        return [answers[key] for key, _ in keyed]
+
+    async def ground(self, request: MapsRequest) -> Optional[Dict]:
+        return (await self.run([request]))[0]
+
+    def _fetch(self, key: str, request: MapsRequest) -> asyncio.Future:
+        """The pending answer for key; concurrent runs asking for the same key share one call"""
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._call(key, request))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return future
+
+    async def _call(self, key: str, request: MapsRequest) -> Optional[Dict]:
+        delay = self.retry_delay
+        for attempt in range(self.max_retries + 1):
+            # A slot per attempt: requests backing off do not hold one while they sleep
+            async with self._slots:
+                self.stats["calls"] += 1
+                try:
+                    answer = await self.client.generate(self.model, request_prompt(request), request.latitude, request.longitude)
+                except Exception as e:
+                    error = e
+                else:
+                    self._unflushed[key] = answer
+                    if self.cache is not None and len(self._unflushed) >= CACHE_FLUSH_SIZE:
+                        self.flush()
+                    return answer
+
+            if attempt == self.max_retries:
+                self.stats["failures"] += 1
+                logger.warning(f"  ✗ Maps grounding failed after {attempt + 1} attempts: {error}")
+                return None
+            self.stats["retries"] += 1
+            await asyncio.sleep(delay * random.uniform(0.9, 1.1))
+            delay *= 2
+
+    def flush(self):
+        """Write buffered answers to the cache (without a cache they stay in memory)"""
+        if self.cache is not None and self._unflushed:
+            self.cache.put_many(
+                ((key, json_backend.dumps(answer).decode("utf-8")) for key, answer in self._unflushed.items()),
+                CACHE_VERSION, CACHE_KIND
+            )
+            self._unflushed.clear()
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+async def run_file(runner: MapsGroundingRunner, input_path: Path, output_path: Path) -> int:
+    """Answer every request line of input_path into output_path; returns failures"""
+    with open(input_path, 'rb') as f:
+        rows = [json_backend.loads(line) for line in f if line.strip()]
+    answers = await runner.run(
+        MapsRequest(row["prompt"], row["lat"], row["lng"], row.get("radius_m")) for row in rows
+    )
+    with open(output_path, 'wb') as f:
+        for row, answer in zip(rows, answers):
+            f.write(json_backend.dumps({**row, "answer": answer}) + b"\n")
+    return sum(answer is None for answer in answers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Gemini Google Maps grounding requests in bulk")
+    parser.add_argument("input", type=Path, help="JSON lines of {prompt, lat, lng, radius_m}")
+    parser.add_argument("-o", "--output", type=Path, required=True, help="JSON lines of the input rows plus answer")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="Gemini model (default: %(default)s)")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY, help="Requests in flight (default: %(default)s)")
+    parser.add_argument("--precision", type=int, default=COORD_PRECISION, help="lat/lng decimals in the key (default: %(default)s)")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE_DB, help="Cache database (default: %(default)s)")
+    parser.add_argument("--max-mb", type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024, help="Cached answers kept (default: %(default)s MB)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+    start = time.perf_counter()
+    with SummaryCache(args.cache, int(args.max_mb * 1024 * 1024)) as cache:
+        runner = MapsGroundingRunner(GeminiMapsClient(), cache, args.model, args.concurrency, args.precision)
+        failures = asyncio.run(run_file(runner, args.input, args.output))
+
+    stats = runner.stats
+    print(f"{stats['requests']:,} requests, {stats['unique']:,} unique, {stats['cache_hits']:,} cache hits, "
+          f"{stats['calls']:,} calls ({stats['retries']:,} retries), {failures:,} failed in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,426 @@
+"""
+Local People-Matching Engine
+Answers "who should I meet" queries from the unified guests without a network round
+trip: a local drop-in for the Vectara search behind src/mastra/tools/search-people-tool.ts.
+
+- Vectors: the TF-IDF matching features (match_features.py), read from
+  unified_guests_features.npy when it belongs to the loaded guests, built otherwise
+- Inverted index: hash bucket -> (rows, weights) postings, so a query only touches
+  the guests sharing one of its terms (vectorized numpy gather/scatter per term)
+- Location filter: distinct guest locations are tokenized once; a filter selects the
+  locations containing all of its tokens and masks their guests in one gather
+- Top-k: per-block argpartition candidates pushed through a k-sized heap
+
+Matches have the search-people-tool.ts output shape (username, name, headline,
+location, summary, score, reasoning, avatar, email). summary is the company TL;DR or
+LinkedIn summary (no LLM call), reasoning names the query terms the guest matched.
+
+HTTP service (stdlib, one thread per request):
+- GET  /search?query=...&location=...&limit=3
+- POST /search  {"query": "...", "location": "...", "limit": 3}
+- GET  /health
+
+Requires numpy (pip install numpy).
+
+Usage:
+    python match_engine.py --query "fintech founders" --location Berlin
+    python match_engine.py --serve --port 8765
+"""
+
+import argparse
+import heapq
+import logging
+import sys
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import json_backend
+from match_features import (
+    DEFAULT_MATRIX_FILE, FEATURE_DIM, FEATURES_VERSION, FeatureBuilder,
+    _bucket, _require_numpy, metadata_path_for, np, tokenize
+)
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_PROFILES_FILE = SCRIPT_DIR / "unified_guests_all.json"
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_LIMIT = 3  # search-people-tool.ts default
+MAX_LIMIT = 100
+TOP_K_BLOCK = 16384  # Rows per top-k block
+SUMMARY_CHARS = 300
+
+# Common short forms in location filters -> the spelling LinkedIn locations use
+LOCATION_ALIASES = {
+    "sf": "san francisco",
+    "nyc": "new york",
+    "la": "los angeles",
+    "uk": "united kingdom",
+    "us": "united states",
+    "usa": "united states",
+}
+
+logger = logging.getLogger(__name__)
+
+
+class Match(NamedTuple):
+    username: str
+    name: str
+    headline: str
+    location: str
+    summary: str
+    score: float
+    reasoning: str
+    avatar: str
+    email: str
+
+
+class _Record(NamedTuple):
+    """Display fields of one guest (everything else is dropped after loading)"""
+    name: str
+    headline: str
+    location: str
+    summary: str
+    avatar: str
+    email: str
+
+
+def _display_record(profile: Dict) -> _Record:
+    """Display fields, with the same fallbacks scripts/seed-vectara.ts uses"""
+    linkedin = profile.get("linkedin") or {}
+    cerebralvalley = profile.get("cerebralvalley") or {}
+    whitecontext = profile.get("whitecontext") or {}
+
+    if linkedin.get("firstname") and linkedin.get("lastname"):
+        name = f"{linkedin['firstname']} {linkedin['lastname']}"
+    else:
+        name = (cerebralvalley.get("metadata") or {}).get("field_1") or profile["username"]
+
+    headline = linkedin.get("headline") or (profile.get("position") or {}).get("title") or ""
+    location = linkedin.get("location") or ""
+    if not location:
+        headquarters = (profile.get("company") or {}).get("headquarters") or {}
+        location = ", ".join(part for part in (headquarters.get("city"), headquarters.get("country")) if part)
+
+    summary = whitecontext.get("tldr") or linkedin.get("summary") or ""
+    return _Record(
+        name=name,
+        headline=headline,
+        location=location,
+        summary=summary[:SUMMARY_CHARS],
+        avatar=cerebralvalley.get("avatar") or "",
+        email=(profile.get("contact") or {}).get("email") or "",
+    )
+
+
+def _location_tokens(text: str) -> Tuple[str, ...]:
+    return tuple(" ".join(LOCATION_ALIASES.get(token, token) for token in tokenize(text)).split())
+
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+class MatchEngine:
+    """In-memory top-k matcher over the unified guests"""
+
+    def __init__(self, usernames: List[str], matrix: "np.ndarray", idf: "np.ndarray", records: List[_Record]):
+        _require_numpy()
+        if len(usernames) != len(records) or matrix.shape[0] != len(usernames):
+            raise ValueError("Feature matrix, usernames and profiles do not line up")
+
+        self.usernames = usernames
+        self.records = records
+        self.idf = np.asarray(idf, dtype=np.float32)
+        self.dim = len(self.idf)
+
+        # Inverted index in CSC form: postings of bucket b are rows/weights[indptr[b]:indptr[b + 1]]
+        rows, buckets = np.nonzero(matrix)
+        weights = np.asarray(matrix[rows, buckets], dtype=np.float32)
+        order = np.argsort(buckets, kind="stable")  # Keeps rows ascending within a bucket
+        self._posting_rows = rows[order].astype(np.int32)
+        self._posting_weights = weights[order]
+        self._indptr = np.searchsorted(buckets[order], np.arange(self.dim + 1)).astype(np.int64)
+
+        # Location index: row -> location id, location id -> token set
+        location_ids: Dict[str, int] = {}
+        self._location_rows = np.fromiter(
+            (location_ids.setdefault(record.location, len(location_ids)) if record.location else -1 for record in records),
+            dtype=np.int32, count=len(records)
+        )
+        self._locations = [frozenset(_location_tokens(location)) for location in location_ids]
+        self._location_mask = lru_cache(maxsize=256)(self._build_location_mask)
+
+    def __len__(self) -> int:
+        return len(self.usernames)
+
+    @classmethod
+    def from_profiles(cls, profiles: List[Dict], matrix_path: Optional[Path] = None, dim: int = FEATURE_DIM) -> "MatchEngine":
+        """
+        Engine over unified profiles. Uses the saved feature matrix when it covers exactly
+        these guests in the same order, otherwise builds the features.
+        """
+        _require_numpy()
+        usernames = [profile["username"] for profile in profiles]
+        saved = _load_saved_features(matrix_path) if matrix_path else None
+        if saved is not None and saved[0] == usernames:
+            _, matrix, idf = saved
+        else:
+            if saved is not None:
+                logger.warning(f"{matrix_path} was built from other guests; rebuilding the features")
+            builder = FeatureBuilder(dim)
+            for profile in profiles:
+                builder.add(profile)
+            matrix, idf = builder.build()
+        return cls(usernames, matrix, idf, [_display_record(profile) for profile in profiles])
+
+    @classmethod
+    def load(cls, profiles_path: Path = DEFAULT_PROFILES_FILE, matrix_path: Optional[Path] = DEFAULT_MATRIX_FILE) -> "MatchEngine":
+        """Engine over unified_guests_all.json and (if present) its feature matrix"""
+        if matrix_path is not None and not Path(matrix_path).exists():
+            matrix_path = None
+        return cls.from_profiles(json_backend.load(profiles_path), matrix_path)
+
+    def _query_terms(self, query: str) -> Tuple["np.ndarray", "np.ndarray", Dict[int, List[str]]]:
+        """(buckets, normalized weights, bucket -> query tokens), weighted like FeatureMatrix.vectorize"""
+        tokens_by_bucket: Dict[int, List[str]] = {}
+        counts: Dict[int, int] = {}
+        for token in tokenize(query):
+            bucket = _bucket(token, self.dim)
+            counts[bucket] = counts.get(bucket, 0) + 1
+            tokens = tokens_by_bucket.setdefault(bucket, [])
+            if token not in tokens:
+                tokens.append(token)
+
+        buckets = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        weights = (1 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))) * self.idf[buckets]
+        norm = np.sqrt(np.dot(weights, weights))
+        if norm > 0:
+            weights /= norm
+        return buckets, weights, tokens_by_bucket
+
+    def _build_location_mask(self, location: str) -> Optional["np.ndarray"]:
+        tokens = set(_location_tokens(location))
+        if not tokens:
+            return None
+        # Last slot stands for guests without a location (id -1)
+        allowed = np.zeros(len(self._locations) + 1, dtype=bool)
+        for location_id, location_tokens in enumerate(self._locations):
+            if tokens <= location_tokens:
+                allowed[location_id] = True
+        return allowed[self._location_rows]
+
+    def scores(self, buckets: "np.ndarray", weights: "np.ndarray") -> "np.ndarray":
+        """Cosine similarity of every guest to a sparse query vector"""
+        scores = np.zeros(len(self), dtype=np.float32)
+        for bucket, weight in zip(buckets.tolist(), weights.tolist()):
+            start, end = self._indptr[bucket], self._indptr[bucket + 1]
+            # Rows are unique within a bucket's postings, so fancy-index += is exact
+            scores[self._posting_rows[start:end]] += weight * self._posting_weights[start:end]
+        return scores
+
+    def search(self, query: str, location: Optional[str] = None, limit: int = DEFAULT_LIMIT) -> List[Match]:
+        """Top `limit` guests for a free-text need, optionally only those in `location`"""
+        buckets, weights, tokens_by_bucket = self._query_terms(query)
+        if not len(buckets) or limit <= 0:
+            return []
+
+        scores = self.scores(buckets, weights)
+        if location:
+            mask = self._location_mask(location.strip().lower())
+            if mask is not None:
+                scores[~mask] = 0.0
+
+        return [self._match(row, score, buckets, weights, tokens_by_bucket) for score, row in top_k(scores, limit)]
+
+    def _match(self, row: int, score: float, buckets, weights, tokens_by_bucket) -> Match:
+        # Query terms this guest shares, strongest contribution first
+        contributions = []
+        for bucket, weight in zip(buckets.tolist(), weights.tolist()):
+            start, end = self._indptr[bucket], self._indptr[bucket + 1]
+            position = start + np.searchsorted(self._posting_rows[start:end], row)
+            if position < end and self._posting_rows[position] == row:
+                contributions.append((weight * float(self._posting_weights[position]), tokens_by_bucket[bucket]))
+        contributions.sort(key=lambda item: -item[0])
+        terms = [token for _, tokens in contributions for token in tokens]
+
+        record = self.records[row]
+        reasoning = f"Profile matches: {', '.join(terms)}" if terms else "Relevant profile based on search criteria"
+        if record.location:
+            reasoning += f" (based in {record.location})"
+        return Match(
+            username=self.usernames[row],
+            name=record.name,
+            headline=record.headline,
+            location=record.location,
+            summary=record.summary,
+            score=round(score, 4),
+            reasoning=reasoning,
+            avatar=record.avatar,
+            email=record.email,
+        )
+
+
+def top_k(scores: "np.ndarray", k: int, block: int = TOP_K_BLOCK) -> List[Tuple[float, int]]:
+    """
+    (score, row) of the k best positive scores, best first (ties: lower row first).
+    Each block only offers rows beating the heap's current minimum, at most k of them.
+    """
+    heap: List[Tuple[float, int]] = []  # Min-heap of (score, -row)
+    for start in range(0, len(scores), block):
+        chunk = scores[start:start + block]
+        floor = heap[0][0] if len(heap) == k else 0.0
+        candidates = np.flatnonzero(chunk > floor)
+        if len(candidates) > k:
+            # Best k by score, lower row first among ties (argpartition would keep any k of them)
+            candidates = candidates[np.lexsort((candidates, -chunk[candidates]))[:k]]
+        for offset in candidates.tolist():
+            item = (float(chunk[offset]), -(start + offset))
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+    return [(score, -negative_row) for score, negative_row in sorted(heap, reverse=True)]
+
+
+def _load_saved_features(matrix_path: Path) -> Optional[Tuple[List[str], "np.ndarray", "np.ndarray"]]:
+    """(usernames, matrix, idf) of a saved feature matrix, None if it is unreadable or outdated"""
+    try:
+        metadata = json_backend.load(metadata_path_for(matrix_path))
+        if metadata.get("version") != FEATURES_VERSION:
+            return None
+        matrix = np.load(matrix_path)
+    except (OSError, ValueError):
+        return None
+    return metadata["usernames"], matrix, np.asarray(metadata["idf"], dtype=np.float32)
+
+
+# ============================================================================
+# HTTP SERVICE
+# ============================================================================
+
+def search_response(engine: MatchEngine, request: Dict) -> Dict:
+    """search-people-tool.ts response for a {query, location?, limit?} request"""
+    query = request.get("query")
+    if not isinstance(query, str) or not query.strip():
+        return {"success": False, "matches": [], "error": "query is required"}
+    location = request.get("location") or None
+    limit = request.get("limit")
+    try:
+        limit = DEFAULT_LIMIT if limit is None else int(limit)
+    except (TypeError, ValueError):
+        return {"success": False, "matches": [], "error": "limit must be a number"}
+    if limit < 0:
+        return {"success": False, "matches": [], "error": "limit must not be negative"}
+    limit = min(limit, MAX_LIMIT)
+
+    matches = engine.search(query, location if isinstance(location, str) else None, limit)
+    return {"success": True, "matches": [match._asdict() for match in matches]}
+
+
+class MatchServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], engine: MatchEngine):
+        super().__init__(address, MatchRequestHandler)
+        self.engine = engine
+
+
+class MatchRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive: every response has a Content-Length
+    disable_nagle_algorithm = True  # Headers and body go out as separate writes
+    server: MatchServer
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/health":
+            self._send(200, {"status": "ok", "profiles": len(self.server.engine)})
+        elif url.path == "/search":
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            self._send_search(params)
+        else:
+            self._send(404, {"success": False, "matches": [], "error": f"Unknown path: {url.path}"})
+
+    def do_POST(self):
+        if urlparse(self.path).path != "/search":
+            self._send(404, {"success": False, "matches": [], "error": f"Unknown path: {self.path}"})
+            return
+        try:
+            request = json_backend.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+        except ValueError:
+            self._send(400, {"success": False, "matches": [], "error": "Body must be JSON"})
+            return
+        if not isinstance(request, dict):
+            self._send(400, {"success": False, "matches": [], "error": "Body must be a JSON object"})
+            return
+        self._send_search(request)
+
+    def _send_search(self, request: Dict):
+        response = search_response(self.server.engine, request)
+        self._send(200 if response["success"] else 400, response)
+
+    def _send(self, status: int, body: Dict):
+        data = json_backend.dumps(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+def serve(engine: MatchEngine, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+    """Serve the engine until interrupted"""
+    with MatchServer((host, port), engine) as server:
+        logger.info(f"Matching {len(engine):,} guests on http://{host}:{server.server_port}/search")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Local top-k people matching over the unified guests")
+    parser.add_argument("--query", help="Print the best matches for this free-text need")
+    parser.add_argument("--location", help="Only match guests in this location")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT)
+    parser.add_argument("--serve", action="store_true", help="Run the HTTP service")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--profiles", type=Path, default=DEFAULT_PROFILES_FILE, help="Unified guests (default: %(default)s)")
+    parser.add_argument("--matrix", type=Path, default=DEFAULT_MATRIX_FILE, help="Feature matrix, built when missing (default: %(default)s)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if not args.query and not args.serve:
+        parser.error("give --query and/or --serve")
+
+    start = time.perf_counter()
+    engine = MatchEngine.load(args.profiles, args.matrix)
+    logger.info(f"Loaded {len(engine):,} guests in {time.perf_counter() - start:.1f}s")
+
+    if args.query:
+        start = time.perf_counter()
+        matches = engine.search(args.query, args.location, args.limit)
+        elapsed = (time.perf_counter() - start) * 1000
+        for match in matches:
+            print(f"{match.score:6.3f}  {match.username}  {match.name} - {match.headline} ({match.location or 'no location'})")
+            print(f"        {match.reasoning}")
+        print(f"{len(matches)} matches in {elapsed:.2f} ms", file=sys.stderr)
+
+    if args.serve:
+        serve(engine, args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+Local Matching Features
+Deterministic per-guest feature vectors for local similarity search and offline
+evaluation, computed from the unified profiles (unify_data.py --features).
+
+Text fields (weight):
+- linkedin.headline (1.0), linkedin.summary (0.5), company.industry (1.0)
+- whitecontext.context_tags (1.5), whitecontext.company_intelligence.challenge_areas (1.0)
+
+Each token is hashed (CRC-32, so vectors are identical across processes and runs) into
+one of FEATURE_DIM buckets; bucket weights are sublinear term frequency x smoothed IDF
+over the guest list, and every row is L2-normalized, so the dot product of two rows is
+their cosine similarity.
+
+Files:
+- unified_guests_features.npy: float32 matrix, one row per guest (np.load(..., mmap_mode="r"))
+- unified_guests_features.json: usernames (row order), IDF per bucket and the settings
+  needed to vectorize a query the same way
+
+Requires numpy (pip install numpy).
+
+Usage:
+    python match_features.py 258258258 --top 10              # most similar guests
+    python match_features.py --query "fintech fraud detection"
+"""
+
+import argparse
+import math
+import re
+import sys
+import zlib
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import json_backend
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency
+    np = None
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_MATRIX_FILE = SCRIPT_DIR / "unified_guests_features.npy"
+
+FEATURES_VERSION = 1
+FEATURE_DIM = 512  # Hash buckets per vector (100k guests x 512 x float32 = 205 MB)
+
+# (path into the unified profile, weight)
+FEATURE_FIELDS: List[Tuple[Tuple[str, ...], float]] = [
+    (("linkedin", "headline"), 1.0),
+    (("linkedin", "summary"), 0.5),
+    (("company", "industry"), 1.0),
+    (("whitecontext", "context_tags"), 1.5),
+    (("whitecontext", "company_intelligence", "challenge_areas"), 1.0),
+]
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the their "
+    "they this to we with you your will can".split()
+)
+
+
+def metadata_path_for(matrix_path: Path) -> Path:
+    """Row index / settings file that belongs to a feature matrix"""
+    return Path(matrix_path).with_suffix(".json")
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("Matching features need numpy (pip install numpy)")
+
+
+# ============================================================================
+# TOKENIZING / HASHING
+# ============================================================================
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS and len(token) > 1]
+
+
+@lru_cache(maxsize=1 << 16)
+def _bucket(token: str, dim: int) -> int:
+    return zlib.crc32(token.encode("utf-8")) % dim
+
+
+@lru_cache(maxsize=1 << 16)
+def _text_buckets(text: str, dim: int) -> Tuple[int, ...]:
+    # Headlines, industries, tags and challenge areas repeat across colleagues
+    return tuple(_bucket(token, dim) for token in tokenize(text))
+
+
+def _field_text(profile: Dict, path: Tuple[str, ...]) -> str:
+    value = profile
+    for key in path:
+        if not isinstance(value, dict):
+            return ""
+        value = value.get(key)
+    if isinstance(value, list):
+        return " ".join(item for item in value if isinstance(item, str))
+    return value if isinstance(value, str) else ""
+
+
+def weighted_terms(profile: Dict, dim: int = FEATURE_DIM, fields: Optional[List] = None) -> Dict[int, float]:
+    """Bucket -> field-weighted term count of one unified profile (fields: (path, weight) pairs)"""
+    terms: Dict[int, float] = {}
+    for path, weight in fields or FEATURE_FIELDS:
+        text = _field_text(profile, path)
+        if not text:
+            continue
+        for bucket in _text_buckets(text, dim):
+            terms[bucket] = terms.get(bucket, 0.0) + weight
+    return terms
+
+
+# ============================================================================
+# BUILDING
+# ============================================================================
+
+class FeatureBuilder:
+    """
+    Collect sparse term weights profile by profile (streaming-friendly), then
+    compute IDF over all of them and emit the dense, normalized matrix.
+    """
+
+    def __init__(self, dim: int = FEATURE_DIM, fields: Optional[List] = None):
+        _require_numpy()
+        self.dim = dim
+        self.fields = fields or FEATURE_FIELDS
+        self.usernames: List[str] = []
+        # Sparse (row, bucket, weight) triplets in typed arrays: ~12 bytes per term
+        self._rows = array("i")
+        self._cols = array("i")
+        self._values = array("f")
+
+    def __len__(self) -> int:
+        return len(self.usernames)
+
+    def add(self, profile: Dict):
+        row = len(self.usernames)
+        self.usernames.append(profile["username"])
+        for bucket, weight in weighted_terms(profile, self.dim, self.fields).items():
+            self._rows.append(row)
+            self._cols.append(bucket)
+            self._values.append(weight)
+
+    def build(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """(matrix, idf): rows are TF-IDF weighted and L2-normalized"""
+        rows = np.frombuffer(self._rows, dtype=np.int32)
+        cols = np.frombuffer(self._cols, dtype=np.int32)
+        values = np.frombuffer(self._values, dtype=np.float32)
+
+        document_frequency = np.bincount(cols, minlength=self.dim)
+        idf = (np.log((1 + len(self)) / (1 + document_frequency)) + 1).astype(np.float32)
+
+        # Normalize the sparse weights before scattering them (no dense temporaries)
+        weights = (1 + np.log(values)) * idf[cols]
+        norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=len(self))).astype(np.float32)
+        weights /= norms[rows]
+
+        matrix = np.zeros((len(self), self.dim), dtype=np.float32)
+        matrix[rows, cols] = weights
+        return matrix, idf
+
+    def save(self, matrix_path: Path) -> int:
+        """Write the matrix and its row index; returns the number of rows"""
+        matrix, idf = self.build()
+        np.save(matrix_path, matrix)
+        json_backend.dump({
+            "version": FEATURES_VERSION,
+            "dim": self.dim,
+            "fields": [{"path": ".".join(path), "weight": weight} for path, weight in self.fields],
+            "idf": [round(float(value), 6) for value in idf],
+            "usernames": self.usernames,
+        }, metadata_path_for(matrix_path))
+        return len(self)
+
+
+def build_feature_matrix(profiles: Iterable[Dict], dim: int = FEATURE_DIM) -> Tuple[List[str], "np.ndarray", "np.ndarray"]:
+    """(usernames, matrix, idf) for a list of unified profiles"""
+    builder = FeatureBuilder(dim)
+    for profile in profiles:
+        builder.add(profile)
+    matrix, idf = builder.build()
+    return builder.usernames, matrix, idf
+
+
+# ============================================================================
+# LOADING / QUERYING
+# ============================================================================
+
+class FeatureMatrix:
+    """A saved feature matrix (memory-mapped) with its username row index"""
+
+    def __init__(self, matrix_path: Path = DEFAULT_MATRIX_FILE, mmap: bool = True):
+        _require_numpy()
+        metadata = json_backend.load(metadata_path_for(matrix_path))
+        if metadata.get("version") != FEATURES_VERSION:
+            raise ValueError(f"Unsupported feature matrix version: {metadata.get('version')}")
+
+        self.dim: int = metadata["dim"]
+        self.usernames: List[str] = metadata["usernames"]
+        self.row_by_username: Dict[str, int] = {username: row for row, username in enumerate(self.usernames)}
+        self.idf = np.asarray(metadata["idf"], dtype=np.float32)
+        self.matrix = np.load(matrix_path, mmap_mode="r" if mmap else None)
+        if self.matrix.shape != (len(self.usernames), self.dim):
+            raise ValueError(f"{matrix_path} does not match its row index")
+
+    def __len__(self) -> int:
+        return len(self.usernames)
+
+    def vector(self, username: str) -> Optional["np.ndarray"]:
+        row = self.row_by_username.get(username)
+        return None if row is None else np.asarray(self.matrix[row])
+
+    def vectorize(self, text: str) -> "np.ndarray":
+        """Query vector for free text, weighted like a profile field of weight 1"""
+        terms = weighted_terms({"query": text}, self.dim, [(("query",), 1.0)])
+        vector = np.zeros(self.dim, dtype=np.float32)
+        if terms:
+            buckets = np.fromiter(terms.keys(), dtype=np.int64, count=len(terms))
+            weights = np.fromiter(terms.values(), dtype=np.float32, count=len(terms))
+            vector[buckets] = (1 + np.log(weights)) * self.idf[buckets]
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector /= norm
+        return vector
+
+    def most_similar(self, vector: "np.ndarray", k: int = 10, exclude: Optional[str] = None) -> List[Tuple[str, float]]:
+        """Top-k (username, cosine similarity) for a query vector"""
+        scores = self.matrix @ vector
+        if exclude is not None and exclude in self.row_by_username:
+            scores[self.row_by_username[exclude]] = -math.inf
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.usernames[row], float(scores[row])) for row in top]
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the local matching feature matrix")
+    parser.add_argument("usernames", nargs="*", help="Print the guests most similar to these")
+    parser.add_argument("--query", help="Print the guests most similar to this free text")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--matrix", type=Path, default=DEFAULT_MATRIX_FILE, help="Feature matrix (default: %(default)s)")
+    args = parser.parse_args()
+
+    features = FeatureMatrix(args.matrix)
+    queries = [(username, features.vector(username), username) for username in args.usernames]
+    if args.query:
+        queries.append((repr(args.query), features.vectorize(args.query), None))
+
+    for label, vector, exclude in queries:
+        if vector is None:
+            print(f"Unknown username: {label}", file=sys.stderr)
+            continue
+        print(f"\n{label}:")
+        for username, score in features.most_similar(vector, args.top, exclude):
+            print(f"  {score:6.3f}  {username}")
+
+
+if __name__ == "__main__":
+    main()
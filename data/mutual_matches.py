@@ -0,0 +1,343 @@
+"""
+Mutual Match Precomputation
+Every attendee's top-N mutual matches, computed ahead of an event from the unified
+profiles and written to an mmap'd file the app can serve without any scoring.
+
+Each attendee gets two hashed TF-IDF vectors (match_features.FeatureBuilder):
+- needs:  challenge areas (expanded with what would address them, see NEED_OFFERS)
+          plus onboarding lookingFor / goals when --contexts provides them
+- offers: products & services, context tags, headline / position title, plus
+          onboarding skills
+
+For attendees A and B:
+- needs score   = needs(A) . offers(B)   (B offers what A needs)
+- offers score  = needs(B) . offers(A)   (A offers what B needs)
+- mutual score  = sqrt(needs score x offers score), zero unless both directions match
+
+Scores are computed one block of attendees at a time (two block x N matrix products,
+top-N by argpartition), so memory stays O(block x N) instead of N x N, and blocks
+are spread over --workers processes. numpy's BLAS may already use several threads
+per product; with many workers, OPENBLAS_NUM_THREADS=1 avoids oversubscription.
+
+File (unified_guests_matches.bin), attendees sorted by UTF-8 username:
+- header: attendees, N, table offsets
+- username table: fixed-width (offset, length) records, binary searched
+- match table: N fixed-width (row, mutual, needs score, offers score) records per
+  attendee, best first; unused slots have row 0xFFFFFFFF
+
+Requires numpy (pip install numpy).
+
+Usage:
+    python mutual_matches.py --build --top 20 --workers 4
+    python mutual_matches.py --build --contexts user_contexts.json   # {username: {lookingFor, skills, goals}}
+    python mutual_matches.py 258258258                               # print one attendee's matches
+"""
+
+import argparse
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import json_backend
+from match_features import FEATURE_DIM, FeatureBuilder, _require_numpy, np
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_PROFILES_FILE = SCRIPT_DIR / "unified_guests_all.json"
+DEFAULT_MATCHES_FILE = SCRIPT_DIR / "unified_guests_matches.bin"
+
+DEFAULT_TOP_N = 10
+BLOCK_ROWS = 256  # Attendees scored per block: 3 x 256 x N float32 temporaries
+
+MAGIC = b"UGMM1\n\0\0"
+HEADER = struct.Struct("<5Q")  # attendees, top N, users table, matches table, heap
+USER_RECORD = struct.Struct("<QI")  # key offset, key length
+MATCH_DTYPE = [("row", "<u4"), ("score", "<f4"), ("needs", "<f4"), ("offers", "<f4")]
+EMPTY_ROW = 0xFFFFFFFF
+
+# Challenge area -> words of the offers that address it, so "fundraising" meets investors
+NEED_OFFERS = {
+    "hiring": "recruiting talent hiring",
+    "fundraising": "investor venture capital fundraising",
+    "go-to-market": "sales marketing growth go-to-market",
+    "enterprise sales": "sales enterprise partnerships",
+    "data quality": "data quality analytics",
+    "latency": "infra performance latency",
+    "compliance": "compliance security legal",
+}
+
+# (side document key, weight): see side_documents()
+NEEDS_FIELDS = [(("challenges",), 1.0), (("looking_for",), 1.5), (("goals",), 1.0)]
+OFFERS_FIELDS = [(("products",), 1.0), (("tags",), 1.0), (("headline",), 0.5), (("skills",), 1.5)]
+
+logger = logging.getLogger(__name__)
+
+
+def side_documents(profile: Dict, context: Optional[Dict] = None) -> Tuple[Dict, Dict]:
+    """(needs, offers) text documents of one attendee (context: onboarding user_context)"""
+    context = context or {}
+    linkedin = profile.get("linkedin") or {}
+    whitecontext = profile.get("whitecontext") or {}
+    challenges = (whitecontext.get("company_intelligence") or {}).get("challenge_areas") or []
+
+    needs = {
+        "challenges": " ".join(NEED_OFFERS.get(area.lower(), area) for area in challenges if isinstance(area, str)),
+        "looking_for": context.get("lookingFor") or "",
+        "goals": context.get("goals") or [],
+    }
+    offers = {
+        "products": " ".join(
+            f"{item.get('name') or ''} {item.get('description') or ''}" if isinstance(item, dict) else str(item)
+            for item in whitecontext.get("products_services") or []
+        ),
+        "tags": whitecontext.get("context_tags") or [],
+        "headline": linkedin.get("headline") or (profile.get("position") or {}).get("title") or "",
+        "skills": context.get("skills") or [],
+    }
+    return needs, offers
+
+
+def build_side_matrices(profiles: List[Dict], contexts: Optional[Dict[str, Dict]] = None, dim: int = FEATURE_DIM):
+    """(usernames sorted by UTF-8 bytes, needs matrix, offers matrix)"""
+    contexts = contexts or {}
+    profiles = sorted(profiles, key=lambda profile: profile["username"].encode("utf-8"))
+    needs_builder, offers_builder = FeatureBuilder(dim, NEEDS_FIELDS), FeatureBuilder(dim, OFFERS_FIELDS)
+    for profile in profiles:
+        username = profile["username"]
+        needs, offers = side_documents(profile, contexts.get(username))
+        needs_builder.add({"username": username, **needs})
+        offers_builder.add({"username": username, **offers})
+    return needs_builder.usernames, needs_builder.build()[0], offers_builder.build()[0]
+
+
+# ============================================================================
+# BLOCKED SCORING
+# ============================================================================
+
+_needs = None
+_offers = None
+
+
+def _init_worker(needs_path: str, offers_path: str):
+    global _needs, _offers
+    _needs = np.load(needs_path, mmap_mode="r")
+    _offers = np.load(offers_path, mmap_mode="r")
+
+
+def score_block(start: int, top_n: int = DEFAULT_TOP_N, block_rows: int = BLOCK_ROWS) -> "np.ndarray":
+    """Top-N match records (MATCH_DTYPE, shape block x N) for attendees start..start+block_rows"""
+    end = min(start + block_rows, len(_needs))
+    needs_scores = np.asarray(_needs[start:end]) @ np.asarray(_offers).T  # [a, b]: b offers what a needs
+    offers_scores = np.asarray(_offers[start:end]) @ np.asarray(_needs).T  # [a, b]: a offers what b needs
+
+    mutual = needs_scores * offers_scores
+    np.sqrt(mutual, out=mutual)
+    block = np.arange(end - start)
+    mutual[block, block + start] = 0.0  # Never match yourself
+
+    top_n = min(top_n, mutual.shape[1])
+    top = np.argpartition(-mutual, top_n - 1, axis=1)[:, :top_n]
+    top_scores = np.take_along_axis(mutual, top, axis=1)
+    order = np.lexsort((top, -top_scores), axis=1)  # Best first, ties by row
+    top = np.take_along_axis(top, order, axis=1)
+
+    records = np.zeros((end - start, top_n), dtype=MATCH_DTYPE)
+    records["score"] = np.take_along_axis(mutual, top, axis=1)
+    records["needs"] = np.take_along_axis(needs_scores, top, axis=1)
+    records["offers"] = np.take_along_axis(offers_scores, top, axis=1)
+    records["row"] = np.where(records["score"] > 0, top, EMPTY_ROW)
+    return records
+
+
+def iter_match_blocks(
+    needs: "np.ndarray",
+    offers: "np.ndarray",
+    top_n: int = DEFAULT_TOP_N,
+    workers: int = 1,
+    block_rows: int = BLOCK_ROWS
+) -> Iterator["np.ndarray"]:
+    """Match records block by block, in attendee order"""
+    global _needs, _offers
+    starts = range(0, len(needs), block_rows)
+    if workers <= 1:
+        _needs, _offers = needs, offers
+        for start in starts:
+            yield score_block(start, top_n, block_rows)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Workers memory-map the side matrices instead of receiving pickled copies
+        needs_path, offers_path = os.path.join(tmp, "needs.npy"), os.path.join(tmp, "offers.npy")
+        np.save(needs_path, needs)
+        np.save(offers_path, offers)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(needs_path, offers_path)) as pool:
+            yield from pool.map(score_block, starts, [top_n] * len(starts), [block_rows] * len(starts))
+
+
+# ============================================================================
+# FILE
+# ============================================================================
+
+def write_matches(path: Path, usernames: List[str], blocks: Iterator["np.ndarray"], top_n: int) -> int:
+    """Write the match file (usernames sorted by UTF-8 bytes, blocks in the same order); returns pairs written"""
+    users_table = len(MAGIC) + HEADER.size
+    matches_table = users_table + USER_RECORD.size * len(usernames)
+    heap = matches_table + np.dtype(MATCH_DTYPE).itemsize * top_n * len(usernames)
+
+    keys = [username.encode("utf-8") for username in usernames]
+    users = bytearray()
+    key_offset = heap
+    for key in keys:
+        users += USER_RECORD.pack(key_offset, len(key))
+        key_offset += len(key)
+
+    pairs = rows = 0
+    tmp_path = Path(path).with_name(Path(path).name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(HEADER.pack(len(usernames), top_n, users_table, matches_table, heap))
+        f.write(users)
+        for block in blocks:
+            if block.shape[1] < top_n:  # Fewer attendees than N
+                block = np.concatenate([block, np.zeros((len(block), top_n - block.shape[1]), dtype=MATCH_DTYPE)], axis=1)
+                block["row"][block["score"] <= 0] = EMPTY_ROW
+            f.write(block.tobytes())
+            pairs += int(np.count_nonzero(block["row"] != EMPTY_ROW))
+            rows += len(block)
+        f.write(b"".join(keys))
+    if rows != len(usernames):
+        tmp_path.unlink()
+        raise ValueError(f"Scored {rows} attendees, expected {len(usernames)}")
+    os.replace(tmp_path, path)
+    return pairs
+
+
+class MutualMatches:
+    """Serve precomputed matches from the mmap'd match file"""
+
+    def __init__(self, path: Path = DEFAULT_MATCHES_FILE):
+        _require_numpy()
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._file[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a mutual match file: {self.path}")
+
+        self._count, self.top_n, self._users_table, matches_table, _ = HEADER.unpack_from(self._file, len(MAGIC))
+        self._matches = np.frombuffer(
+            self._file, dtype=MATCH_DTYPE, count=self._count * self.top_n, offset=matches_table
+        ).reshape(self._count, self.top_n)
+
+    def close(self):
+        self._matches = None  # Release the buffer before closing the map
+        self._file.close()
+
+    def __enter__(self) -> "MutualMatches":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, username: str) -> bool:
+        return self._find(username) is not None
+
+    def _username(self, row: int) -> bytes:
+        key_offset, key_length = USER_RECORD.unpack_from(self._file, self._users_table + row * USER_RECORD.size)
+        return self._file[key_offset:key_offset + key_length]
+
+    def _find(self, username: str) -> Optional[int]:
+        key = username.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            candidate = self._username(mid)
+            if candidate < key:
+                lo = mid + 1
+            elif candidate > key:
+                hi = mid
+            else:
+                return mid
+        return None
+
+    def get(self, username: str, limit: Optional[int] = None) -> Optional[List[Dict]]:
+        """Best mutual matches first, or None if the username is unknown"""
+        row = self._find(username)
+        if row is None:
+            return None
+        return [
+            {
+                "username": self._username(int(match["row"])).decode("utf-8"),
+                "score": round(float(match["score"]), 4),
+                "needs_score": round(float(match["needs"]), 4),
+                "offers_score": round(float(match["offers"]), 4),
+            }
+            for match in self._matches[row, :limit]
+            if match["row"] != EMPTY_ROW
+        ]
+
+
+def build_mutual_matches(
+    profiles: List[Dict],
+    path: Path = DEFAULT_MATCHES_FILE,
+    top_n: int = DEFAULT_TOP_N,
+    workers: int = 1,
+    contexts: Optional[Dict[str, Dict]] = None,
+    block_rows: int = BLOCK_ROWS
+) -> int:
+    """Score every attendee against every other and write the match file; returns pairs written"""
+    _require_numpy()
+    usernames, needs, offers = build_side_matrices(profiles, contexts)
+    return write_matches(path, usernames, iter_match_blocks(needs, offers, top_n, workers, block_rows), top_n)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute and look up mutual attendee matches")
+    parser.add_argument("usernames", nargs="*", help="Print these attendees' matches")
+    parser.add_argument("--build", action="store_true", help="Score all pairs and write the match file")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP_N, help="Matches kept per attendee (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=1, help="Scoring processes (default: %(default)s)")
+    parser.add_argument("--profiles", type=Path, default=DEFAULT_PROFILES_FILE, help="Unified guests (default: %(default)s)")
+    parser.add_argument("--contexts", type=Path, help="JSON object: username -> onboarding context (lookingFor, skills, goals)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_MATCHES_FILE, help="Match file (default: %(default)s)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if not args.build and not args.usernames:
+        parser.error("give --build and/or usernames")
+
+    if args.build:
+        start = time.perf_counter()
+        profiles = json_backend.load(args.profiles)
+        contexts = json_backend.load(args.contexts) if args.contexts else None
+        pairs = build_mutual_matches(profiles, args.output, max(1, args.top), max(1, args.workers), contexts)
+        logger.info(f"✓ {pairs:,} matches for {len(profiles):,} attendees in {time.perf_counter() - start:.1f}s -> {args.output}")
+
+    if args.usernames:
+        with MutualMatches(args.output) as matches:
+            for username in args.usernames:
+                found = matches.get(username)
+                if found is None:
+                    print(f"Unknown username: {username}", file=sys.stderr)
+                    continue
+                print(f"\n{username}:")
+                for match in found:
+                    print(f"  {match['score']:6.3f}  {match['username']}  "
+                          f"(needs {match['needs_score']:.3f}, offers {match['offers_score']:.3f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Profile Change Sets
+Snapshot of the unified outputs (username -> content hash) and the change set of a
+run against the previous snapshot, so downstream indexers (scripts/seed-vectara.ts
+--changes) upsert and delete only what changed instead of rebuilding the corpus.
+
+- unified_guests_snapshot.json: {version, id, profiles: {username: hash}}. The id is a
+  hash of the whole snapshot, so identical outputs always get the same id.
+- unified_guests_changes.json: {version, base, snapshot, counts, added, updated, removed}
+  added/updated hold the new unified profiles, removed the usernames. base is the id of
+  the snapshot the changes apply to; it is null when there was no previous snapshot
+  (or the snapshot version changed), and then the change set is empty and consumers
+  rebuild from unified_guests_all.json.
+
+A consumer records the snapshot id it last applied. If a change set's base is not
+that id, some run in between was not applied and it has to rebuild.
+
+unify_data.py --changes writes both files in every mode; the change set is written
+first, so an interrupted run leaves the old snapshot and the next run's change set
+covers both runs.
+
+Usage:
+    python profile_delta.py                      # Summarize the last change set
+    python profile_delta.py --changes out.json
+"""
+
+import argparse
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import json_backend
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_SNAPSHOT_FILE = SCRIPT_DIR / "unified_guests_snapshot.json"
+DEFAULT_CHANGES_FILE = SCRIPT_DIR / "unified_guests_changes.json"
+
+SNAPSHOT_VERSION = 1  # Bump when profile_hash() changes (the next change set is then a rebuild)
+
+
+# ============================================================================
+# SNAPSHOTS
+# ============================================================================
+
+def profile_hash(profile: Dict) -> str:
+    """Content hash of a unified profile (key order independent)"""
+    canonical = json_backend.dumps(profile, sort_keys=True)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def snapshot_id(hashes: Dict[str, str]) -> str:
+    """Identity of a whole snapshot"""
+    digest = hashlib.blake2b(digest_size=16)
+    for username in sorted(hashes):
+        digest.update(f"{username}\0{hashes[username]}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_snapshot(path: Path = DEFAULT_SNAPSHOT_FILE) -> Optional[Dict]:
+    """Load the previous snapshot, if it is usable"""
+    if not path.exists():
+        return None
+    snapshot = json_backend.load(path)
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def _replace(obj: Dict, path: Path, pretty: bool):
+    tmp_path = path.with_name(path.name + ".tmp")
+    json_backend.dump(obj, tmp_path, pretty=pretty)
+    os.replace(tmp_path, path)
+
+
+# ============================================================================
+# CHANGE SETS
+# ============================================================================
+
+class DeltaBuilder:
+    """Compares profiles, one at a time, with a previous snapshot"""
+
+    def __init__(self, previous: Optional[Dict] = None):
+        self.base = previous["id"] if previous else None
+        self.previous_hashes = previous["profiles"] if previous else {}
+        self.hashes: Dict[str, str] = {}
+        self.changed: Dict[str, Dict] = {}  # Only profiles that differ from the snapshot are kept
+
+    def add(self, profile: Dict):
+        username = profile["username"]
+        content_hash = profile_hash(profile)
+        self.hashes[username] = content_hash
+        if self.base and self.previous_hashes.get(username) != content_hash:
+            self.changed[username] = profile
+        else:
+            self.changed.pop(username, None)  # Duplicate username: the last profile wins
+
+    def changes(self) -> Dict:
+        """The change set of the profiles added so far"""
+        added: List[Dict] = []
+        updated: List[Dict] = []
+        for username, profile in self.changed.items():
+            (updated if username in self.previous_hashes else added).append(profile)
+        removed = [username for username in self.previous_hashes if username not in self.hashes] if self.base else []
+
+        return {
+            "version": SNAPSHOT_VERSION,
+            "base": self.base,
+            "snapshot": snapshot_id(self.hashes),
+            "counts": {
+                "added": len(added),
+                "updated": len(updated),
+                "removed": len(removed),
+                "unchanged": len(self.hashes) - len(added) - len(updated)
+            },
+            "added": added,
+            "updated": updated,
+            "removed": removed
+        }
+
+    def save(self, changes_path: Path = DEFAULT_CHANGES_FILE, snapshot_path: Path = DEFAULT_SNAPSHOT_FILE,
+             pretty: bool = False) -> Dict:
+        """Write the change set, then the new snapshot; returns the change set"""
+        changes = self.changes()
+        _replace(changes, changes_path, pretty)
+        _replace({"version": SNAPSHOT_VERSION, "id": changes["snapshot"], "profiles": self.hashes}, snapshot_path, pretty)
+        return changes
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize a unified profile change set")
+    parser.add_argument("--changes", type=Path, default=DEFAULT_CHANGES_FILE, help="Change set (default: %(default)s)")
+    args = parser.parse_args()
+
+    changes = json_backend.load(args.changes)
+    counts = changes["counts"]
+    print(f"Snapshot {changes['snapshot']} (base {changes['base'] or 'none - rebuild'})")
+    print(f"  {counts['added']:,} added, {counts['updated']:,} updated, {counts['removed']:,} removed, "
+          f"{counts['unchanged']:,} unchanged")
+
+
+if __name__ == "__main__":
+    main()
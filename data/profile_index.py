@@ -0,0 +1,229 @@
+"""
+Memory-Mapped Unified Profile Index
+Single-profile lookups into unified_guests_all.json without parsing the whole file.
+
+unify_data.py writes unified_guests_all.idx next to the JSON output:
+- username -> byte offset/length of that profile inside unified_guests_all.json
+- normalized company domain -> usernames working there
+
+Both tables are sorted and fixed-width, so lookups binary-search the mmap'd index and
+slice the mmap'd JSON file; only the requested profile is ever decoded.
+
+Usage:
+    python profile_index.py 258258258
+    python profile_index.py --domain https://www.example.com
+"""
+
+import argparse
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import json_backend
+from domain_normalizer import normalize_domain
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_DATA_FILE = SCRIPT_DIR / "unified_guests_all.json"
+
+MAGIC = b"UGIDX1\n\0"
+HEADER = struct.Struct("<7Q")  # data size, users, users table, domains, domains table, postings, heap
+USER_RECORD = struct.Struct("<QIQI")  # key offset, key length, profile offset, profile length
+DOMAIN_RECORD = struct.Struct("<QIQI")  # key offset, key length, postings offset, postings count
+POSTING = struct.Struct("<I")  # index into the username table
+
+
+def index_path_for(data_path: Path) -> Path:
+    """Index file that belongs to a unified JSON output"""
+    return data_path.with_suffix(".idx")
+
+
+# ============================================================================
+# WRITER
+# ============================================================================
+
+def write_profile_index(index_path: Path, data_path: Path, entries: Iterable[tuple[str, int, int, Optional[str]]]):
+    """
+    Write the index for data_path.
+    entries - (username, byte offset, byte length, normalized domain or None); later
+    entries win for duplicate usernames, matching dict semantics of the JSON consumers.
+    """
+    profiles = {}
+    for username, offset, length, domain in entries:
+        if username:
+            profiles[username] = (offset, length, domain)
+
+    usernames = sorted(profiles, key=lambda name: name.encode('utf-8'))
+    position_by_username = {username: i for i, username in enumerate(usernames)}
+
+    usernames_by_domain: Dict[str, List[int]] = {}
+    for username in usernames:
+        domain = profiles[username][2]
+        if domain:
+            usernames_by_domain.setdefault(domain, []).append(position_by_username[username])
+    domains = sorted(usernames_by_domain, key=lambda domain: domain.encode('utf-8'))
+
+    users_table = len(MAGIC) + HEADER.size
+    domains_table = users_table + USER_RECORD.size * len(usernames)
+    postings = domains_table + DOMAIN_RECORD.size * len(domains)
+    heap = postings + POSTING.size * sum(len(positions) for positions in usernames_by_domain.values())
+
+    heap_bytes = bytearray()
+    body = bytearray()
+
+    for username in usernames:
+        key = username.encode('utf-8')
+        offset, length, _ = profiles[username]
+        body += USER_RECORD.pack(heap + len(heap_bytes), len(key), offset, length)
+        heap_bytes += key
+
+    posting_bytes = bytearray()
+    for domain in domains:
+        key = domain.encode('utf-8')
+        positions = usernames_by_domain[domain]
+        body += DOMAIN_RECORD.pack(heap + len(heap_bytes), len(key), postings + len(posting_bytes), len(positions))
+        heap_bytes += key
+        for position in positions:
+            posting_bytes += POSTING.pack(position)
+
+    with open(index_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(HEADER.pack(
+            data_path.stat().st_size, len(usernames), users_table, len(domains), domains_table, postings, heap
+        ))
+        f.write(body)
+        f.write(posting_bytes)
+        f.write(heap_bytes)
+
+    return len(usernames), len(domains)
+
+
+# ============================================================================
+# READER
+# ============================================================================
+
+class ProfileIndex:
+    """Serve single-profile reads from unified_guests_all.json via the mmap'd index"""
+
+    def __init__(self, data_path: Path = DEFAULT_DATA_FILE, index_path: Optional[Path] = None):
+        self.data_path = Path(data_path)
+        self.index_path = Path(index_path) if index_path else index_path_for(self.data_path)
+
+        with open(self.index_path, 'rb') as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with open(self.data_path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._index[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a unified profile index: {self.index_path}")
+
+        (data_size, self._num_users, self._users_table, self._num_domains,
+         self._domains_table, self._postings, self._heap) = HEADER.unpack_from(self._index, len(MAGIC))
+
+        if data_size != len(self._data):
+            raise ValueError(f"{self.index_path.name} is stale for {self.data_path.name} - re-run unify_data.py")
+
+    def close(self):
+        self._index.close()
+        self._data.close()
+
+    def __enter__(self) -> "ProfileIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return self._num_users
+
+    def __contains__(self, username: str) -> bool:
+        return self._find_user(username) is not None
+
+    def _search(self, table: int, count: int, record: struct.Struct, key: bytes) -> Optional[int]:
+        index = self._index
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key_offset, key_length = struct.unpack_from("<QI", index, table + mid * record.size)
+            candidate = index[key_offset:key_offset + key_length]
+            if candidate < key:
+                lo = mid + 1
+            elif candidate > key:
+                hi = mid
+            else:
+                return mid
+        return None
+
+    def _find_user(self, username: str) -> Optional[int]:
+        return self._search(self._users_table, self._num_users, USER_RECORD, username.encode('utf-8'))
+
+    def _user_at(self, position: int) -> tuple[str, int, int]:
+        key_offset, key_length, offset, length = USER_RECORD.unpack_from(
+            self._index, self._users_table + position * USER_RECORD.size
+        )
+        return self._index[key_offset:key_offset + key_length].decode('utf-8'), offset, length
+
+    def get_raw(self, username: str) -> Optional[bytes]:
+        """Return the profile's JSON text without decoding it"""
+        position = self._find_user(username)
+        if position is None:
+            return None
+        _, offset, length = self._user_at(position)
+        return self._data[offset:offset + length]
+
+    def get(self, username: str) -> Optional[Dict]:
+        """Return one unified profile, or None if the username is unknown"""
+        raw = self.get_raw(username)
+        return json_backend.loads(raw) if raw is not None else None
+
+    def usernames_for_domain(self, domain: str) -> List[str]:
+        """Usernames whose company domain matches (accepts any URL/domain form)"""
+        normalized = normalize_domain(domain)
+        if normalized is None:
+            return []
+
+        position = self._search(self._domains_table, self._num_domains, DOMAIN_RECORD, normalized.encode('utf-8'))
+        if position is None:
+            return []
+
+        _, _, postings, count = DOMAIN_RECORD.unpack_from(
+            self._index, self._domains_table + position * DOMAIN_RECORD.size
+        )
+        return [
+            self._user_at(POSTING.unpack_from(self._index, postings + i * POSTING.size)[0])[0]
+            for i in range(count)
+        ]
+
+    def profiles_for_domain(self, domain: str) -> List[Dict]:
+        """Unified profiles of everyone at a normalized company domain"""
+        return [self.get(username) for username in self.usernames_for_domain(domain)]
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Look up unified profiles by username or company domain")
+    parser.add_argument("usernames", nargs="*", help="Usernames to print")
+    parser.add_argument("--domain", help="Print everyone at this company domain or website")
+    parser.add_argument("--data", type=Path, default=DEFAULT_DATA_FILE, help="Unified JSON file (default: %(default)s)")
+    args = parser.parse_args()
+
+    with ProfileIndex(args.data) as index:
+        usernames = list(args.usernames)
+        if args.domain:
+            usernames.extend(index.usernames_for_domain(args.domain))
+
+        for username in usernames:
+            raw = index.get_raw(username)
+            if raw is None:
+                print(f"Unknown username: {username}", file=sys.stderr)
+                continue
+            print(raw.decode('utf-8'))
+
+
+if __name__ == "__main__":
+    main()
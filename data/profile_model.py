@@ -0,0 +1,464 @@
+"""
+Unified Profile Model
+Slotted dataclasses for the sections of a unified guest profile, as an alternative to
+the nested dicts built by unify_data.build_unified_profile().
+
+A slotted instance stores its fields in a fixed array instead of a per-object hash
+table, so a profile takes a fraction of the memory of the equivalent dict tree, and
+the WhiteContext company section is one shared dict per company (company_table.py).
+
+- build_profile(): model straight from the guest / FullEnrich / WhiteContext records
+- UnifiedProfile.to_dict() / from_dict(): the unified_guests_all.json structure, key for key
+- UnifiedProfile.to_row() / from_row(): compact positional rows (no keys)
+- ProfileRowWriter / read_profile_rows(): rows file, one JSON array per line, every
+  WhiteContext company written once before the first guest that references it
+- load_profiles(): models from either unified_guests_all.json or a rows file
+
+Rows file layout (unified_guests_all.rows.jsonl):
+    {"format": "unified-profile-rows", "version": 1}
+    {"company": "acme.com", "section": {...}}   <- first guest at acme.com follows
+    ["258258258", [...], ...]                   <- one UnifiedProfile.to_row() per line
+
+Usage:
+    python profile_model.py unified_guests_all.json --rows unified_guests_all.rows.jsonl
+    python profile_model.py unified_guests_all.rows.jsonl --benchmark
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import json_backend
+from company_table import COMPANY_FIELDS, CompanyTable, whitecontext_view
+from entity_resolver import CompanyMatch
+
+ROWS_FORMAT = "unified-profile-rows"
+ROWS_VERSION = 1
+
+
+# ============================================================================
+# MODELS
+# ============================================================================
+
+@dataclass(slots=True)
+class CerebralValley:
+    url: Optional[str]
+    name: Optional[str]
+    avatar: Optional[str]
+    metadata: Dict
+
+
+@dataclass(slots=True)
+class LinkedInProfile:
+    """FullEnrich part of the linkedin section"""
+    profile_id: Optional[Any]
+    profile_url: Optional[str]
+    handle: Optional[str]
+    firstname: Optional[str]
+    lastname: Optional[str]
+    location: Optional[str]
+    headline: Optional[str]
+    summary: Optional[str]
+    premium_account: Optional[bool]
+
+
+@dataclass(slots=True)
+class LinkedIn:
+    url: Optional[str] = None  # From the guest record
+    profile: Optional[LinkedInProfile] = None  # From FullEnrich
+
+    def to_dict(self) -> Dict:
+        section = {"url": self.url} if self.url else {}
+        if self.profile is not None:
+            section.update(_as_dict(self.profile))
+        return section
+
+    def to_row(self) -> List:
+        return [self.url, _as_row(self.profile) if self.profile is not None else None]
+
+    @classmethod
+    def from_dict(cls, section: Dict) -> "LinkedIn":
+        profile = None
+        if "profile_id" in section:
+            profile = LinkedInProfile(*(section.get(name) for name in _FIELDS[LinkedInProfile]))
+        return cls(section.get("url"), profile)
+
+    @classmethod
+    def from_row(cls, row: List) -> "LinkedIn":
+        return cls(row[0], LinkedInProfile(*row[1]) if row[1] is not None else None)
+
+
+@dataclass(slots=True)
+class Contact:
+    email: Optional[str]
+    email_status: Optional[str]
+    domain: Optional[str]
+    all_emails: List
+    phones: List
+    social_medias: List
+
+
+@dataclass(slots=True)
+class Position:
+    title: Optional[str]
+    description: Optional[str]
+    start_date: Optional[Any]
+    end_date: Optional[Any]
+
+
+@dataclass(slots=True)
+class Headquarters:
+    city: Optional[str]
+    region: Optional[str]
+    country: Optional[str]
+    country_code: Optional[str]
+    address: Optional[str]
+
+
+@dataclass(slots=True)
+class Company:
+    name: Optional[str]
+    domain: Optional[str]
+    website: Optional[str]
+    linkedin_url: Optional[str]
+    linkedin_id: Optional[Any]
+    industry: Optional[str]
+    description: Optional[str]
+    headcount: Optional[int]
+    headcount_range: Optional[str]
+    year_founded: Optional[int]
+    headquarters: Headquarters
+
+    def to_dict(self) -> Dict:
+        section = _as_dict(self)
+        section["headquarters"] = _as_dict(self.headquarters)
+        return section
+
+    def to_row(self) -> List:
+        row = list(_GETTERS[Company](self))
+        row[-1] = _as_row(self.headquarters)
+        return row
+
+    @classmethod
+    def from_dict(cls, section: Dict) -> "Company":
+        fields = [section.get(name) for name in _FIELDS[Company]]
+        fields[-1] = Headquarters(*(fields[-1].get(name) for name in _FIELDS[Headquarters]))
+        return cls(*fields)
+
+    @classmethod
+    def from_row(cls, row: List) -> "Company":
+        return cls(*row[:-1], Headquarters(*row[-1]))
+
+
+@dataclass(slots=True)
+class WhiteContext:
+    enriched: bool = False
+    company: Optional[Dict] = None  # Company section, shared by everyone at the company
+    match: Optional[CompanyMatch] = None
+
+    def to_dict(self) -> Dict:
+        if not self.enriched:
+            return {"enriched": False}
+        section = {"enriched": True, **self.company}
+        if self.match is not None:
+            section["match"] = self.match.to_dict()
+        return section
+
+    @classmethod
+    def from_dict(cls, section: Dict, companies: Optional[CompanyTable] = None) -> "WhiteContext":
+        if not section.get("enriched"):
+            return cls()
+        company = {name: section[name] for name in COMPANY_FIELDS if name in section}
+        match = CompanyMatch(**section["match"]) if section.get("match") else None
+        if companies is not None and match is not None:
+            company = companies.add(match.domain, company)
+        return cls(True, company, match)
+
+
+@dataclass(slots=True)
+class DataCompleteness:
+    has_linkedin: bool = False
+    has_fullenrich: bool = False
+    has_whitecontext: bool = False
+    has_email: bool = False
+    has_company: bool = False
+
+
+@dataclass(slots=True)
+class UnifiedProfile:
+    username: Optional[str]
+    cerebralvalley: CerebralValley
+    linkedin: LinkedIn
+    contact: Optional[Contact]  # None without FullEnrich data
+    position: Optional[Position]
+    company: Optional[Company]
+    whitecontext: WhiteContext
+    data_completeness: DataCompleteness
+
+    def to_dict(self) -> Dict:
+        """Same structure (and key order) as build_unified_profile()"""
+        return {
+            "username": self.username,
+            "cerebralvalley": _as_dict(self.cerebralvalley),
+            "linkedin": self.linkedin.to_dict(),
+            "contact": _as_dict(self.contact) if self.contact is not None else {},
+            "position": _as_dict(self.position) if self.position is not None else {},
+            "company": self.company.to_dict() if self.company is not None else {},
+            "whitecontext": self.whitecontext.to_dict(),
+            "data_completeness": _as_dict(self.data_completeness),
+        }
+
+    def to_row(self, company_ref: bool = False) -> List:
+        """Positional row; with company_ref the WhiteContext section is replaced by its match domain"""
+        whitecontext = self.whitecontext
+        if not whitecontext.enriched:
+            whitecontext_row = None
+        else:
+            match_row = _match_row(whitecontext.match) if whitecontext.match is not None else None
+            company = whitecontext.match.domain if company_ref and match_row else whitecontext.company
+            whitecontext_row = [company, match_row]
+
+        return [
+            self.username,
+            _as_row(self.cerebralvalley),
+            self.linkedin.to_row(),
+            _as_row(self.contact) if self.contact is not None else None,
+            _as_row(self.position) if self.position is not None else None,
+            self.company.to_row() if self.company is not None else None,
+            whitecontext_row,
+            _as_row(self.data_completeness),
+        ]
+
+    @classmethod
+    def from_dict(cls, profile: Dict, companies: Optional[CompanyTable] = None) -> "UnifiedProfile":
+        contact, position, company = profile["contact"], profile["position"], profile["company"]
+        return cls(
+            profile["username"],
+            CerebralValley(*(profile["cerebralvalley"].get(name) for name in _FIELDS[CerebralValley])),
+            LinkedIn.from_dict(profile["linkedin"]),
+            Contact(*(contact.get(name) for name in _FIELDS[Contact])) if contact else None,
+            Position(*(position.get(name) for name in _FIELDS[Position])) if position else None,
+            Company.from_dict(company) if company else None,
+            WhiteContext.from_dict(profile["whitecontext"], companies),
+            DataCompleteness(*(profile["data_completeness"].get(name) for name in _FIELDS[DataCompleteness])),
+        )
+
+    @classmethod
+    def from_row(cls, row: List, companies: Optional[CompanyTable] = None) -> "UnifiedProfile":
+        whitecontext = WhiteContext()
+        if row[6] is not None:
+            company, match_row = row[6]
+            match = CompanyMatch(*match_row) if match_row is not None else None
+            if isinstance(company, str):
+                company = companies[company]
+            whitecontext = WhiteContext(True, company, match)
+
+        return cls(
+            row[0],
+            CerebralValley(*row[1]),
+            LinkedIn.from_row(row[2]),
+            Contact(*row[3]) if row[3] is not None else None,
+            Position(*row[4]) if row[4] is not None else None,
+            Company.from_row(row[5]) if row[5] is not None else None,
+            whitecontext,
+            DataCompleteness(*row[7]),
+        )
+
+
+# Field names (slot order = declaration order) and a multi-attribute getter per flat model
+_FIELDS = {
+    model: model.__slots__
+    for model in (CerebralValley, LinkedInProfile, Contact, Position, Headquarters, Company, DataCompleteness)
+}
+_GETTERS = {model: attrgetter(*fields) for model, fields in _FIELDS.items()}
+
+
+def _as_dict(obj) -> Dict:
+    return dict(zip(_FIELDS[type(obj)], _GETTERS[type(obj)](obj)))
+
+
+def _as_row(obj) -> List:
+    return list(_GETTERS[type(obj)](obj))
+
+
+def _match_row(match: CompanyMatch) -> List:
+    return list(match.to_dict().values())
+
+
+# ============================================================================
+# BUILDING
+# ============================================================================
+
+def build_profile(
+    guest: Dict,
+    fullenrich_data: Optional[Dict],
+    whitecontext_data: Optional[Dict],
+    match: Optional[CompanyMatch] = None,
+    companies: Optional[CompanyTable] = None
+) -> UnifiedProfile:
+    """Model equivalent of unify_data.build_unified_profile() (companies: share company sections)"""
+    completeness = DataCompleteness(has_linkedin=bool(guest.get("linkedIn")))
+    linkedin = LinkedIn(guest.get("linkedIn") or None)
+    contact_section = position_section = company_section = None
+
+    if fullenrich_data:
+        contact = fullenrich_data.get("contact", {})
+        profile = contact.get("profile", {})
+        position = profile.get("position", {})
+        company = position.get("company", {})
+        hq = company.get("headquarters", {})
+
+        linkedin.profile = LinkedInProfile(
+            profile.get("linkedin_id"), profile.get("linkedin_url"), profile.get("linkedin_handle"),
+            profile.get("firstname"), profile.get("lastname"), profile.get("location"),
+            profile.get("headline"), profile.get("summary"), profile.get("premium_account")
+        )
+        contact_section = Contact(
+            contact.get("most_probable_email"), contact.get("most_probable_email_status"), contact.get("domain"),
+            contact.get("emails", []), contact.get("phones", []), contact.get("social_medias", [])
+        )
+        position_section = Position(
+            position.get("title"), position.get("description"), position.get("start_at"), position.get("end_at")
+        )
+        company_section = Company(
+            company.get("name"), company.get("domain"), company.get("website"), company.get("linkedin_url"),
+            company.get("linkedin_id"), company.get("industry"), company.get("description"),
+            company.get("headcount"), company.get("headcount_range"), company.get("year_founded"),
+            Headquarters(hq.get("city"), hq.get("region"), hq.get("country"), hq.get("country_code"),
+                         hq.get("address_line_1"))
+        )
+
+        completeness.has_fullenrich = True
+        completeness.has_email = bool(contact.get("most_probable_email"))
+        completeness.has_company = bool(company.get("name"))
+
+    whitecontext = WhiteContext()
+    if whitecontext_data:
+        if companies is not None and match is not None and match.domain in companies:
+            section = companies[match.domain]
+        else:
+            section = whitecontext_view(whitecontext_data)
+            if companies is not None and match is not None:
+                companies.add(match.domain, section)
+        whitecontext = WhiteContext(True, section, match)
+        completeness.has_whitecontext = True
+
+    return UnifiedProfile(
+        guest.get("username"),
+        CerebralValley(guest.get("url"), guest.get("name"), guest.get("avatar"), guest.get("metadata", {})),
+        linkedin, contact_section, position_section, company_section, whitecontext, completeness
+    )
+
+
+# ============================================================================
+# ROWS FILE
+# ============================================================================
+
+class ProfileRowWriter:
+    """Write profiles as compact rows, one per line; each company section is written once"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.count = 0
+        self.companies: set = set()
+        self._file = None
+
+    def __enter__(self) -> "ProfileRowWriter":
+        self._file = open(self.path, 'wb')
+        self._file.write(json_backend.dumps({"format": ROWS_FORMAT, "version": ROWS_VERSION}) + b"\n")
+        return self
+
+    def write(self, profile: UnifiedProfile | Dict):
+        if isinstance(profile, dict):
+            profile = UnifiedProfile.from_dict(profile)
+
+        whitecontext = profile.whitecontext
+        company_ref = whitecontext.enriched and whitecontext.match is not None
+        if company_ref and whitecontext.match.domain not in self.companies:
+            self.companies.add(whitecontext.match.domain)
+            self._file.write(json_backend.dumps({"company": whitecontext.match.domain,
+                                                 "section": whitecontext.company}) + b"\n")
+
+        self._file.write(json_backend.dumps(profile.to_row(company_ref)) + b"\n")
+        self.count += 1
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        return False
+
+
+def write_profile_rows(path: Path, profiles: Iterable[UnifiedProfile | Dict]) -> int:
+    """Write a rows file and return the number of profiles"""
+    with ProfileRowWriter(path) as writer:
+        for profile in profiles:
+            writer.write(profile)
+    return writer.count
+
+
+def read_profile_rows(path: Path, companies: Optional[CompanyTable] = None) -> Iterator[UnifiedProfile]:
+    """Profiles of a rows file, in file order"""
+    companies = companies if companies is not None else CompanyTable()
+    with open(path, 'rb') as f:
+        header = json_backend.loads(f.readline() or b"{}")
+        if header.get("format") != ROWS_FORMAT or header.get("version") != ROWS_VERSION:
+            raise ValueError(f"{path} is not a version {ROWS_VERSION} profile rows file")
+
+        for line in f:
+            record = json_backend.loads(line)
+            if isinstance(record, list):
+                yield UnifiedProfile.from_row(record, companies)
+            else:
+                companies.add(record["company"], record["section"])
+
+
+def load_profiles(path: Path, companies: Optional[CompanyTable] = None) -> List[UnifiedProfile]:
+    """Models from unified_guests_all.json (or any JSON array of profiles) or a rows file"""
+    companies = companies if companies is not None else CompanyTable()
+    with open(path, 'rb') as f:
+        first = f.read(1)
+    if first == b"{":
+        return list(read_profile_rows(path, companies))
+
+    return [UnifiedProfile.from_dict(profile, companies) for profile in json_backend.load(path)]
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert unified profiles between JSON and compact rows")
+    parser.add_argument("input", type=Path, help="unified_guests_all.json or a rows file")
+    parser.add_argument("--rows", type=Path, help="Write the profiles as a rows file")
+    parser.add_argument("--json", type=Path, help="Write the profiles as a JSON array (unified_guests_all.json layout)")
+    parser.add_argument("--pretty", action="store_true", help="Indent the --json output by 2 spaces")
+    parser.add_argument("--benchmark", action="store_true", help="Time loading and serializing the profiles")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    profiles = load_profiles(args.input)
+    print(f"Loaded {len(profiles):,} profiles in {time.perf_counter() - start:.2f}s")
+
+    if args.rows:
+        count = write_profile_rows(args.rows, profiles)
+        print(f"✓ Wrote {count:,} rows: {args.rows} ({args.rows.stat().st_size / 1e6:,.1f} MB)")
+    if args.json:
+        json_backend.dump([profile.to_dict() for profile in profiles], args.json, pretty=args.pretty)
+        print(f"✓ Wrote {len(profiles):,} profiles: {args.json}")
+
+    if args.benchmark:
+        for name, func in (
+            ("to_dict", lambda: [profile.to_dict() for profile in profiles]),
+            ("to_row", lambda: [profile.to_row() for profile in profiles]),
+        ):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            print(f"{name}: {len(profiles) / elapsed:,.0f} profiles/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Offline Public Suffix Lookup
+Registrable-domain keys from the bundled public_suffix_list.dat (a snapshot of
+https://publicsuffix.org/list/, MPL-2.0); nothing is fetched at runtime.
+
+The list is compiled once, on first use, into a label trie walked from the TLD:
+- node[label] -> child node
+- node[""]    -> a rule ends here (foo.co.uk: "co.uk" is a public suffix)
+- node["!"]   -> exception rule (!www.ck: www.ck is registrable under *.ck)
+- node["*"]   -> wildcard rule (*.ck)
+
+Unknown TLDs follow the list's implicit "*" rule (the TLD is the suffix).
+IDN rules are stored in both Unicode and punycode (xn--) form.
+
+The compiled trie is cached (marshal) in __pycache__/ keyed by the list's content
+hash, so later processes load it in a few ms instead of re-parsing ~12k rules.
+
+Usage:
+    python public_suffix.py eng.foo.co.uk app.foo.com  # print suffix and registrable domain
+    python public_suffix.py --benchmark                 # lookups per second
+"""
+
+import argparse
+import hashlib
+import marshal
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SCRIPT_DIR = Path(__file__).parent
+PUBLIC_SUFFIX_LIST = SCRIPT_DIR / "public_suffix_list.dat"
+TRIE_CACHE_DIR = SCRIPT_DIR / "__pycache__"
+
+INCLUDE_PRIVATE_DOMAINS = True  # github.io, vercel.app, ... are suffixes too (one company per subdomain)
+
+_TERMINAL = ""
+_EXCEPTION = "!"
+_WILDCARD = "*"
+
+_trie: Optional[Dict] = None
+
+
+# ============================================================================
+# COMPILATION
+# ============================================================================
+
+def _rule_forms(rule: str) -> List[str]:
+    """A rule as written, plus its punycode form for IDN rules"""
+    forms = [rule]
+    if not rule.isascii():
+        try:
+            forms.append(".".join(
+                label if label in (_WILDCARD,) else label.encode("idna").decode("ascii")
+                for label in rule.split(".")
+            ))
+        except UnicodeError:
+            pass
+    return forms
+
+
+def compile_rules(lines, include_private: bool = INCLUDE_PRIVATE_DOMAINS) -> Dict:
+    """Compile public suffix list lines into the label trie"""
+    trie: Dict = {}
+    for line in lines:
+        line = line.strip()
+        if line == "// ===BEGIN PRIVATE DOMAINS===" and not include_private:
+            break
+        if not line or line.startswith("//"):
+            continue
+
+        # Rules end at the first whitespace
+        rule = line.split()[0].lower()
+        exception = rule.startswith("!")
+        for form in _rule_forms(rule.lstrip("!")):
+            node = trie
+            for label in reversed(form.split(".")):
+                node = node.setdefault(label, {})
+            node[_EXCEPTION if exception else _TERMINAL] = True
+    return trie
+
+
+def _cache_path(path: Path) -> Path:
+    # marshal output is specific to the Python version
+    return TRIE_CACHE_DIR / f"{path.stem}.{sys.implementation.cache_tag}.trie"
+
+
+def load_trie(path: Path = PUBLIC_SUFFIX_LIST) -> Dict:
+    """The compiled trie of the bundled list (from the cache, else compiled and cached)"""
+    global _trie
+    if _trie is not None:
+        return _trie
+
+    data = Path(path).read_bytes()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    cache = _cache_path(Path(path))
+
+    try:
+        cached_digest, trie = marshal.loads(cache.read_bytes())
+        if cached_digest == digest:
+            _trie = trie
+            return _trie
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    _trie = compile_rules(data.decode("utf-8").splitlines())
+    try:
+        cache.parent.mkdir(exist_ok=True)
+        tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(marshal.dumps((digest, _trie)))
+        os.replace(tmp, cache)
+    except OSError:
+        pass  # Read-only checkout: compile every time
+    return _trie
+
+
+# ============================================================================
+# LOOKUP
+# ============================================================================
+
+def suffix_labels(labels: List[str], trie: Optional[Dict] = None) -> int:
+    """Number of trailing labels that form the public suffix (at least 1)"""
+    node = trie if trie is not None else (_trie if _trie is not None else load_trie())
+    length = 1
+    depth = len(labels)
+
+    for depth in range(1, depth + 1):
+        child = node.get(labels[-depth])
+        if child is None:
+            # Only a wildcard rule (*.ck) can extend the suffix past an unlisted label
+            node = node.get(_WILDCARD)
+            if node is None:
+                break
+            if _TERMINAL in node:
+                length = depth
+            continue
+        if _EXCEPTION in child:
+            # The suffix is the exception rule minus its leftmost label
+            return depth - 1
+        if _TERMINAL in child or _WILDCARD in node:
+            length = depth
+        node = child
+
+    return length
+
+
+def public_suffix(host: str) -> Optional[str]:
+    """Public suffix of a normalized host (co.uk for eng.foo.co.uk)"""
+    if not host:
+        return None
+    labels = host.split(".")
+    return ".".join(labels[-suffix_labels(labels):])
+
+
+def registrable_domain(host: str) -> Optional[str]:
+    """Public suffix plus one label (foo.co.uk for eng.foo.co.uk); None for a bare suffix"""
+    if not host:
+        return None
+    labels = host.split(".")
+    length = suffix_labels(labels)
+    if len(labels) <= length:
+        return None
+    return ".".join(labels[-length - 1:])
+
+
+def is_public_suffix(host: str) -> bool:
+    """True when the host itself is a public suffix (co.uk, github.io)"""
+    return bool(host) and registrable_domain(host) is None
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Look up public suffixes in the bundled list")
+    parser.add_argument("hosts", nargs="*")
+    parser.add_argument("--benchmark", action="store_true", help="Measure uncached lookups per second")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    trie = load_trie()
+    print(f"Loaded {PUBLIC_SUFFIX_LIST.name} in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    for host in args.hosts:
+        print(f"{host}: suffix={public_suffix(host)} registrable={registrable_domain(host)}")
+
+    if args.benchmark:
+        hosts = [f"host{i}.{sld}" for i in range(100000)
+                 for sld in ("foo.com", "eng.foo.co.uk", "foo.github.io")]
+        start = time.perf_counter()
+        for host in hosts:
+            suffix_labels(host.split("."), trie)
+        elapsed = time.perf_counter() - start
+        print(f"{len(hosts) / elapsed:,.0f} lookups/s ({elapsed / len(hosts) * 1e9:.0f} ns each)")
+
+
+if __name__ == "__main__":
+    main()
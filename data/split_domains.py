@@ -1,12 +1,23 @@
 """
-Split Domains into 10 Equal Files
-Splits unique_domains.txt into 10 files of equal size
-Output files: domains_01.txt, domains_02.txt, ..., domains_10.txt
+Split Domains into WhiteContext Batch Files
+Splits unique_domains.txt into equal-size files for WhiteContext.
+Output files: domains_01.txt, domains_02.txt, ...
+
+The number of files comes from batch_planner.py: batches are sized so one takes about
+the target duration at the observed WhiteContext latency, with at least one file per
+parallel WhiteContext job. --splits N forces a fixed count.
+
+Usage:
+    python split_domains.py
+    python split_domains.py --target-minutes 30 --max-concurrency 5
+    python split_domains.py --splits 10
 """
 
 from pathlib import Path
+import argparse
 import logging
-import math
+
+from batch_planner import WHITECONTEXT, WORKLOADS, LatencyHistory, plan_batches, split_evenly
 
 # Setup logging
 logging.basicConfig(
@@ -20,11 +31,23 @@ logger = logging.getLogger(__name__)
 SCRIPT_DIR = Path(__file__).parent
 INPUT_TXT = SCRIPT_DIR / "T2" / "unique_domains.txt"
 OUTPUT_DIR = SCRIPT_DIR / "T2" / "domain_batches"
-NUM_SPLITS = 10
+LATENCY_HISTORY = SCRIPT_DIR / "T2" / "batch_latency.json"
+
+def parse_args(argv=None):
+    defaults = WORKLOADS[WHITECONTEXT]
+    parser = argparse.ArgumentParser(description="Split unique domains into WhiteContext batch files")
+    parser.add_argument("--splits", type=int, help="Fixed number of files (default: planned from latency history)")
+    parser.add_argument("--target-minutes", type=float, default=defaults.target_seconds / 60,
+                        help="Target WhiteContext duration of one file (default: %(default)s)")
+    parser.add_argument("--max-concurrency", type=int, default=defaults.max_concurrency,
+                        help="WhiteContext jobs run side by side (default: %(default)s)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
 
-def main():
     logger.info("="*80)
-    logger.info(f"SPLITTING DOMAINS INTO {NUM_SPLITS} EQUAL FILES")
+    logger.info("SPLITTING DOMAINS INTO WHITECONTEXT BATCH FILES")
     logger.info("="*80)
 
     # Check if input file exists
@@ -41,21 +64,31 @@ def main():
     total_domains = len(domains)
     logger.info(f"✓ Loaded {total_domains} domains")
 
-    # Calculate split size
-    split_size = math.ceil(total_domains / NUM_SPLITS)
-    logger.info(f"✓ Split size: {split_size} domains per file")
+    # Plan the number of files
+    if args.splits:
+        num_splits = args.splits
+        logger.info(f"✓ Using fixed split count: {num_splits}")
+    else:
+        plan = plan_batches(total_domains, WHITECONTEXT, LatencyHistory(LATENCY_HISTORY),
+                            args.target_minutes * 60, args.max_concurrency)
+        num_splits = plan.num_batches
+        logger.info(f"✓ Plan: {plan.describe()}")
+
+    batches = split_evenly(domains, num_splits)
+    num_splits = len(batches)
 
-    # Create output directory
+    # Create output directory; drop files from an earlier split so stale batches aren't uploaded
     OUTPUT_DIR.mkdir(exist_ok=True, parents=True)
+    for stale_file in OUTPUT_DIR.glob("domains_*.txt"):
+        stale_file.unlink()
     logger.info(f"✓ Output directory: {OUTPUT_DIR}")
 
     # Split into files
-    logger.info(f"\nSplitting into {NUM_SPLITS} files...")
+    logger.info(f"\nSplitting into {num_splits} files...")
 
-    for i in range(NUM_SPLITS):
-        start_idx = i * split_size
-        end_idx = min(start_idx + split_size, total_domains)
-        batch_domains = domains[start_idx:end_idx]
+    start_idx = 0
+    for i, batch_domains in enumerate(batches):
+        end_idx = start_idx + len(batch_domains)
 
         # Create filename with zero-padded number
         output_file = OUTPUT_DIR / f"domains_{i+1:02d}.txt"
@@ -66,11 +99,12 @@ def main():
                 f.write(f"{domain}\n")
 
         logger.info(f"  ✓ {output_file.name}: {len(batch_domains)} domains (lines {start_idx+1}-{end_idx})")
+        start_idx = end_idx
 
     # Verification
     logger.info(f"\nVerification:")
     total_written = 0
-    for i in range(NUM_SPLITS):
+    for i in range(num_splits):
         output_file = OUTPUT_DIR / f"domains_{i+1:02d}.txt"
         with open(output_file, 'r') as f:
             count = sum(1 for line in f if line.strip())
@@ -81,7 +115,7 @@ def main():
     logger.info(f"  Match: {'✓ Yes' if total_written == total_domains else '✗ No'}")
 
     logger.info("\n" + "="*80)
-    logger.info(f"COMPLETE - {NUM_SPLITS} files created in {OUTPUT_DIR}")
+    logger.info(f"COMPLETE - {num_splits} files created in {OUTPUT_DIR}")
     logger.info("="*80)
 
 if __name__ == "__main__":
@@ -0,0 +1,288 @@
+"""
+Content-Addressed Summary Cache
+Stable content hashes of the profile fields that feed an LLM prompt, and an SQLite
+cache of generated outputs keyed by (kind, content hash, prompt version), so a reseed
+only pays for new or changed profiles.
+
+- summary_inputs(): the exact strings generateMatchSummary() in scripts/seed-vectara.ts
+  puts into its prompt (name, role, location, bio, company, ...)
+- summary_hash(): 128-bit BLAKE2b of those inputs; unify_data.py --summary-hashes
+  writes it for every guest to unified_guests_summary_hashes.json
+- SummaryCache: (kind, content hash, prompt version) -> output text. Entries are
+  content-addressed, so unchanged profiles hit whatever their username; bumping the
+  prompt version misses everything. When the stored text exceeds max_bytes, the least
+  recently used entries are evicted.
+
+Reseed workflow:
+    python summary_cache.py --export public/match_summaries.json   # {username: {hash, summary|null}}
+    (seed-vectara.ts reuses non-null summaries, generates the rest and writes them back)
+    python summary_cache.py --import public/match_summaries.json   # store the new summaries
+
+Usage:
+    python summary_cache.py --stats
+    python summary_cache.py --export out.json --prompt-version match-summary-v2
+"""
+
+import argparse
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import json_backend
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_CACHE_DB = SCRIPT_DIR / "summary_cache.sqlite"
+DEFAULT_HASHES_FILE = SCRIPT_DIR / "unified_guests_summary_hashes.json"
+DEFAULT_PROFILES_FILE = SCRIPT_DIR / "unified_guests_all.json"
+
+SUMMARY_KIND = "match_summary"
+SUMMARY_INPUTS_VERSION = 1  # Bump when summary_inputs() changes (every hash changes with it)
+DEFAULT_PROMPT_VERSION = "match-summary-v1"  # Bump with the prompt text in seed-vectara.ts
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # Stored output text kept before LRU eviction
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    kind TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    used_at REAL NOT NULL,
+    PRIMARY KEY (kind, content_hash, prompt_version)
+);
+CREATE INDEX IF NOT EXISTS entries_by_use ON entries(used_at);
+"""
+
+
+# ============================================================================
+# CONTENT HASHES
+# ============================================================================
+
+def _join(values) -> str:
+    return ", ".join(value for value in values or [] if isinstance(value, str))
+
+
+def summary_inputs(profile: Dict) -> Dict[str, str]:
+    """Prompt inputs of generateMatchSummary() for one unified profile (empty ones omitted)"""
+    linkedin = profile.get("linkedin") or {}
+    whitecontext = profile.get("whitecontext") or {}
+    company = profile.get("company") or {}
+    intelligence = whitecontext.get("company_intelligence") or {}
+
+    if linkedin.get("firstname") and linkedin.get("lastname"):
+        name = f"{linkedin['firstname']} {linkedin['lastname']}"
+    else:
+        name = ((profile.get("cerebralvalley") or {}).get("metadata") or {}).get("field_1") or profile.get("username")
+
+    inputs = {
+        "name": name,
+        "role": linkedin.get("headline") or (profile.get("position") or {}).get("title"),
+        "location": linkedin.get("location"),
+        "bio": linkedin.get("summary"),
+        "company": whitecontext.get("company_name") or company.get("name"),
+        "industry": company.get("industry"),
+        "company_context": whitecontext.get("tldr"),
+        "expertise": _join(whitecontext.get("context_tags")),
+        "target_market": (whitecontext.get("business_model") or {}).get("target_market"),
+        "growth_focus": _join(intelligence.get("growth_signals")),
+        "challenges": _join(intelligence.get("challenge_areas")),
+    }
+    return {key: value for key, value in inputs.items() if isinstance(value, str) and value}
+
+
+def summary_hash(profile: Dict) -> str:
+    """Content hash of a profile's summary prompt inputs (username independent)"""
+    canonical = json_backend.dumps({"v": SUMMARY_INPUTS_VERSION, **summary_inputs(profile)}, sort_keys=True)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def summary_hashes(profiles: Iterable[Dict]) -> Dict[str, str]:
+    """username -> summary hash"""
+    return {profile["username"]: summary_hash(profile) for profile in profiles}
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class SummaryCache:
+    """Size-bounded (kind, content hash, prompt version) -> text cache backed by SQLite"""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_DB, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+        (self._size,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self) -> "SummaryCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        (count,) = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return count
+
+    @property
+    def size(self) -> int:
+        """Bytes of stored output text"""
+        return self._size
+
+    def get_many(
+        self,
+        content_hashes: Iterable[str],
+        prompt_version: str = DEFAULT_PROMPT_VERSION,
+        kind: str = SUMMARY_KIND
+    ) -> Dict[str, str]:
+        """content hash -> cached text for every hash present (marks them recently used)"""
+        hashes = list(dict.fromkeys(content_hashes))
+        found: Dict[str, str] = {}
+        for start in range(0, len(hashes), 500):  # SQLite host parameter limit
+            chunk = hashes[start:start + 500]
+            rows = self._db.execute(
+                f"SELECT content_hash, value FROM entries WHERE kind = ? AND prompt_version = ? "
+                f"AND content_hash IN ({', '.join('?' * len(chunk))})",
+                (kind, prompt_version, *chunk),
+            )
+            found.update(rows.fetchall())
+        if found:
+            now = time.time()
+            with self._db:
+                self._db.executemany(
+                    "UPDATE entries SET used_at = ? WHERE kind = ? AND content_hash = ? AND prompt_version = ?",
+                    [(now, kind, content_hash, prompt_version) for content_hash in found],
+                )
+        return found
+
+    def get(self, content_hash: str, prompt_version: str = DEFAULT_PROMPT_VERSION, kind: str = SUMMARY_KIND) -> Optional[str]:
+        return self.get_many([content_hash], prompt_version, kind).get(content_hash)
+
+    def put_many(
+        self,
+        entries: Iterable[Tuple[str, str]],
+        prompt_version: str = DEFAULT_PROMPT_VERSION,
+        kind: str = SUMMARY_KIND
+    ) -> int:
+        """Store (content hash, text) pairs, then evict down to max_bytes; returns entries stored"""
+        now = time.time()
+        rows = [
+            (kind, content_hash, prompt_version, value, len(value.encode("utf-8")), now, now)
+            for content_hash, value in dict(entries).items()
+        ]
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        (self._size,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        self.evict()
+        return len(rows)
+
+    def put(self, content_hash: str, value: str, prompt_version: str = DEFAULT_PROMPT_VERSION, kind: str = SUMMARY_KIND):
+        self.put_many([(content_hash, value)], prompt_version, kind)
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Drop least recently used entries until the stored text fits; returns entries dropped"""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        if self._size <= limit:
+            return 0
+
+        excess = self._size - limit
+        victims: List[Tuple] = []
+        freed = 0
+        for row in self._db.execute("SELECT kind, content_hash, prompt_version, size FROM entries ORDER BY used_at, rowid"):
+            victims.append(row[:3])
+            freed += row[3]
+            if freed >= excess:
+                break
+        with self._db:
+            self._db.executemany(
+                "DELETE FROM entries WHERE kind = ? AND content_hash = ? AND prompt_version = ?", victims
+            )
+        self._size -= freed
+        return len(victims)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Entries and bytes per (kind, prompt version)"""
+        rows = self._db.execute(
+            "SELECT kind, prompt_version, COUNT(*), SUM(size) FROM entries GROUP BY kind, prompt_version ORDER BY kind, prompt_version"
+        )
+        return {f"{kind} @ {version}": {"entries": count, "bytes": size} for kind, version, count, size in rows}
+
+
+# ============================================================================
+# EXPORT / IMPORT (seed-vectara.ts exchange file)
+# ============================================================================
+
+def load_hashes(hashes_path: Path = DEFAULT_HASHES_FILE, profiles_path: Path = DEFAULT_PROFILES_FILE) -> Dict[str, str]:
+    """username -> summary hash, from the unifier's hashes file, else computed from the profiles"""
+    if Path(hashes_path).exists():
+        hashes = json_backend.load(hashes_path)
+        if hashes.get("version") == SUMMARY_INPUTS_VERSION:
+            return hashes["profiles"]
+    return summary_hashes(json_backend.load(profiles_path))
+
+
+def export_summaries(cache: SummaryCache, hashes: Dict[str, str], path: Path, prompt_version: str = DEFAULT_PROMPT_VERSION) -> int:
+    """Write {username: {hash, summary or null}}; returns how many summaries were cached"""
+    cached = cache.get_many(hashes.values(), prompt_version)
+    json_backend.dump(
+        {username: {"hash": content_hash, "summary": cached.get(content_hash)} for username, content_hash in hashes.items()},
+        path, pretty=True
+    )
+    return sum(1 for content_hash in hashes.values() if content_hash in cached)
+
+
+def import_summaries(cache: SummaryCache, path: Path, prompt_version: str = DEFAULT_PROMPT_VERSION) -> int:
+    """Store every non-null summary of an exchange file under its hash; returns entries stored"""
+    exchange = json_backend.load(path)
+    return cache.put_many(
+        ((entry["hash"], entry["summary"]) for entry in exchange.values() if entry.get("hash") and entry.get("summary")),
+        prompt_version,
+    )
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed cache of LLM match summaries")
+    parser.add_argument("--db", type=Path, default=DEFAULT_CACHE_DB, help="Cache database (default: %(default)s)")
+    parser.add_argument("--max-mb", type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024, help="Stored text kept (default: %(default)s MB)")
+    parser.add_argument("--prompt-version", default=DEFAULT_PROMPT_VERSION, help="Prompt identity (default: %(default)s)")
+    parser.add_argument("--hashes", type=Path, default=DEFAULT_HASHES_FILE, help="unify_data.py --summary-hashes output (default: %(default)s)")
+    parser.add_argument("--profiles", type=Path, default=DEFAULT_PROFILES_FILE, help="Unified guests, when there is no hashes file")
+    parser.add_argument("--export", type=Path, metavar="PATH", help="Write the seeder exchange file")
+    parser.add_argument("--import", dest="import_path", type=Path, metavar="PATH", help="Store the summaries of an exchange file")
+    parser.add_argument("--stats", action="store_true", help="Print entries and bytes per prompt version")
+    args = parser.parse_args()
+
+    with SummaryCache(args.db, int(args.max_mb * 1024 * 1024)) as cache:
+        if args.import_path:
+            stored = import_summaries(cache, args.import_path, args.prompt_version)
+            print(f"Stored {stored:,} summaries from {args.import_path}")
+
+        if args.export:
+            hashes = load_hashes(args.hashes, args.profiles)
+            cached = export_summaries(cache, hashes, args.export, args.prompt_version)
+            print(f"Exported {len(hashes):,} guests to {args.export}: {cached:,} cached, {len(hashes) - cached:,} to generate")
+
+        if args.stats or not (args.import_path or args.export):
+            for key, counts in cache.stats().items():
+                print(f"{key}: {counts['entries']:,} entries, {counts['bytes'] / 1e6:,.2f} MB")
+            print(f"Total: {len(cache):,} entries, {cache.size / 1e6:,.2f} MB of {cache.max_bytes / 1e6:,.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
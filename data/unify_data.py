@@ -6,36 +6,93 @@ Data Flow:
 1. Load 424 Cerebral Valley guests (guest_profiles_enriched.json)
 2. Load 414 FullEnrich profiles (batch_1_results.json - batch_5_results.json)
 3. Load 344 WhiteContext companies (whitecontext/1.json - whitecontext/10.json)
-4. Join by username (CV → FullEnrich) and domain (FullEnrich → WhiteContext)
-5. Generate unified JSON files
+4. Join by username (CV → FullEnrich) and domain (FullEnrich → WhiteContext): the
+   host, else its registrable domain per the public suffix list (eng.acme.co.uk → acme.co.uk)
+5. Resolve the remaining companies by LinkedIn page, registrable domain, domain brand
+   and company name (entity_resolver.py; --match exact turns this off)
+6. Generate unified JSON files
+
+Every profile with WhiteContext data records how its company was matched in
+whitecontext.match: {domain, method, confidence}.
 
 Outputs:
 - unified_guests_all.json - All 424 guests with available enrichment
 - unified_guests_whitecontext.json - Only guests with company intelligence
 - unification_report.json - Statistics and data quality metrics
+- unified_guests_all.idx - Username/domain → byte offset index into unified_guests_all.json (see profile_index.py)
+- unified_guests_all.ugc - Columnar store of all guests (--format columnar|both, see columnar_store.py)
+- unified_guests_normalized.json + unified_companies.json - Normalized layout (--format normalized):
+  one WhiteContext section per company, guests reference it by domain (see company_table.py)
+- unified_guests_all.rows.jsonl - Compact positional rows of all guests (--format rows), loaded
+  back into slotted profile models by profile_model.py
+- unified_guests_features.npy + .json - Hashed TF-IDF matching vectors and their username
+  row index (--features, needs numpy; see match_features.py)
+- unified_guests_summary_hashes.json - Content hash of every guest's LLM summary prompt
+  inputs, the key of the summary cache (--summary-hashes, see summary_cache.py)
+- unified_guests_changes.json + unified_guests_snapshot.json - Added, updated and removed
+  guests since the previous run's snapshot, for reindexing only what changed (--changes,
+  see profile_delta.py)
+- unified_guests_geo.json - Coordinates of every guest whose location the bundled offline
+  gazetteer knows, for proximity queries (--geo, see geo_index.py)
+
+Streaming mode (--stream):
+Guest profiles are parsed incrementally and each unified profile is written as soon
+as it is built. FullEnrich profiles are indexed by batch file and re-read on demand,
+so only the join indexes and a couple of parsed batches stay resident.
+
+Incremental mode (--incremental):
+unification_manifest.json records a content hash for every input file and the
+source fingerprints of every guest. Unchanged input files are not re-parsed and
+only guests whose guest record, FullEnrich record or WhiteContext record changed
+are rebuilt; everyone else is carried over from the previous outputs. Fuzzy company
+matches are re-resolved only when the guest's FullEnrich record, any WhiteContext
+file or the match settings changed.
+
+JSON output:
+All JSON is read and written through json_backend.py (orjson when installed, else the
+standard library). Outputs are compact (one profile per line in the arrays) unless
+--pretty asks for the 2-space indented layout.
+
+Instrumentation:
+Every loader, extract_domain_from_fullenrich, build_unified_profile, the unify loop and
+save_outputs are measured (wall/CPU time, items/sec, bytes read/written, peak RSS; see
+pipeline_metrics.py). The numbers are written to the "metrics" section of
+unification_report.json and, with --metrics-file, to a Prometheus textfile (*.prom)
+or appended as a JSON line.
+
+Library use:
+Importing this module does no work: no logging setup, no log file, no output, and
+the optional-output modules (numpy for --features, the columnar/rows writers, the
+process pool) are imported only by the steps that use them. main() is the CLI; it
+configures logging (stdout + LOG_FILE) before running, unless the root logger already
+has handlers. Embedders call the public API (__all__) directly, set the module-level
+paths/options first, and keep their own logging (or call configure_logging()).
+`python benchmarks/bench_import.py` measures the import cost.
 """
 
+import hashlib
 import json
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
-from collections import defaultdict
-
-# ============================================================================
-# LOGGING CONFIGURATION
-# ============================================================================
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)-8s | %(message)s',
-    datefmt='%H:%M:%S',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('unification.log', mode='w')
-    ]
-)
+from collections import OrderedDict, defaultdict
+from contextlib import ExitStack
+
+from company_table import CompanyTable, intern_profiles, whitecontext_view
+from domain_normalizer import DomainIndex, normalize_domain
+import json_backend
+from entity_resolver import MIN_CONFIDENCE, SCORE_REGISTRABLE_DOMAIN, CompanyMatch, CompanyResolver
+from pipeline_metrics import PipelineMetrics
+
+__all__ = [
+    "iter_json_array", "load_guest_profiles", "iter_guest_profiles", "load_fullenrich_data",
+    "load_fullenrich_index", "load_whitecontext_data", "build_unified_profile", "unify_guest",
+    "unify_all_data", "unify_all_data_streaming", "unify_all_data_incremental", "save_outputs",
+    "configure_logging", "parse_args", "main",
+]
 
 logger = logging.getLogger(__name__)
 
@@ -51,62 +108,222 @@ WHITECONTEXT_DIR = SCRIPT_DIR / "whitecontext"
 OUTPUT_ALL = SCRIPT_DIR / "unified_guests_all.json"
 OUTPUT_WHITECONTEXT = SCRIPT_DIR / "unified_guests_whitecontext.json"
 OUTPUT_REPORT = SCRIPT_DIR / "unification_report.json"
+OUTPUT_MANIFEST = SCRIPT_DIR / "unification_manifest.json"
+OUTPUT_COLUMNAR = SCRIPT_DIR / "unified_guests_all.ugc"
+OUTPUT_INDEX = SCRIPT_DIR / "unified_guests_all.idx"
+OUTPUT_NORMALIZED = SCRIPT_DIR / "unified_guests_normalized.json"
+OUTPUT_COMPANIES = SCRIPT_DIR / "unified_companies.json"
+OUTPUT_ROWS = SCRIPT_DIR / "unified_guests_all.rows.jsonl"
+OUTPUT_FEATURES = SCRIPT_DIR / "unified_guests_features.npy"
+OUTPUT_SUMMARY_HASHES = SCRIPT_DIR / "unified_guests_summary_hashes.json"
+OUTPUT_CHANGES = SCRIPT_DIR / "unified_guests_changes.json"
+OUTPUT_SNAPSHOT = SCRIPT_DIR / "unified_guests_snapshot.json"
+OUTPUT_GEO = SCRIPT_DIR / "unified_guests_geo.json"
+
+# Output configuration
+OUTPUT_FORMATS = {"json"}  # Any of "json", "columnar", "normalized", "rows" (--format)
+PRETTY_JSON = False  # Indent JSON outputs by 2 spaces instead of writing them compact (--pretty)
+BUILD_FEATURES = False  # Also compute the local matching feature matrix (--features)
+FEATURES_DIM: Optional[int] = None  # Hash buckets per feature vector, None = match_features.FEATURE_DIM (--feature-dim)
+BUILD_SUMMARY_HASHES = False  # Also write the summary prompt content hash of every guest (--summary-hashes)
+BUILD_CHANGES = False  # Also write the change set against the previous snapshot (--changes)
+BUILD_GEO = False  # Also geocode guest locations with the offline gazetteer (--geo)
+
+# Loader configuration
+LOADER_WORKERS = 1  # Processes used to parse FullEnrich/WhiteContext files (--workers)
+
+# Streaming configuration
+STREAM_CHUNK_SIZE = 64 * 1024  # Characters read per refill of the incremental JSON parser
+STREAM_BATCH_CACHE_SIZE = 2  # Parsed FullEnrich batch files kept in memory while streaming
+
+# Company matching configuration
+MATCH_MODE = "fuzzy"  # "exact" host/registrable-domain join only, or "fuzzy" entity resolution for misses (--match)
+MIN_MATCH_CONFIDENCE = MIN_CONFIDENCE  # Weakest fuzzy match accepted (--min-match-confidence)
+
+# Incremental configuration
+MANIFEST_VERSION = 5  # Bump when build_unified_profile() output or record fingerprints change
+
+# Instrumentation
+METRICS = PipelineMetrics()  # Per-stage counters of the current run
+METRICS_FILE: Optional[Path] = None  # Optional *.prom textfile or JSON-lines file (--metrics-file)
+
+# Logging (set up by main(), never at import)
+LOG_FILE = Path("unification.log")  # Truncated at the start of every CLI run
 
-logger.info("="*100)
-logger.info("CEREBRAL VALLEY HACKATHON - UNIFIED GUEST DATA GENERATOR")
-logger.info("="*100)
-logger.info(f"Guest profiles: {GUEST_PROFILES_FILE}")
-logger.info(f"FullEnrich data: {FULLENRICH_DIR}")
-logger.info(f"WhiteContext data: {WHITECONTEXT_DIR}")
-logger.info("="*100)
 
 # ============================================================================
-# DOMAIN NORMALIZATION
+# LOGGING CONFIGURATION
 # ============================================================================
 
-def normalize_domain(domain: str) -> Optional[str]:
+def configure_logging(log_file: Optional[Path] = None):
     """
-    Normalize domain for matching (same logic as clean_domains.py)
+    Log INFO and above to stdout and log_file (default LOG_FILE; no file when that is
+    None), as the CLI does. Does nothing when the root logger is already configured, so
+    callers embedding the pipeline keep their own logging setup (and no log file is opened).
     """
-    if not domain or not isinstance(domain, str):
-        return None
+    if logging.getLogger().handlers:
+        return
+    log_file = LOG_FILE if log_file is None else log_file
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if log_file is not None:
+        handlers.append(logging.FileHandler(log_file, mode='w'))
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s | %(levelname)-8s | %(message)s',
+        datefmt='%H:%M:%S',
+        handlers=handlers
+    )
+
+
+def log_configuration():
+    """Log the input locations and JSON backend of this run"""
+    logger.info("="*100)
+    logger.info("CEREBRAL VALLEY HACKATHON - UNIFIED GUEST DATA GENERATOR")
+    logger.info("="*100)
+    logger.info(f"Guest profiles: {GUEST_PROFILES_FILE}")
+    logger.info(f"FullEnrich data: {FULLENRICH_DIR}")
+    logger.info(f"WhiteContext data: {WHITECONTEXT_DIR}")
+    logger.info(f"JSON backend: {json_backend.BACKEND}")
+    logger.info("="*100)
 
-    # Remove whitespace
-    domain = domain.strip()
+# ============================================================================
+# STREAMING JSON I/O
+# ============================================================================
 
-    if not domain:
-        return None
+def iter_json_array(path: Path, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator:
+    """
+    Yield the items of a top-level JSON array one at a time.
+    Only the current read buffer and the item being decoded are held in memory.
+    """
+    decoder = json.JSONDecoder()
+
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = ''
+        pos = 0
+        eof = False
+        in_array = False
+
+        while True:
+            # Skip whitespace and item separators
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+
+            if pos == len(buffer):
+                if eof:
+                    raise ValueError(f"Unexpected end of JSON array in {path}")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
 
-    # Remove URL parameters (everything after ?)
-    if '?' in domain:
-        domain = domain.split('?')[0]
+            if not in_array:
+                if buffer[pos] != '[':
+                    raise ValueError(f"Expected a JSON array in {path}")
+                in_array = True
+                pos += 1
+                continue
 
-    # Remove URL fragments (everything after #)
-    if '#' in domain:
-        domain = domain.split('#')[0]
+            if buffer[pos] == ']':
+                return
 
-    # Remove trailing slashes
-    domain = domain.rstrip('/')
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
 
-    # Remove protocol if present
-    domain = domain.replace('https://', '').replace('http://', '')
+            # An item is only complete once its delimiter is in the buffer
+            # (a number like "12" may continue as "123" in the next chunk)
+            delimiter = end
+            while delimiter is not None and delimiter < len(buffer) and buffer[delimiter] in ' \t\r\n':
+                delimiter += 1
 
-    # Remove www. prefix
-    if domain.startswith('www.'):
-        domain = domain[4:]
+            complete = end is not None and delimiter < len(buffer) and buffer[delimiter] in ',]'
 
-    # Remove any path (everything after first /)
-    if '/' in domain:
-        domain = domain.split('/')[0]
+            if not complete and not eof:
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
 
-    # Convert to lowercase
-    domain = domain.lower().strip()
+            if not complete:
+                raise ValueError(f"Malformed JSON array in {path}")
 
-    # Basic validation
-    if not domain or '.' not in domain or len(domain) < 4:
-        return None
+            yield item
+            pos = end
+
+
+class JsonArrayWriter:
+    """
+    Write a JSON array one item at a time.
+    Compact output puts one item per line; pretty output is byte-identical to
+    json_backend.dump(items, path, pretty=True).
+    """
+
+    def __init__(self, path: Path, pretty: Optional[bool] = None):
+        self.path = path
+        self.pretty = PRETTY_JSON if pretty is None else pretty
+        self.count = 0
+        self.position = 0
+        self._file = None
+
+    def __enter__(self) -> "JsonArrayWriter":
+        self._file = open(self.path, 'wb')
+        self._file.write(b'[')
+        self.position = 1
+        return self
+
+    def write(self, item: Dict) -> tuple[int, int]:
+        """Write one item and return its (byte offset, byte length) in the file"""
+        if self.pretty:
+            separator = b',\n  ' if self.count else b'\n  '
+            # JSON strings never contain raw newlines, so re-indenting line breaks is safe
+            data = json_backend.dumps(item, pretty=True).replace(b'\n', b'\n  ')
+        else:
+            separator = b',\n' if self.count else b'\n'
+            data = json_backend.dumps(item)
+        self._file.write(separator)
+        self._file.write(data)
+
+        offset = self.position + len(separator)
+        self.position = offset + len(data)
+        self.count += 1
+        return offset, len(data)
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.write(b'\n]' if self.count else b']')
+        self._file.close()
+        return False
+
+
+class NormalizedWriter:
+    """
+    Write guests in the normalized layout one at a time: the guests array streams out,
+    the company table they reference is written on close.
+    """
+
+    def __init__(self, guests_path: Path, companies_path: Path):
+        self.guests = JsonArrayWriter(guests_path)
+        self.companies_path = companies_path
+        self.companies = CompanyTable()
+
+    @property
+    def count(self) -> int:
+        return self.guests.count
 
-    return domain
+    def __enter__(self) -> "NormalizedWriter":
+        self.guests.__enter__()
+        return self
+
+    def write(self, profile: Dict):
+        self.guests.write(self.companies.normalize(profile))
+
+    def __exit__(self, exc_type, exc, tb):
+        self.guests.__exit__(exc_type, exc, tb)
+        if exc_type is None:
+            self.companies.save(self.companies_path, pretty=self.guests.pretty)
+        return False
 
 # ============================================================================
 # DATA LOADERS
@@ -122,13 +339,104 @@ def load_guest_profiles() -> List[Dict]:
         logger.error(f"Guest profiles file not found: {GUEST_PROFILES_FILE}")
         return []
 
-    with open(GUEST_PROFILES_FILE, 'r') as f:
-        profiles = json.load(f)
+    with METRICS.stage("load_guest_profiles") as stage:
+        profiles = json_backend.load(GUEST_PROFILES_FILE)
+        stage.items = len(profiles)
+        stage.add_read(GUEST_PROFILES_FILE)
 
     logger.info(f"✓ Loaded {len(profiles)} guest profiles")
     return profiles
 
 
+def iter_guest_profiles() -> Iterator[Dict]:
+    """Stream Cerebral Valley guest profiles one at a time"""
+    logger.info("\n" + "="*100)
+    logger.info("STREAMING CEREBRAL VALLEY GUEST PROFILES")
+    logger.info("="*100)
+
+    if not GUEST_PROFILES_FILE.exists():
+        logger.error(f"Guest profiles file not found: {GUEST_PROFILES_FILE}")
+        return
+
+    yield from iter_json_array(GUEST_PROFILES_FILE)
+
+
+def map_input_files(func, files: List[Path]) -> Iterator:
+    """
+    Apply func to every file, in a process pool when LOADER_WORKERS > 1.
+    Results are yielded in the order of files, so merging them in sequence keeps
+    the sorted-glob last-writer-wins semantics of a sequential load.
+    """
+    if LOADER_WORKERS <= 1 or len(files) <= 1:
+        yield from map(func, files)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(LOADER_WORKERS, len(files))) as pool:
+        yield from pool.map(func, files)
+
+
+def parse_fullenrich_batch(batch_file: Path) -> Dict:
+    """Parse one FullEnrich batch file and index it by username (last item wins)"""
+    batch_data = json_backend.load(batch_file)
+
+    datas = batch_data.get("datas", [])
+    items = {}
+    indexed = 0
+
+    for item in datas:
+        custom = item.get("custom", {})
+        username = custom.get("username")
+
+        if username:
+            items[username] = item
+            indexed += 1
+
+    return {"file": batch_file.name, "profiles": len(datas), "indexed": indexed, "items": items}
+
+
+def parse_fullenrich_usernames(batch_file: Path) -> Dict:
+    """Parse one FullEnrich batch file and return only the usernames it contains"""
+    parsed = parse_fullenrich_batch(batch_file)
+    parsed["items"] = list(parsed["items"])
+    return parsed
+
+
+def parse_whitecontext_file(wc_file: Path) -> Dict:
+    """Parse one WhiteContext file and index completed results by normalized domain (last result wins)"""
+    wc_data = json_backend.load(wc_file)
+
+    results = wc_data.get("results", [])
+    completed = 0
+    indexed = 0
+    by_domain = {}
+
+    for result in results:
+        if result.get("status") != "completed":
+            continue
+        completed += 1
+
+        normalized = normalize_domain(result.get("url"))
+
+        if normalized:
+            # Store the entire result (includes gtm_intelligence)
+            by_domain[normalized] = result
+            indexed += 1
+
+    return {"file": wc_file.name, "companies": len(results), "completed": completed, "indexed": indexed, "results": by_domain}
+
+
+def read_fullenrich_batch(batch_file: Path) -> Dict[str, Dict]:
+    """Read one FullEnrich batch file into username -> item"""
+    return parse_fullenrich_batch(batch_file)["items"]
+
+
+def read_whitecontext_file(wc_file: Path) -> Dict[str, Dict]:
+    """Read one WhiteContext file into normalized domain -> completed result"""
+    return parse_whitecontext_file(wc_file)["results"]
+
+
 def load_fullenrich_data() -> Dict[str, Dict]:
     """Load all FullEnrich batch results and index by username"""
     logger.info("\n" + "="*100)
@@ -143,62 +451,112 @@ def load_fullenrich_data() -> Dict[str, Dict]:
         return {}
 
     total_loaded = 0
-    for batch_file in batch_files:
-        with open(batch_file, 'r') as f:
-            batch_data = json.load(f)
-
-        datas = batch_data.get("datas", [])
-        logger.info(f"  {batch_file.name}: {len(datas)} profiles")
+    with METRICS.stage("load_fullenrich_data") as stage:
+        for parsed in map_input_files(parse_fullenrich_batch, batch_files):
+            logger.info(f"  {parsed['file']}: {parsed['profiles']} profiles")
 
-        for item in datas:
-            custom = item.get("custom", {})
-            username = custom.get("username")
-
-            if username:
-                fullenrich_by_username[username] = item
-                total_loaded += 1
+            fullenrich_by_username.update(parsed["items"])
+            total_loaded += parsed["indexed"]
+        stage.items = total_loaded
+        stage.add_read(*batch_files)
 
     logger.info(f"✓ Loaded {total_loaded} FullEnrich profiles")
     return fullenrich_by_username
 
 
-def load_whitecontext_data() -> Dict[str, Dict]:
-    """Load all WhiteContext results and index by normalized domain"""
+class LazyFullEnrichIndex:
+    """
+    FullEnrich index that keeps only username -> batch file resident.
+    Items are re-read from their batch file on demand, with a small LRU of parsed
+    batches. Batches are submitted in guest order, so streaming guests hits the
+    cache almost every time.
+    """
+
+    def __init__(self, cache_size: int = STREAM_BATCH_CACHE_SIZE):
+        self.cache_size = cache_size
+        self.batch_files: List[Path] = []
+        self.file_by_username: Dict[str, int] = {}
+        self._cache: "OrderedDict[int, Dict[str, Dict]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.file_by_username)
+
+    def add_batch_file(self, batch_file: Path, usernames: List[str]):
+        """Register a batch file; later files win for duplicate usernames"""
+        file_index = len(self.batch_files)
+        self.batch_files.append(batch_file)
+        for username in usernames:
+            self.file_by_username[username] = file_index
+
+    def _load_batch(self, file_index: int) -> Dict[str, Dict]:
+        if file_index in self._cache:
+            self._cache.move_to_end(file_index)
+            return self._cache[file_index]
+
+        items = read_fullenrich_batch(self.batch_files[file_index])
+
+        self._cache[file_index] = items
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return items
+
+    def get(self, username: str) -> Optional[Dict]:
+        file_index = self.file_by_username.get(username)
+        if file_index is None:
+            return None
+        return self._load_batch(file_index).get(username)
+
+
+def load_fullenrich_index() -> LazyFullEnrichIndex:
+    """Index FullEnrich batch results by username without keeping the profiles resident"""
     logger.info("\n" + "="*100)
-    logger.info("LOADING WHITECONTEXT DATA")
+    logger.info("INDEXING FULLENRICH DATA")
     logger.info("="*100)
 
-    whitecontext_by_domain = {}
-    wc_files = sorted(WHITECONTEXT_DIR.glob("*.json"))
+    index = LazyFullEnrichIndex()
+    batch_files = sorted(FULLENRICH_DIR.glob("batch_*_results.json"))
 
-    if not wc_files:
-        logger.warning(f"No WhiteContext files found in {WHITECONTEXT_DIR}")
-        return {}
+    if not batch_files:
+        logger.warning(f"No FullEnrich batch files found in {FULLENRICH_DIR}")
+        return index
 
     total_loaded = 0
-    total_completed = 0
+    with METRICS.stage("load_fullenrich_index") as stage:
+        for batch_file, parsed in zip(batch_files, map_input_files(parse_fullenrich_usernames, batch_files)):
+            logger.info(f"  {parsed['file']}: {parsed['profiles']} profiles")
 
-    for wc_file in wc_files:
-        with open(wc_file, 'r') as f:
-            wc_data = json.load(f)
+            index.add_batch_file(batch_file, parsed["items"])
+            total_loaded += parsed["indexed"]
+        stage.items = total_loaded
+        stage.add_read(*batch_files)
 
-        results = wc_data.get("results", [])
-        completed = sum(1 for r in results if r.get("status") == "completed")
+    logger.info(f"✓ Indexed {total_loaded} FullEnrich profiles")
+    return index
 
-        logger.info(f"  {wc_file.name}: {len(results)} companies ({completed} completed)")
 
-        for result in results:
-            if result.get("status") != "completed":
-                continue
+def load_whitecontext_data() -> DomainIndex:
+    """Load all WhiteContext results and index by normalized domain (and registrable domain)"""
+    logger.info("\n" + "="*100)
+    logger.info("LOADING WHITECONTEXT DATA")
+    logger.info("="*100)
 
-            url = result.get("url")
-            normalized = normalize_domain(url)
+    whitecontext_by_domain = DomainIndex()
+    wc_files = sorted(WHITECONTEXT_DIR.glob("*.json"))
 
-            if normalized:
-                # Store the entire result (includes gtm_intelligence)
-                whitecontext_by_domain[normalized] = result
-                total_loaded += 1
-                total_completed += 1
+    if not wc_files:
+        logger.warning(f"No WhiteContext files found in {WHITECONTEXT_DIR}")
+        return whitecontext_by_domain
+
+    total_loaded = 0
+
+    with METRICS.stage("load_whitecontext_data") as stage:
+        for parsed in map_input_files(parse_whitecontext_file, wc_files):
+            logger.info(f"  {parsed['file']}: {parsed['companies']} companies ({parsed['completed']} completed)")
+
+            whitecontext_by_domain.update(parsed["results"])
+            total_loaded += parsed["indexed"]
+        stage.items = total_loaded
+        stage.add_read(*wc_files)
 
     logger.info(f"✓ Loaded {total_loaded} WhiteContext companies (all completed)")
     return whitecontext_by_domain
@@ -208,6 +566,7 @@ def load_whitecontext_data() -> Dict[str, Dict]:
 # DOMAIN EXTRACTION
 # ============================================================================
 
+@METRICS.timed("extract_domain_from_fullenrich")
 def extract_domain_from_fullenrich(fullenrich_data: Dict) -> Optional[str]:
     """
     Extract and normalize domain from FullEnrich data.
@@ -242,16 +601,35 @@ def extract_domain_from_fullenrich(fullenrich_data: Dict) -> Optional[str]:
     return None
 
 
+def extract_domain_from_profile(unified: Dict) -> Optional[str]:
+    """
+    Extract the normalized company domain from a unified profile.
+    Same priority as extract_domain_from_fullenrich(), read from the unified fields.
+    """
+    company = unified.get("company", {})
+    candidates = (company.get("domain"), company.get("website"), unified.get("contact", {}).get("domain"))
+
+    for candidate in candidates:
+        if candidate:
+            normalized = normalize_domain(candidate)
+            if normalized:
+                return normalized
+
+    return None
+
+
 # ============================================================================
 # UNIFIED DATA BUILDER
 # ============================================================================
 
+@METRICS.timed("build_unified_profile")
 def build_unified_profile(
     guest: Dict,
     fullenrich_data: Optional[Dict],
-    whitecontext_data: Optional[Dict]
+    whitecontext_data: Optional[Dict],
+    match: Optional[CompanyMatch] = None
 ) -> Dict:
-    """Build unified profile from all data sources"""
+    """Build unified profile from all data sources (match: how whitecontext_data was found)"""
 
     username = guest.get("username")
 
@@ -350,25 +728,10 @@ def build_unified_profile(
 
     # Add WhiteContext data if available
     if whitecontext_data:
-        gtm = whitecontext_data.get("gtm_intelligence", {})
-
-        unified["whitecontext"] = {
-            "enriched": True,
-            "analyzed_at": whitecontext_data.get("analyzed_at"),
-            "source_url": whitecontext_data.get("url"),
-            "company_name": whitecontext_data.get("company_name"),
-            "tldr": gtm.get("tldr"),
-            "context_tags": gtm.get("context_tags", []),
-            "business_model": gtm.get("business_model", {}),
-            "company_profile": gtm.get("company_profile", {}),
-            "products_services": gtm.get("products_services", []),
-            "technology_profile": gtm.get("technology_profile", {}),
-            "market_evidence": gtm.get("market_evidence", {}),
-            "contact_information": gtm.get("contact_information", {}),
-            "company_intelligence": gtm.get("company_intelligence", {}),
-            "recognition_credibility": gtm.get("recognition_credibility", {}),
-            "intelligence_gaps": gtm.get("intelligence_gaps", [])
-        }
+        # Values are the WhiteContext record's own objects, shared by everyone at the company
+        unified["whitecontext"] = {"enriched": True, **whitecontext_view(whitecontext_data)}
+        if match:
+            unified["whitecontext"]["match"] = match.to_dict()
 
         unified["data_completeness"]["has_whitecontext"] = True
     else:
@@ -381,6 +744,107 @@ def build_unified_profile(
 # MAIN UNIFICATION LOGIC
 # ============================================================================
 
+def new_unification_stats(total_guests: int = 0) -> Dict:
+    """Create an empty statistics record"""
+    return {
+        "total_guests": total_guests,
+        "with_linkedin_url": 0,
+        "with_fullenrich": 0,
+        "with_whitecontext": 0,
+        "with_email": 0,
+        "with_company": 0,
+        "domain_matches": 0,
+        "domain_mismatches": 0,
+        "unmatched_domains": [],
+        "match_methods": {},
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+def build_company_resolver(whitecontext_by_domain: Dict[str, Dict]) -> Optional[CompanyResolver]:
+    """Blocking index for fuzzy company matching (None with --match exact)"""
+    if MATCH_MODE != "fuzzy" or not whitecontext_by_domain:
+        return None
+
+    with METRICS.stage("build_match_index") as stage:
+        resolver = CompanyResolver(whitecontext_by_domain, MIN_MATCH_CONFIDENCE)
+        stage.items = len(resolver)
+
+    logger.info(f"✓ Indexed {len(resolver)} WhiteContext companies for fuzzy matching")
+    return resolver
+
+
+def match_company(
+    fullenrich_data: Optional[Dict],
+    domain: Optional[str],
+    whitecontext_domains: DomainIndex,
+    resolver: Optional[CompanyResolver]
+) -> Optional[CompanyMatch]:
+    """WhiteContext company of a guest: host / registrable domain join first, then entity resolution"""
+    key = whitecontext_domains.lookup(domain)
+    if key:
+        key_domain, method = key
+        return CompanyMatch(key_domain, method, 1.0 if method == "domain" else SCORE_REGISTRABLE_DOMAIN)
+    if resolver and fullenrich_data:
+        return resolver.resolve_fullenrich(fullenrich_data)
+    return None
+
+
+def unify_guest(
+    guest: Dict,
+    fullenrich_by_username: Dict[str, Dict] | LazyFullEnrichIndex,
+    whitecontext_by_domain: DomainIndex,
+    stats: Dict,
+    resolver: Optional[CompanyResolver] = None
+) -> Dict:
+    """Join one guest against the FullEnrich/WhiteContext indexes and update stats"""
+    username = guest.get("username")
+
+    # Get FullEnrich data
+    fullenrich_data = fullenrich_by_username.get(username)
+
+    # Extract and normalize domain
+    domain = extract_domain_from_fullenrich(fullenrich_data) if fullenrich_data else None
+
+    # Find the WhiteContext company
+    match = match_company(fullenrich_data, domain, whitecontext_by_domain, resolver)
+    whitecontext_data = whitecontext_by_domain[match.domain] if match else None
+
+    # Build unified profile
+    unified = build_unified_profile(guest, fullenrich_data, whitecontext_data, match)
+    record_profile_stats(stats, unified, domain)
+
+    return unified
+
+
+def record_profile_stats(stats: Dict, unified: Dict, domain: Optional[str]):
+    """Update domain matching and coverage counters for one unified profile"""
+    match = unified["whitecontext"].get("match")
+    if match:
+        stats["match_methods"][match["method"]] = stats["match_methods"].get(match["method"], 0) + 1
+
+    if domain:
+        if unified["data_completeness"]["has_whitecontext"]:
+            stats["domain_matches"] += 1
+        else:
+            stats["domain_mismatches"] += 1
+            stats["unmatched_domains"].append({
+                "username": unified["username"],
+                "domain": domain
+            })
+
+    if unified["linkedin"].get("url"):
+        stats["with_linkedin_url"] += 1
+    if unified["data_completeness"]["has_fullenrich"]:
+        stats["with_fullenrich"] += 1
+    if unified["data_completeness"]["has_whitecontext"]:
+        stats["with_whitecontext"] += 1
+    if unified["data_completeness"]["has_email"]:
+        stats["with_email"] += 1
+    if unified["data_completeness"]["has_company"]:
+        stats["with_company"] += 1
+
+
 def unify_all_data() -> tuple[List[Dict], Dict]:
     """Main unification logic"""
 
@@ -393,19 +857,10 @@ def unify_all_data() -> tuple[List[Dict], Dict]:
         logger.error("No guest profiles loaded - aborting")
         return [], {}
 
+    resolver = build_company_resolver(whitecontext_by_domain)
+
     # Statistics
-    stats = {
-        "total_guests": len(guests),
-        "with_linkedin_url": 0,
-        "with_fullenrich": 0,
-        "with_whitecontext": 0,
-        "with_email": 0,
-        "with_company": 0,
-        "domain_matches": 0,
-        "domain_mismatches": 0,
-        "unmatched_domains": [],
-        "timestamp": datetime.now().isoformat()
-    }
+    stats = new_unification_stats(len(guests))
 
     # Build unified profiles
     logger.info("\n" + "="*100)
@@ -414,54 +869,440 @@ def unify_all_data() -> tuple[List[Dict], Dict]:
 
     unified_profiles = []
 
-    for i, guest in enumerate(guests, 1):
-        username = guest.get("username")
+    with METRICS.stage("unify_guests") as stage:
+        for i, guest in enumerate(guests, 1):
+            if i % 50 == 0:
+                logger.info(f"  Processing: {i}/{len(guests)} guests...")
 
-        if i % 50 == 0:
-            logger.info(f"  Processing: {i}/{len(guests)} guests...")
+            unified = unify_guest(guest, fullenrich_by_username, whitecontext_by_domain, stats, resolver)
+            unified_profiles.append(unified)
+        stage.items = len(unified_profiles)
 
-        # Get FullEnrich data
-        fullenrich_data = fullenrich_by_username.get(username)
+    logger.info(f"✓ Unified {len(unified_profiles)} profiles")
 
-        # Extract and normalize domain
-        domain = None
-        whitecontext_data = None
+    return unified_profiles, stats
+
+
+def unify_all_data_streaming() -> Dict:
+    """
+    Streaming unification logic.
+    Guests are parsed incrementally and every unified profile is written to the
+    output files as soon as it is built. Only the join indexes stay in memory.
+    """
+
+    # Load join indexes
+    fullenrich_by_username = load_fullenrich_index()
+    whitecontext_by_domain = load_whitecontext_data()
+    resolver = build_company_resolver(whitecontext_by_domain)
+
+    stats = new_unification_stats()
+
+    logger.info("\n" + "="*100)
+    logger.info("UNIFYING DATA (STREAMING)")
+    logger.info("="*100)
+
+    index_entries = []
+
+    with METRICS.stage("unify_guests") as stage, ExitStack() as outputs:
+        all_writer = whitecontext_writer = columnar_writer = normalized_writer = rows_writer = None
+        if "json" in OUTPUT_FORMATS:
+            all_writer = outputs.enter_context(JsonArrayWriter(OUTPUT_ALL))
+            whitecontext_writer = outputs.enter_context(JsonArrayWriter(OUTPUT_WHITECONTEXT))
+        if "columnar" in OUTPUT_FORMATS:
+            from columnar_store import ColumnarWriter
+            columnar_writer = outputs.enter_context(ColumnarWriter(OUTPUT_COLUMNAR))
+        if "normalized" in OUTPUT_FORMATS:
+            normalized_writer = outputs.enter_context(NormalizedWriter(OUTPUT_NORMALIZED, OUTPUT_COMPANIES))
+        if "rows" in OUTPUT_FORMATS:
+            from profile_model import ProfileRowWriter
+            rows_writer = outputs.enter_context(ProfileRowWriter(OUTPUT_ROWS))
+        features = feature_builder() if BUILD_FEATURES else None
+        hashes = {} if BUILD_SUMMARY_HASHES else None
+        if hashes is not None:
+            from summary_cache import summary_hash
+        delta = delta_builder() if BUILD_CHANGES else None
+        geo = {} if BUILD_GEO else None
+        if geo is not None:
+            from geo_index import Gazetteer, profile_location
+            gazetteer = Gazetteer()
+
+        for i, guest in enumerate(iter_guest_profiles(), 1):
+            if i % 50 == 0:
+                logger.info(f"  Processing: {i} guests...")
+
+            unified = unify_guest(guest, fullenrich_by_username, whitecontext_by_domain, stats, resolver)
+            stats["total_guests"] = i
+
+            if all_writer:
+                offset, length = all_writer.write(unified)
+                index_entries.append((unified["username"], offset, length, extract_domain_from_profile(unified)))
+                if unified["data_completeness"]["has_whitecontext"]:
+                    whitecontext_writer.write(unified)
+            if columnar_writer:
+                columnar_writer.write(unified)
+            if normalized_writer:
+                normalized_writer.write(unified)
+            if rows_writer:
+                rows_writer.write(unified)
+            if features is not None:
+                features.add(unified)
+            if hashes is not None:
+                hashes[unified["username"]] = summary_hash(unified)
+            if delta is not None:
+                delta.add(unified)
+            if geo is not None:
+                point = gazetteer.geocode(profile_location(unified) or "")
+                if point:
+                    geo[unified["username"]] = [point.latitude, point.longitude, point.precision]
+
+        # Profiles are written while they are built, so this stage includes the writes
+        stage.items = stats["total_guests"]
+        if GUEST_PROFILES_FILE.exists():
+            stage.add_read(GUEST_PROFILES_FILE)
+        outputs.close()
+        stage.add_written(*(path for path, enabled in (
+            (OUTPUT_ALL, all_writer), (OUTPUT_WHITECONTEXT, whitecontext_writer), (OUTPUT_COLUMNAR, columnar_writer),
+            (OUTPUT_NORMALIZED, normalized_writer), (OUTPUT_COMPANIES, normalized_writer), (OUTPUT_ROWS, rows_writer)
+        ) if enabled))
+
+    if not stats["total_guests"]:
+        logger.error("No guest profiles streamed - aborting")
+        return {}
+
+    logger.info(f"✓ Unified {stats['total_guests']} profiles")
+    if all_writer:
+        logger.info(f"✓ Streamed all {all_writer.count} profiles: {OUTPUT_ALL.name}")
+        logger.info(f"✓ Streamed {whitecontext_writer.count} profiles with WhiteContext: {OUTPUT_WHITECONTEXT.name}")
+        save_profile_index(index_entries)
+    if columnar_writer:
+        logger.info(f"✓ Streamed {columnar_writer.count} profiles: {OUTPUT_COLUMNAR.name}")
+    if normalized_writer:
+        logger.info(f"✓ Streamed {normalized_writer.count} profiles referencing "
+                    f"{len(normalized_writer.companies)} companies: {OUTPUT_NORMALIZED.name}, {OUTPUT_COMPANIES.name}")
+    if rows_writer:
+        logger.info(f"✓ Streamed {rows_writer.count} profiles: {OUTPUT_ROWS.name}")
+    if features is not None:
+        save_features(features)
+    if hashes is not None:
+        save_summary_hashes(hashes)
+    if delta is not None:
+        save_changes(delta)
+    if geo is not None:
+        save_geo(geo, stats["total_guests"])
+
+    save_report(stats)
+
+    return stats
+
+
+# ============================================================================
+# INCREMENTAL UNIFICATION
+# ============================================================================
 
-        if fullenrich_data:
-            domain = extract_domain_from_fullenrich(fullenrich_data)
+def file_fingerprint(path: Path) -> str:
+    """Content hash of an input file"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
 
-            if domain:
-                # Try to find WhiteContext data
-                whitecontext_data = whitecontext_by_domain.get(domain)
 
-                if whitecontext_data:
-                    stats["domain_matches"] += 1
+def record_fingerprint(record: Dict) -> str:
+    """Content hash of a single JSON record (key order independent)"""
+    canonical = json_backend.dumps(record, sort_keys=True)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def load_manifest() -> Optional[Dict]:
+    """Load the previous run's manifest, if it is usable"""
+    if not OUTPUT_MANIFEST.exists():
+        return None
+
+    manifest = json_backend.load(OUTPUT_MANIFEST)
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        logger.warning(f"Manifest version {manifest.get('version')} != {MANIFEST_VERSION} - rebuilding everything")
+        return None
+
+    return manifest
+
+
+def save_manifest(manifest: Dict):
+    """Save the manifest for the next incremental run"""
+    json_backend.dump(manifest, OUTPUT_MANIFEST)
+    logger.info(f"✓ Saved manifest: {OUTPUT_MANIFEST.name}")
+
+
+def scan_source_files(files: List[Path], previous: Dict[str, Dict], read_records) -> tuple[Dict[str, Dict], Dict[str, Dict[str, Dict]]]:
+    """
+    Fingerprint a set of source files.
+    Files whose content hash matches the previous manifest are not parsed; their
+    per-record fingerprints are carried over. Changed files are parsed once, using
+    the loader process pool when --workers is set.
+    Returns (file name -> {hash, records}, file name -> parsed records of changed files)
+    """
+    hashes = {path.name: file_fingerprint(path) for path in files}
+    changed = [path for path in files if previous.get(path.name, {}).get("hash") != hashes[path.name]]
+
+    # Changed files are parsed (in parallel with --workers) before entries are assembled in order
+    parsed = {}
+    for path, records in zip(changed, map_input_files(read_records, changed)):
+        parsed[path.name] = records
+        logger.info(f"  Changed: {path.name} ({len(records)} records)")
+
+    entries = {}
+    for path in files:
+        if path.name in parsed:
+            records = parsed[path.name]
+            entries[path.name] = {
+                "hash": hashes[path.name],
+                "records": {key: record_fingerprint(record) for key, record in records.items()}
+            }
+        else:
+            entries[path.name] = previous[path.name]
+
+    return entries, parsed
+
+
+def resolve_record_sources(entries: Dict[str, Dict]) -> Dict[str, str]:
+    """Map each record key to the file it is read from (last file in sorted order wins)"""
+    source_by_key = {}
+    for file_name, entry in entries.items():
+        for key in entry["records"]:
+            source_by_key[key] = file_name
+    return source_by_key
+
+
+def unify_all_data_incremental() -> Dict:
+    """
+    Incremental unification logic.
+    Rebuilds only the profiles whose guest, FullEnrich or WhiteContext inputs changed
+    since the previous run and rewrites the outputs, report and manifest.
+    """
+    logger.info("\n" + "="*100)
+    logger.info("SCANNING INPUTS (INCREMENTAL)")
+    logger.info("="*100)
+
+    if not GUEST_PROFILES_FILE.exists():
+        logger.error(f"Guest profiles file not found: {GUEST_PROFILES_FILE}")
+        return {}
+
+    manifest = load_manifest()
+    if manifest and not (OUTPUT_ALL.exists() and OUTPUT_REPORT.exists()):
+        logger.warning("Previous outputs missing - rebuilding everything")
+        manifest = None
+    if manifest is None:
+        manifest = {"guest_file": None, "fullenrich_files": {}, "whitecontext_files": {}, "guests": {}, "match": None}
+    match_settings = {"mode": MATCH_MODE, "min_confidence": MIN_MATCH_CONFIDENCE}
+
+    with METRICS.stage("scan_inputs") as stage:
+        guest_file_hash = file_fingerprint(GUEST_PROFILES_FILE)
+        fullenrich_batch_files = sorted(FULLENRICH_DIR.glob("batch_*_results.json"))
+        whitecontext_result_files = sorted(WHITECONTEXT_DIR.glob("*.json"))
+        fullenrich_files, fullenrich_parsed = scan_source_files(
+            fullenrich_batch_files,
+            manifest["fullenrich_files"],
+            read_fullenrich_batch
+        )
+        whitecontext_files, whitecontext_parsed = scan_source_files(
+            whitecontext_result_files,
+            manifest["whitecontext_files"],
+            read_whitecontext_file
+        )
+        stage.items = 1 + len(fullenrich_batch_files) + len(whitecontext_result_files)
+        stage.add_read(GUEST_PROFILES_FILE, *fullenrich_batch_files, *whitecontext_result_files)
+
+    # Fuzzy matches depend on every WhiteContext company, not only the matched one
+    companies_unchanged = (
+        list(whitecontext_files.items()) == list(manifest["whitecontext_files"].items())
+        and match_settings == manifest["match"]
+    )
+    inputs_unchanged = (
+        guest_file_hash == manifest["guest_file"]
+        and list(fullenrich_files.items()) == list(manifest["fullenrich_files"].items())
+        and companies_unchanged
+    )
+    changes = {
+        "changed_fullenrich_files": sorted(fullenrich_parsed),
+        "changed_whitecontext_files": sorted(whitecontext_parsed),
+        "guest_file_changed": guest_file_hash != manifest["guest_file"]
+    }
+
+    if inputs_unchanged:
+        logger.info("✓ Inputs unchanged - outputs are up to date")
+        stats = json_backend.load(OUTPUT_REPORT)
+        stats["incremental"] = {"rebuilt_profiles": 0, "reused_profiles": stats["total_guests"], **changes}
+        if BUILD_CHANGES:
+            save_changes(iter_json_array(OUTPUT_ALL))  # Empty change set (or the first snapshot)
+        if BUILD_GEO:
+            save_geo(iter_json_array(OUTPUT_ALL))
+        save_report(stats)
+        return stats
+
+    fullenrich_source = resolve_record_sources(fullenrich_files)
+    whitecontext_source = DomainIndex(resolve_record_sources(whitecontext_files))
+
+    def fullenrich_record(username: str) -> Optional[Dict]:
+        file_name = fullenrich_source.get(username)
+        if file_name is None:
+            return None
+        if file_name not in fullenrich_parsed:
+            fullenrich_parsed[file_name] = read_fullenrich_batch(FULLENRICH_DIR / file_name)
+        return fullenrich_parsed[file_name].get(username)
+
+    def whitecontext_record(domain: str) -> Optional[Dict]:
+        file_name = whitecontext_source.get(domain)
+        if file_name is None:
+            return None
+        if file_name not in whitecontext_parsed:
+            whitecontext_parsed[file_name] = read_whitecontext_file(WHITECONTEXT_DIR / file_name)
+        return whitecontext_parsed[file_name].get(domain)
+
+    resolver = None
+
+    def company_resolver() -> Optional[CompanyResolver]:
+        # Only built (reading every WhiteContext file) once a guest needs re-resolving
+        nonlocal resolver
+        if resolver is None:
+            resolver = build_company_resolver({domain: whitecontext_record(domain) for domain in whitecontext_source})
+        return resolver
+
+    guests = load_guest_profiles()
+    if not guests:
+        logger.error("No guest profiles loaded - aborting")
+        return {}
+
+    # Previous profiles are only needed if some of them can be carried over; their
+    # WhiteContext sections are parsed once per guest, so keep one copy per company
+    previous_guests = manifest["guests"]
+    previous_profiles = {}
+    if previous_guests:
+        for profile in intern_profiles(iter_json_array(OUTPUT_ALL)):
+            previous_profiles[profile["username"]] = profile
+
+    logger.info("\n" + "="*100)
+    logger.info("UNIFYING DATA (INCREMENTAL)")
+    logger.info("="*100)
+
+    stats = new_unification_stats(len(guests))
+    guest_fingerprints = {}
+    unified_profiles = []
+    rebuilt = 0
+
+    with METRICS.stage("unify_guests") as stage:
+        for guest in guests:
+            username = guest.get("username")
+            previous = previous_guests.get(username)
+
+            fullenrich_file = fullenrich_source.get(username)
+            fullenrich_hash = fullenrich_files[fullenrich_file]["records"][username] if fullenrich_file else None
+
+            # The domain only needs re-extracting when the FullEnrich record changed
+            fullenrich_unchanged = previous and previous["fullenrich"] == fullenrich_hash
+            if fullenrich_unchanged:
+                domain = previous["domain"]
+            else:
+                fullenrich_data = fullenrich_record(username)
+                domain = extract_domain_from_fullenrich(fullenrich_data) if fullenrich_data else None
+
+            # Domain matches are checked every run; fuzzy ones are carried over if nothing they depend on changed
+            match = match_company(None, domain, whitecontext_source, None)
+            if match is None and MATCH_MODE == "fuzzy" and fullenrich_hash:
+                if fullenrich_unchanged and companies_unchanged:
+                    match = CompanyMatch(**previous["match"]) if previous["match"] else None
                 else:
-                    stats["domain_mismatches"] += 1
-                    stats["unmatched_domains"].append({
-                        "username": username,
-                        "domain": domain
-                    })
-
-        # Build unified profile
-        unified = build_unified_profile(guest, fullenrich_data, whitecontext_data)
-        unified_profiles.append(unified)
-
-        # Update stats
-        if unified["linkedin"].get("url"):
-            stats["with_linkedin_url"] += 1
-        if unified["data_completeness"]["has_fullenrich"]:
-            stats["with_fullenrich"] += 1
-        if unified["data_completeness"]["has_whitecontext"]:
-            stats["with_whitecontext"] += 1
-        if unified["data_completeness"]["has_email"]:
-            stats["with_email"] += 1
-        if unified["data_completeness"]["has_company"]:
-            stats["with_company"] += 1
+                    match = match_company(fullenrich_record(username), domain, whitecontext_source, company_resolver())
 
-    logger.info(f"✓ Unified {len(unified_profiles)} profiles")
+            whitecontext_file = whitecontext_source.get(match.domain) if match else None
+            whitecontext_hash = whitecontext_files[whitecontext_file]["records"][match.domain] if whitecontext_file else None
 
-    return unified_profiles, stats
+            fingerprint = {
+                "guest": record_fingerprint(guest),
+                "fullenrich": fullenrich_hash,
+                "domain": domain,
+                "match": match.to_dict() if match else None,
+                "whitecontext": whitecontext_hash
+            }
+
+            if fingerprint == previous and username in previous_profiles:
+                unified = previous_profiles[username]
+            else:
+                unified = build_unified_profile(
+                    guest,
+                    fullenrich_record(username),
+                    whitecontext_record(match.domain) if match else None,
+                    match
+                )
+                rebuilt += 1
+
+            record_profile_stats(stats, unified, domain)
+            guest_fingerprints[username] = fingerprint
+            unified_profiles.append(unified)
+        stage.items = len(unified_profiles)
+
+    stats["incremental"] = {
+        "rebuilt_profiles": rebuilt,
+        "reused_profiles": len(unified_profiles) - rebuilt,
+        **changes
+    }
+    logger.info(f"✓ Rebuilt {rebuilt} profiles, reused {len(unified_profiles) - rebuilt}")
+
+    # Outputs are swapped in atomically and the manifest is written last, so an
+    # interrupted run leaves the previous outputs and manifest consistent
+    with METRICS.stage("save_outputs") as stage:
+        index_entries = []
+        for output, profiles in (
+            (OUTPUT_ALL, unified_profiles),
+            (OUTPUT_WHITECONTEXT, (p for p in unified_profiles if p["data_completeness"]["has_whitecontext"]))
+        ):
+            tmp_output = output.with_name(output.name + ".tmp")
+            with JsonArrayWriter(tmp_output) as writer:
+                for profile in profiles:
+                    offset, length = writer.write(profile)
+                    if output == OUTPUT_ALL:
+                        index_entries.append((profile["username"], offset, length, extract_domain_from_profile(profile)))
+            os.replace(tmp_output, output)
+            logger.info(f"✓ Patched {output.name}: {writer.count} profiles")
+
+        save_profile_index(index_entries)
+
+        if "columnar" in OUTPUT_FORMATS:
+            save_columnar(unified_profiles)
+        if "normalized" in OUTPUT_FORMATS:
+            save_normalized(unified_profiles)
+        if "rows" in OUTPUT_FORMATS:
+            save_rows(unified_profiles)
+
+        stage.items = len(unified_profiles)
+        stage.add_written(OUTPUT_ALL, OUTPUT_WHITECONTEXT, OUTPUT_INDEX)
+        if "columnar" in OUTPUT_FORMATS:
+            stage.add_written(OUTPUT_COLUMNAR)
+        if "normalized" in OUTPUT_FORMATS:
+            stage.add_written(OUTPUT_NORMALIZED, OUTPUT_COMPANIES)
+        if "rows" in OUTPUT_FORMATS:
+            stage.add_written(OUTPUT_ROWS)
+
+    if BUILD_FEATURES:
+        save_features(unified_profiles)
+    if BUILD_SUMMARY_HASHES:
+        save_summary_hashes(unified_profiles)
+    if BUILD_CHANGES:
+        save_changes(unified_profiles)
+    if BUILD_GEO:
+        save_geo(unified_profiles)
+
+    save_report(stats)
+    save_manifest({
+        "version": MANIFEST_VERSION,
+        "guest_file": guest_file_hash,
+        "fullenrich_files": fullenrich_files,
+        "whitecontext_files": whitecontext_files,
+        "match": match_settings,
+        "guests": guest_fingerprints
+    })
+
+    return stats
 
 
 # ============================================================================
@@ -474,20 +1315,178 @@ def save_outputs(unified_profiles: List[Dict], stats: Dict):
     logger.info("SAVING OUTPUTS")
     logger.info("="*100)
 
-    # Save all unified profiles
-    with open(OUTPUT_ALL, 'w') as f:
-        json.dump(unified_profiles, f, indent=2)
-    logger.info(f"✓ Saved all {len(unified_profiles)} profiles: {OUTPUT_ALL.name}")
-
-    # Filter and save only profiles with WhiteContext data
-    with_whitecontext = [p for p in unified_profiles if p["data_completeness"]["has_whitecontext"]]
-    with open(OUTPUT_WHITECONTEXT, 'w') as f:
-        json.dump(with_whitecontext, f, indent=2)
-    logger.info(f"✓ Saved {len(with_whitecontext)} profiles with WhiteContext: {OUTPUT_WHITECONTEXT.name}")
-
-    # Save statistics report
-    with open(OUTPUT_REPORT, 'w') as f:
-        json.dump(stats, f, indent=2)
+    with METRICS.stage("save_outputs") as stage:
+        if "json" in OUTPUT_FORMATS:
+            # Save all unified profiles, recording where each one lands for the lookup index
+            index_entries = []
+            with JsonArrayWriter(OUTPUT_ALL) as writer:
+                for profile in unified_profiles:
+                    offset, length = writer.write(profile)
+                    index_entries.append((profile["username"], offset, length, extract_domain_from_profile(profile)))
+            logger.info(f"✓ Saved all {len(unified_profiles)} profiles: {OUTPUT_ALL.name}")
+            save_profile_index(index_entries)
+
+            # Filter and save only profiles with WhiteContext data
+            with JsonArrayWriter(OUTPUT_WHITECONTEXT) as writer:
+                for profile in unified_profiles:
+                    if profile["data_completeness"]["has_whitecontext"]:
+                        writer.write(profile)
+            logger.info(f"✓ Saved {writer.count} profiles with WhiteContext: {OUTPUT_WHITECONTEXT.name}")
+            stage.add_written(OUTPUT_ALL, OUTPUT_WHITECONTEXT, OUTPUT_INDEX)
+
+        if "columnar" in OUTPUT_FORMATS:
+            save_columnar(unified_profiles)
+            stage.add_written(OUTPUT_COLUMNAR)
+
+        if "normalized" in OUTPUT_FORMATS:
+            save_normalized(unified_profiles)
+            stage.add_written(OUTPUT_NORMALIZED, OUTPUT_COMPANIES)
+
+        if "rows" in OUTPUT_FORMATS:
+            save_rows(unified_profiles)
+            stage.add_written(OUTPUT_ROWS)
+
+        stage.items = len(unified_profiles)
+
+    if BUILD_FEATURES:
+        save_features(unified_profiles)
+    if BUILD_SUMMARY_HASHES:
+        save_summary_hashes(unified_profiles)
+    if BUILD_CHANGES:
+        save_changes(unified_profiles)
+    if BUILD_GEO:
+        save_geo(unified_profiles)
+
+    save_report(stats)
+
+
+def save_profile_index(index_entries: List[tuple]):
+    """Save the username/domain lookup index for unified_guests_all.json"""
+    from profile_index import write_profile_index
+
+    num_usernames, num_domains = write_profile_index(OUTPUT_INDEX, OUTPUT_ALL, index_entries)
+    logger.info(f"✓ Saved lookup index ({num_usernames} usernames, {num_domains} domains): {OUTPUT_INDEX.name}")
+
+
+def save_columnar(unified_profiles: List[Dict]):
+    """Save all unified profiles to the columnar store"""
+    from columnar_store import ColumnarWriter
+
+    tmp_output = OUTPUT_COLUMNAR.with_name(OUTPUT_COLUMNAR.name + ".tmp")
+    with ColumnarWriter(tmp_output) as writer:
+        for profile in unified_profiles:
+            writer.write(profile)
+    os.replace(tmp_output, OUTPUT_COLUMNAR)
+    logger.info(f"✓ Saved {writer.count} profiles to columnar store: {OUTPUT_COLUMNAR.name}")
+
+
+def save_normalized(unified_profiles: List[Dict]):
+    """Save all unified profiles in the normalized layout (guests + company table)"""
+    tmp_guests = OUTPUT_NORMALIZED.with_name(OUTPUT_NORMALIZED.name + ".tmp")
+    tmp_companies = OUTPUT_COMPANIES.with_name(OUTPUT_COMPANIES.name + ".tmp")
+    with NormalizedWriter(tmp_guests, tmp_companies) as writer:
+        for profile in unified_profiles:
+            writer.write(profile)
+    os.replace(tmp_companies, OUTPUT_COMPANIES)
+    os.replace(tmp_guests, OUTPUT_NORMALIZED)
+    logger.info(f"✓ Saved {writer.count} profiles referencing {len(writer.companies)} companies: "
+                f"{OUTPUT_NORMALIZED.name}, {OUTPUT_COMPANIES.name}")
+
+
+def save_rows(unified_profiles: List[Dict]):
+    """Save all unified profiles as compact rows (see profile_model.py)"""
+    from profile_model import ProfileRowWriter
+
+    tmp_output = OUTPUT_ROWS.with_name(OUTPUT_ROWS.name + ".tmp")
+    with ProfileRowWriter(tmp_output) as writer:
+        for profile in unified_profiles:
+            writer.write(profile)
+    os.replace(tmp_output, OUTPUT_ROWS)
+    logger.info(f"✓ Saved {writer.count} profiles as rows ({len(writer.companies)} companies): {OUTPUT_ROWS.name}")
+
+
+def feature_builder():
+    """Empty match_features.FeatureBuilder for this run (imports numpy)"""
+    from match_features import FEATURE_DIM, FeatureBuilder
+    return FeatureBuilder(FEATURES_DIM or FEATURE_DIM)
+
+
+def save_features(profiles: "Iterable[Dict] | FeatureBuilder"):
+    """Compute and save the local matching feature matrix (profiles, or a builder that already has them)"""
+    from match_features import FeatureBuilder, metadata_path_for
+
+    with METRICS.stage("build_features") as stage:
+        builder = profiles if isinstance(profiles, FeatureBuilder) else feature_builder()
+        if builder is not profiles:
+            for profile in profiles:
+                builder.add(profile)
+        stage.items = builder.save(OUTPUT_FEATURES)
+        stage.add_written(OUTPUT_FEATURES, metadata_path_for(OUTPUT_FEATURES))
+    logger.info(f"✓ Saved {stage.items} x {builder.dim} matching features: {OUTPUT_FEATURES.name}")
+
+
+def save_summary_hashes(profiles: Iterable[Dict] | Dict[str, str]):
+    """Save username -> summary prompt content hash (profiles, or hashes already computed)"""
+    from summary_cache import SUMMARY_INPUTS_VERSION, summary_hash
+
+    with METRICS.stage("summary_hashes") as stage:
+        hashes = profiles if isinstance(profiles, dict) else {
+            profile["username"]: summary_hash(profile) for profile in profiles
+        }
+        json_backend.dump({"version": SUMMARY_INPUTS_VERSION, "profiles": hashes}, OUTPUT_SUMMARY_HASHES, pretty=PRETTY_JSON)
+        stage.items = len(hashes)
+        stage.add_written(OUTPUT_SUMMARY_HASHES)
+    logger.info(f"✓ Saved {stage.items} summary hashes: {OUTPUT_SUMMARY_HASHES.name}")
+
+
+def delta_builder():
+    """profile_delta.DeltaBuilder against the previous run's snapshot"""
+    from profile_delta import DeltaBuilder, load_snapshot
+    return DeltaBuilder(load_snapshot(OUTPUT_SNAPSHOT))
+
+
+def save_changes(profiles: "Iterable[Dict] | DeltaBuilder"):
+    """Save the change set and snapshot of this run (profiles, or a builder that already has them)"""
+    from profile_delta import DeltaBuilder
+
+    with METRICS.stage("changes") as stage:
+        delta = profiles if isinstance(profiles, DeltaBuilder) else delta_builder()
+        if delta is not profiles:
+            for profile in profiles:
+                delta.add(profile)
+        changes = delta.save(OUTPUT_CHANGES, OUTPUT_SNAPSHOT, pretty=PRETTY_JSON)
+        stage.items = len(delta.hashes)
+        stage.add_written(OUTPUT_CHANGES, OUTPUT_SNAPSHOT)
+
+    counts = changes["counts"]
+    if changes["base"] is None:
+        logger.info(f"✓ Saved first snapshot of {stage.items} profiles (no previous snapshot to diff): {OUTPUT_SNAPSHOT.name}")
+    else:
+        logger.info(f"✓ Saved change set ({counts['added']} added, {counts['updated']} updated, "
+                    f"{counts['removed']} removed, {counts['unchanged']} unchanged): {OUTPUT_CHANGES.name}")
+
+
+def save_geo(profiles: Iterable[Dict] | Dict[str, list], total: Optional[int] = None):
+    """Save username -> [lat, lng, precision] (profiles, or coordinates already geocoded of `total` guests)"""
+    from geo_index import GEO_VERSION, Gazetteer, geocode_profiles
+
+    with METRICS.stage("geocode") as stage:
+        if isinstance(profiles, dict):
+            geo = profiles
+        else:
+            profiles = list(profiles)
+            total = len(profiles)
+            geo = geocode_profiles(profiles, Gazetteer())
+        json_backend.dump({"version": GEO_VERSION, "profiles": geo}, OUTPUT_GEO, pretty=PRETTY_JSON)
+        stage.items = total
+        stage.add_written(OUTPUT_GEO)
+    logger.info(f"✓ Geocoded {len(geo)} of {total} guests: {OUTPUT_GEO.name}")
+
+
+def save_report(stats: Dict):
+    """Save statistics report (including the stage metrics of this run)"""
+    stats["metrics"] = METRICS.report()
+    json_backend.dump(stats, OUTPUT_REPORT, pretty=PRETTY_JSON)
     logger.info(f"✓ Saved statistics report: {OUTPUT_REPORT.name}")
 
 
@@ -510,6 +1509,8 @@ def print_statistics(stats: Dict):
     logger.info(f"\n🔗 Domain Matching:")
     logger.info(f"  Successful matches: {stats['domain_matches']}")
     logger.info(f"  Unmatched domains: {stats['domain_mismatches']}")
+    for method, count in sorted(stats.get("match_methods", {}).items(), key=lambda item: -item[1]):
+        logger.info(f"  Matched by {method}: {count}")
 
     if stats['domain_mismatches'] > 0:
         logger.info(f"\n⚠️  Sample unmatched domains (first 10):")
@@ -518,12 +1519,48 @@ def print_statistics(stats: Dict):
         if stats['domain_mismatches'] > 10:
             logger.info(f"    ... and {stats['domain_mismatches'] - 10} more")
 
+    if "incremental" in stats:
+        incremental = stats["incremental"]
+        logger.info(f"\n♻️  Incremental Rebuild:")
+        logger.info(f"  Rebuilt profiles: {incremental['rebuilt_profiles']}")
+        logger.info(f"  Reused profiles: {incremental['reused_profiles']}")
+        logger.info(f"  Changed FullEnrich files: {len(incremental['changed_fullenrich_files'])}")
+        logger.info(f"  Changed WhiteContext files: {len(incremental['changed_whitecontext_files'])}")
+
+    if stats.get("metrics"):
+        logger.info(f"\n⏱  Stage Metrics:")
+        logger.info(f"  {'stage':<32} {'wall s':>8} {'cpu s':>8} {'items/s':>10} {'MB read':>8} {'MB written':>10} {'peak RSS MB':>11}")
+        for name, m in stats["metrics"].items():
+            items_per_sec = f"{m['items_per_sec']:,.0f}" if m["items_per_sec"] else "-"
+            peak = f"{m['peak_rss_bytes'] / 1e6:,.0f}" if m["peak_rss_bytes"] else "-"
+            logger.info(
+                f"  {name:<32} {m['seconds']:>8.2f} {m['cpu_seconds']:>8.2f} {items_per_sec:>10} "
+                f"{m['bytes_read'] / 1e6:>8.1f} {m['bytes_written'] / 1e6:>10.1f} {peak:>11}"
+            )
+
     logger.info("\n" + "="*100)
     logger.info("UNIFICATION COMPLETE")
     logger.info("="*100)
     logger.info(f"\nOutputs:")
     logger.info(f"  All guests: {OUTPUT_ALL}")
     logger.info(f"  With WhiteContext: {OUTPUT_WHITECONTEXT}")
+    if "columnar" in OUTPUT_FORMATS:
+        logger.info(f"  Columnar store: {OUTPUT_COLUMNAR}")
+    if "json" in OUTPUT_FORMATS:
+        logger.info(f"  Lookup index: {OUTPUT_INDEX}")
+    if "normalized" in OUTPUT_FORMATS:
+        logger.info(f"  Normalized guests: {OUTPUT_NORMALIZED}")
+        logger.info(f"  Company table: {OUTPUT_COMPANIES}")
+    if "rows" in OUTPUT_FORMATS:
+        logger.info(f"  Profile rows: {OUTPUT_ROWS}")
+    if BUILD_FEATURES:
+        logger.info(f"  Matching features: {OUTPUT_FEATURES}")
+    if BUILD_SUMMARY_HASHES:
+        logger.info(f"  Summary hashes: {OUTPUT_SUMMARY_HASHES}")
+    if BUILD_CHANGES:
+        logger.info(f"  Change set: {OUTPUT_CHANGES} (snapshot: {OUTPUT_SNAPSHOT.name})")
+    if BUILD_GEO:
+        logger.info(f"  Guest coordinates: {OUTPUT_GEO}")
     logger.info(f"  Statistics: {OUTPUT_REPORT}")
     logger.info("="*100)
 
@@ -532,8 +1569,127 @@ def print_statistics(stats: Dict):
 # MAIN
 # ============================================================================
 
-def main():
+def save_metrics_file(stats: Dict, mode: str):
+    """Write the stage metrics to --metrics-file, if given"""
+    if not METRICS_FILE:
+        return
+    METRICS.write_file(METRICS_FILE, mode=mode, total_guests=stats["total_guests"])
+    logger.info(f"✓ Saved stage metrics: {METRICS_FILE}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> "argparse.Namespace":
+    """Parse command line options"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Unify guest profiles with FullEnrich and WhiteContext data")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream guests and write profiles one at a time (bounded memory for large guest lists)"
+    )
+    mode.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Rebuild only profiles whose inputs changed since the last run (uses unification_manifest.json)"
+    )
+    parser.add_argument(
+        "--format",
+        nargs="+",
+        choices=["json", "columnar", "normalized", "rows", "both"],
+        default=["json"],
+        help="Output formats for unified profiles; both = json + columnar (default: json)"
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON outputs by 2 spaces (default: compact, one profile per line)"
+    )
+    parser.add_argument(
+        "--features",
+        action="store_true",
+        help="Also compute hashed TF-IDF matching features per guest (unified_guests_features.npy, needs numpy)"
+    )
+    parser.add_argument(
+        "--feature-dim",
+        type=int,
+        help="Hash buckets per feature vector (default: match_features.FEATURE_DIM)"
+    )
+    parser.add_argument(
+        "--summary-hashes",
+        action="store_true",
+        help="Also write each guest's summary prompt content hash (unified_guests_summary_hashes.json, see summary_cache.py)"
+    )
+    parser.add_argument(
+        "--changes",
+        action="store_true",
+        help="Also write added/updated/removed guests since the previous run (unified_guests_changes.json, see profile_delta.py)"
+    )
+    parser.add_argument(
+        "--geo",
+        action="store_true",
+        help="Also geocode guest locations with the offline gazetteer (unified_guests_geo.json, see geo_index.py)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=LOADER_WORKERS,
+        help="Processes used to parse FullEnrich/WhiteContext files in parallel (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--match",
+        choices=["exact", "fuzzy"],
+        default=MATCH_MODE,
+        help="Company matching: exact host/registrable-domain join only, or fuzzy entity resolution for misses (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--min-match-confidence",
+        type=float,
+        default=MIN_MATCH_CONFIDENCE,
+        help="Weakest fuzzy company match accepted, 0-1 (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        help="Also write the stage metrics here: a Prometheus textfile for *.prom, else one JSON line per run"
+    )
+    args = parser.parse_args(argv)
+
+    # "both" predates multiple --format values and stays an alias for json + columnar
+    formats = set(args.format)
+    if "both" in formats:
+        formats = (formats - {"both"}) | {"json", "columnar"}
+    args.format = formats
+
+    if args.incremental and "json" not in args.format:
+        parser.error("--incremental patches the JSON outputs; include json in --format")
+
+    return args
+
+
+def main(argv: Optional[List[str]] = None):
     """Main execution"""
+    global LOADER_WORKERS, OUTPUT_FORMATS, PRETTY_JSON, BUILD_FEATURES, FEATURES_DIM
+    global BUILD_SUMMARY_HASHES, BUILD_CHANGES, BUILD_GEO
+    global METRICS_FILE, MATCH_MODE, MIN_MATCH_CONFIDENCE
+
+    args = parse_args(argv)
+    LOADER_WORKERS = max(1, args.workers)
+    OUTPUT_FORMATS = args.format
+    PRETTY_JSON = args.pretty
+    BUILD_FEATURES = args.features
+    FEATURES_DIM = args.feature_dim
+    BUILD_SUMMARY_HASHES = args.summary_hashes
+    BUILD_CHANGES = args.changes
+    BUILD_GEO = args.geo
+    METRICS_FILE = args.metrics_file
+    MATCH_MODE = args.match
+    MIN_MATCH_CONFIDENCE = args.min_match_confidence
+    METRICS.reset()
+
+    configure_logging()
+    log_configuration()
+
     try:
         logger.info("\n")
         logger.info("╔════════════════════════════════════════════════════════════════════════════╗")
@@ -542,6 +1698,18 @@ def main():
         logger.info("╚════════════════════════════════════════════════════════════════════════════╝")
         logger.info("\n")
 
+        if args.stream or args.incremental:
+            # Streaming and incremental modes write their own outputs
+            stats = unify_all_data_streaming() if args.stream else unify_all_data_incremental()
+
+            if not stats:
+                logger.error("No profiles unified - aborting")
+                return
+
+            print_statistics(stats)
+            save_metrics_file(stats, "stream" if args.stream else "incremental")
+            return
+
         # Run unification
         unified_profiles, stats = unify_all_data()
 
@@ -554,6 +1722,7 @@ def main():
 
         # Print statistics
         print_statistics(stats)
+        save_metrics_file(stats, "full")
 
     except Exception as e:
         logger.error(f"Unification failed: {str(e)}", exc_info=True)
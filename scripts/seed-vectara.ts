@@ -59,7 +59,7 @@ interface GuestProfile {
   };
 }
 
-async function generateMatchSummary(profile: GuestProfile): Promise<string> {
+async function generateMatchSummary(profile: GuestProfile): Promise<{ text: string; generated: boolean }> {
   const name =
     profile.linkedin?.firstname && profile.linkedin?.lastname
       ? `${profile.linkedin.firstname} ${profile.linkedin.lastname}`
@@ -111,7 +111,7 @@ Keep it conversational and under 75 words. Be specific about their domain and in
       model: google("gemini-flash-lite-latest"), // Using gemini-flash-lite-latest as specified
       prompt,
     });
-    return text.trim();
+    return { text: text.trim(), generated: true };
   } catch (error) {
     console.error(`Error generating summary for ${name}:`, error);
     // Fallback: create basic summary from available data
@@ -120,13 +120,29 @@ Keep it conversational and under 75 words. Be specific about their domain and in
       headline,
       hasWhitecontext && contextTags ? `Expertise: ${contextTags.split(",").slice(0, 3).join(", ")}` : "",
     ].filter(Boolean).join(" - ");
-    return fallback.slice(0, 300);
+    return { text: fallback.slice(0, 300), generated: false };
   }
 }
 
-async function seedVectara() {
-  console.log("🌱 SEED: Starting Vectara data processing with FULL context...\n");
+/**
+ * Summary exchange file written by `python data/summary_cache.py --export`:
+ * username -> { hash, summary } where summary is null when it still has to be generated.
+ * New summaries are written back so `python data/summary_cache.py --import` can cache them.
+ */
+type SummaryExchange = Record<string, { hash: string; summary: string | null }>;
+
+const summaryExchangePath = path.join(process.cwd(), "public", "match_summaries.json");
+
+function loadSummaryExchange(): SummaryExchange | null {
+  if (!fs.existsSync(summaryExchangePath)) return null;
+  return JSON.parse(fs.readFileSync(summaryExchangePath, "utf-8"));
+}
 
+function saveSummaryExchange(exchange: SummaryExchange) {
+  fs.writeFileSync(summaryExchangePath, JSON.stringify(exchange, null, 2));
+}
+
+function loadProfiles(): GuestProfile[] {
   // Load BOTH data files
   const whitecontextPath = path.join(process.cwd(), "public", "unified_guests_whitecontext.json");
   const allGuestsPath = path.join(process.cwd(), "public", "unified_guests_all.json");
@@ -156,12 +172,103 @@ async function seedVectara() {
   const profiles = Array.from(profileMap.values());
   console.log(`\n📊 Total unique profiles to process: ${profiles.length}\n`);
 
+  return profiles;
+}
+
+/**
+ * Change set written by `python data/unify_data.py --changes` (see data/profile_delta.py):
+ * profiles added/updated and usernames removed since the snapshot `base`.
+ * With --changes only those are re-indexed; vectaraStatePath records the snapshot the corpus is at.
+ */
+interface ProfileChanges {
+  base: string | null;
+  snapshot: string;
+  added: GuestProfile[];
+  updated: GuestProfile[];
+  removed: string[];
+}
+
+const changesPath = path.join(process.cwd(), "public", "unified_guests_changes.json");
+const snapshotPath = path.join(process.cwd(), "public", "unified_guests_snapshot.json");
+const vectaraStatePath = path.join(process.cwd(), "public", "vectara_snapshot.json");
+
+function loadVectaraSnapshot(corpusKey: string): string | null {
+  if (!fs.existsSync(vectaraStatePath)) return null;
+  const state = JSON.parse(fs.readFileSync(vectaraStatePath, "utf-8"));
+  return state.corpusKey === corpusKey ? state.snapshot : null;
+}
+
+function saveVectaraSnapshot(corpusKey: string, snapshot: string) {
+  fs.writeFileSync(vectaraStatePath, JSON.stringify({ corpusKey, snapshot }, null, 2));
+}
+
+async function seedVectara() {
+  const applyChanges = process.argv.includes("--changes");
+  const corpusKey = process.env.VECTARA_CORPUS_KEY || "seed-hackathon-profiles";
+
+  if (applyChanges) {
+    console.log("🌱 SEED: Applying profile changes to Vectara...\n");
+  } else {
+    console.log("🌱 SEED: Starting Vectara data processing with FULL context...\n");
+  }
+
   // Initialize Vectara client
   const client = new VectaraClient({
     apiKey: process.env.VECTARA_API_KEY!,
   });
 
-  const corpusKey = process.env.VECTARA_CORPUS_KEY || "seed-hackathon-profiles";
+  let profiles: GuestProfile[];
+  let targetSnapshot: string | null = null;
+
+  if (applyChanges) {
+    const changes: ProfileChanges = JSON.parse(fs.readFileSync(changesPath, "utf-8"));
+    const current = loadVectaraSnapshot(corpusKey);
+    if (current === changes.snapshot) {
+      console.log("✅ Corpus is already at this snapshot, nothing to apply");
+      return;
+    }
+    if (!changes.base || current !== changes.base) {
+      // A run in between was never applied (or there is no previous snapshot)
+      throw new Error(
+        `Change set applies to snapshot ${changes.base ?? "(none)"} but the corpus is at ${current ?? "(unknown)"}. ` +
+          "Run pnpm reset:vectara && pnpm seed:vectara instead."
+      );
+    }
+
+    console.log(
+      `📊 Changes: ${changes.added.length} added, ${changes.updated.length} updated, ${changes.removed.length} removed\n`
+    );
+
+    // Updated documents are replaced, and deleting added ones too keeps a re-run of a failed apply safe
+    const staleIds = [...changes.removed, ...changes.updated.map((p) => p.username), ...changes.added.map((p) => p.username)];
+    for (const id of staleIds) {
+      try {
+        await client.documents.delete(corpusKey, id);
+      } catch (error: any) {
+        if (!(error.message?.includes("not found") || error.statusCode === 404)) {
+          throw error;
+        }
+      }
+    }
+    console.log(`🗑️  Deleted ${changes.removed.length} removed profiles\n`);
+
+    profiles = [...changes.updated, ...changes.added];
+    targetSnapshot = changes.snapshot;
+  } else {
+    profiles = loadProfiles();
+
+    // The uploaded outputs are this snapshot, so later runs can apply --changes
+    if (fs.existsSync(snapshotPath)) {
+      targetSnapshot = JSON.parse(fs.readFileSync(snapshotPath, "utf-8")).id;
+    }
+  }
+
+  // Cached summaries of unchanged profiles (see data/summary_cache.py)
+  const summaryExchange = loadSummaryExchange();
+  if (summaryExchange) {
+    const cached = Object.values(summaryExchange).filter((entry) => entry.summary).length;
+    console.log(`♻️  Summary cache: ${cached} of ${Object.keys(summaryExchange).length} summaries reused\n`);
+  }
 
   // Create corpus if it doesn't exist
   try {
@@ -202,8 +309,14 @@ async function seedVectara() {
 
         console.log(`  Processing: ${name}...`);
 
-        // Generate AI summary with FULL context
-        const aiSummary = await generateMatchSummary(profile);
+        // Generate AI summary with FULL context, unless the profile's summary is cached
+        const exchangeEntry = summaryExchange?.[profile.username];
+        const cachedSummary = exchangeEntry?.summary;
+        const generated = cachedSummary ? null : await generateMatchSummary(profile);
+        const aiSummary = cachedSummary || generated!.text;
+        if (exchangeEntry && generated?.generated) {
+          exchangeEntry.summary = aiSummary; // Fallback summaries are not cached
+        }
 
         // Prepare comprehensive document for Vectara
         const headline = profile.linkedin?.headline || profile.position?.title || "No headline";
@@ -254,19 +367,31 @@ async function seedVectara() {
         processed++;
         console.log(`    ✓ Uploaded (${processed}/${profiles.length})`);
 
-        // Rate limiting: 2 seconds per profile (30/min, well under 60 RPM limit for flash-8b)
-        await new Promise((resolve) => setTimeout(resolve, 2000));
+        // Rate limiting: 2 seconds per generated summary (30/min, well under 60 RPM limit for flash-8b)
+        if (!cachedSummary) {
+          await new Promise((resolve) => setTimeout(resolve, 2000));
+        }
       } catch (error) {
         errors++;
         console.error(`    ✗ Error processing ${profile.username}:`, error instanceof Error ? error.message : error);
       }
     }
+
+    // Keep generated summaries even if the run stops part way
+    if (summaryExchange) {
+      saveSummaryExchange(summaryExchange);
+    }
+  }
+
+  // Only a complete run moves the corpus to the new snapshot
+  if (targetSnapshot && errors === 0) {
+    saveVectaraSnapshot(corpusKey, targetSnapshot);
   }
 
   console.log(`\n✅ Vectara seeding complete!`);
   console.log(`   Processed: ${processed}/${profiles.length} profiles`);
   console.log(`   Errors: ${errors}`);
-  console.log(`   Success rate: ${((processed / profiles.length) * 100).toFixed(1)}%`);
+  console.log(`   Success rate: ${((processed / (profiles.length || 1)) * 100).toFixed(1)}%`);
 }
 
 // Run the seeding script